@@ -50,6 +50,7 @@ if Horizon:
     get_default_dashboard = Horizon.get_default_dashboard
     get_dashboards = Horizon.get_dashboards
     urls = Horizon._lazy_urls
+    warm_up = Horizon.warm_up
 
 # silence flake8 about unused imports here:
 __all__ = [
@@ -65,4 +66,5 @@ __all__ = [
     "get_default_dashboard",
     "get_dashboards",
     "urls",
+    "warm_up",
 ]
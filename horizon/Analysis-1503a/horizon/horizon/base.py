@@ -27,12 +27,14 @@ import copy
 import inspect
 import logging
 import os
+import time
 
 from django.conf import settings
 from django.conf.urls import include  # noqa
 from django.conf.urls import patterns  # noqa
 from django.conf.urls import url  # noqa
 from django.core.exceptions import ImproperlyConfigured  # noqa
+from django.core import urlresolvers
 from django.core.urlresolvers import reverse
 from django.utils.datastructures import SortedDict
 from django.utils.functional import SimpleLazyObject  # noqa
@@ -49,6 +51,16 @@ from horizon import loaders
 
 LOG = logging.getLogger(__name__)
 
+# How long the first import of each panel and URLconf module took.
+_import_times = {}
+
+
+def _timed_import(name, package=None):
+    start = time.time()
+    module = import_module(name, package)
+    _import_times.setdefault(module.__name__, time.time() - start)
+    return module
+
 
 def _decorate_urlconf(urlpatterns, decorator, *args, **kwargs):
     for pattern in urlpatterns:
@@ -77,14 +89,14 @@ class HorizonComponent(object):
         package_string = '.'.join(self.__module__.split('.')[:-1])
         if getattr(self, 'urls', None):
             try:
-                mod = import_module('.%s' % self.urls, package_string)
+                mod = _timed_import('.%s' % self.urls, package_string)
             except ImportError:
-                mod = import_module(self.urls)
+                mod = _timed_import(self.urls)
             urlpatterns = mod.urlpatterns
         else:
             # Try importing a urls.py from the dashboard package
             if module_has_submodule(import_module(package_string), 'urls'):
-                urls_mod = import_module('.urls', package_string)
+                urls_mod = _timed_import('.urls', package_string)
                 urlpatterns = urls_mod.urlpatterns
             else:
                 urlpatterns = patterns('')
@@ -514,7 +526,7 @@ class Dashboard(Registry, HorizonComponent):
         for panel in panels_to_discover:
             try:
                 before_import_registry = copy.copy(self._registry)
-                import_module('.%s.panel' % panel, package)
+                _timed_import('.%s.panel' % panel, package)
             except Exception:
                 self._registry = before_import_registry
                 if module_has_submodule(mod, panel):
@@ -591,6 +603,13 @@ class Site(Registry, HorizonComponent):
     slug = 'horizon'
     urls = 'horizon.site_urls'
 
+    def __init__(self):
+        super(Site, self).__init__()
+        # The navigation trees built by the nav template tags, keyed by
+        # everything they depend on. Emptied whenever a dashboard or panel
+        # is registered or unregistered.
+        self._nav_cache = {}
+
     def __repr__(self):
         return u"<Site: %s>" % self.slug
 
@@ -608,10 +627,12 @@ class Site(Registry, HorizonComponent):
 
     def register(self, dashboard):
         """Registers a :class:`~horizon.Dashboard` with Horizon."""
+        self._nav_cache.clear()
         return self._register(dashboard)
 
     def unregister(self, dashboard):
         """Unregisters a :class:`~horizon.Dashboard` from Horizon."""
+        self._nav_cache.clear()
         return self._unregister(dashboard)
 
     def registered(self, dashboard):
@@ -619,6 +640,7 @@ class Site(Registry, HorizonComponent):
 
     def register_panel(self, dashboard, panel):
         dash_instance = self.registered(dashboard)
+        self._nav_cache.clear()
         return dash_instance._register(panel)
 
     def unregister_panel(self, dashboard, panel):
@@ -626,6 +648,7 @@ class Site(Registry, HorizonComponent):
         if not dash_instance:
             raise NotRegistered("The dashboard %s is not registered."
                                 % dashboard)
+        self._nav_cache.clear()
         return dash_instance._unregister(panel)
 
     def get_dashboard(self, dashboard):
@@ -769,6 +792,64 @@ class Site(Registry, HorizonComponent):
         # Return the three arguments to django.conf.urls.include
         return urlpatterns, self.namespace, self.slug
 
+    def get_import_profile(self):
+        """Returns how long importing each registered panel took, as a
+        list of ``("<dashboard>/<panel>", seconds)`` tuples with the slowest
+        panel first.
+
+        The time of a panel is that of the first import of its ``panel``
+        module and of its URLconf, which usually pulls in its views, forms
+        and tables.
+        """
+        profile = []
+        for dashboard in self.get_dashboards():
+            for panel in dashboard.get_panels():
+                package = panel.__module__.rsplit('.', 1)[0]
+                seconds = sum(elapsed for name, elapsed
+                              in _import_times.items()
+                              if name.startswith(package + '.'))
+                profile.append(("%s/%s" % (dashboard.slug, panel.slug),
+                                seconds))
+        return sorted(profile, key=lambda item: item[1], reverse=True)
+
+    def warm_up(self, precompile_templates=False):
+        """Does the work of the first request at process start.
+
+        Loading the URLconf discovers and registers every dashboard and
+        panel and imports their URLconfs. The URL of every dashboard and
+        panel is then reversed, as the navigation does. If
+        ``precompile_templates`` is ``True``, the templates of every
+        dashboard and panel are compiled as well (see
+        :func:`horizon.loaders.precompile_templates`).
+
+        The time each panel took to import is logged, slowest first, so
+        slow panels and plugins can be found. Meant to be called from the
+        WSGI script once the application has been created::
+
+            application = get_wsgi_application()
+            horizon.warm_up(precompile_templates=True)
+
+        Returns the profile from :meth:`get_import_profile`.
+        """
+        start = time.time()
+        urlresolvers.get_resolver(None).reverse_dict
+        for dashboard in self.get_dashboards():
+            components = [dashboard] + list(dashboard.get_panels())
+            for component in components:
+                try:
+                    component.get_absolute_url()
+                except Exception as exc:
+                    LOG.warning("Could not reverse the URL of %s: %s",
+                                component, exc)
+        if precompile_templates:
+            loaders.precompile_templates()
+
+        profile = self.get_import_profile()
+        LOG.info("Horizon warmed up in %.2f seconds.", time.time() - start)
+        for panel, seconds in profile:
+            LOG.info("Imported panel %s in %.3f seconds.", panel, seconds)
+        return profile
+
     def _autodiscover(self):
         """Discovers modules to register from ``settings.INSTALLED_APPS``.
 
@@ -838,7 +919,7 @@ class Site(Registry, HorizonComponent):
                 panel_path = config['ADD_PANEL']
                 mod_path, panel_cls = panel_path.rsplit(".", 1)
                 try:
-                    mod = import_module(mod_path)
+                    mod = _timed_import(mod_path)
                 except ImportError:
                     LOG.warning("Could not load panel: %s", mod_path)
                     return
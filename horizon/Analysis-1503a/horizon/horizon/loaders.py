@@ -11,15 +11,28 @@
 # under the License.
 
 """
-Wrapper for loading templates from "templates" directories in panel modules.
+Wrapper for loading templates from "templates" directories in panel modules,
+and a cache keeping those and all other templates compiled.
 """
 
+import hashlib
+import logging
 import os
 
 from django.conf import settings
+from django.core import urlresolvers
 from django.template.base import TemplateDoesNotExist  # noqa
+from django.template.base import TemplateSyntaxError  # noqa
+from django.template import loader
 from django.template.loader import BaseLoader  # noqa
+from django.template.loader import make_origin  # noqa
+from django.template.loaders import cached
 from django.utils._os import safe_join  # noqa
+from django.utils.encoding import force_bytes  # noqa
+from django.utils.importlib import import_module  # noqa
+
+
+LOG = logging.getLogger(__name__)
 
 # Set up a cache of the panel directories to search.
 panel_template_dirs = {}
@@ -55,3 +68,136 @@ class TemplateLoader(BaseLoader):
 
 
 _loader = TemplateLoader()
+
+
+def _get_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+class CachedTemplateLoader(cached.Loader):
+    """Wraps other template loaders and keeps every template they find
+    compiled for the life of the process.
+
+    It is configured like Django's cached loader::
+
+        TEMPLATE_LOADERS = (
+            ('horizon.loaders.CachedTemplateLoader', (
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+                'horizon.loaders.TemplateLoader',
+            )),
+        )
+
+    The file each template was read from is remembered as well. When
+    ``DEBUG`` is on, a template whose file has changed since it was compiled
+    is loaded and compiled again, so templates can still be edited without
+    restarting the server. With ``DEBUG`` off the disk is never checked.
+    """
+    def __init__(self, loaders):
+        super(CachedTemplateLoader, self).__init__(loaders)
+        self.template_files = {}
+
+    def cache_key(self, template_name, template_dirs=None):
+        # The same keys as the template cache of Django's cached loader.
+        if not template_dirs:
+            return template_name
+        dirs_hash = hashlib.sha1(force_bytes('|'.join(template_dirs)))
+        return '-'.join([template_name, dirs_hash.hexdigest()])
+
+    def find_template(self, name, dirs=None):
+        # Load the source rather than the compiled template, so that the
+        # file it came from is known.
+        for source_loader in self.loaders:
+            try:
+                source, display_name = source_loader.load_template_source(
+                    name, dirs)
+            except TemplateDoesNotExist:
+                continue
+            self.template_files[self.cache_key(name, dirs)] = (
+                display_name, _get_mtime(display_name))
+            origin = make_origin(display_name,
+                                 source_loader.load_template_source,
+                                 name, dirs)
+            return source, origin
+        raise TemplateDoesNotExist(name)
+
+    def is_stale(self, key):
+        """Returns ``True`` if the file of a cached template has changed
+        since it was compiled.
+        """
+        path, mtime = self.template_files.get(key, (None, None))
+        return mtime is not None and _get_mtime(path) != mtime
+
+    def load_template(self, template_name, template_dirs=None):
+        if settings.DEBUG:
+            key = self.cache_key(template_name, template_dirs)
+            if key in self.template_cache and self.is_stale(key):
+                self.template_cache.pop(key, None)
+        return super(CachedTemplateLoader, self).load_template(template_name,
+                                                               template_dirs)
+
+    def reset(self):
+        super(CachedTemplateLoader, self).reset()
+        self.template_files.clear()
+
+
+def _list_templates(template_dir, prefix=""):
+    names = []
+    for root, dirs, files in os.walk(template_dir):
+        for filename in files:
+            if filename.startswith("."):
+                continue
+            path = os.path.relpath(os.path.join(root, filename), template_dir)
+            names.append(os.path.join(prefix, path))
+    return names
+
+
+def get_template_names():
+    """Returns the names of Horizon's own templates and of the templates
+    of every registered dashboard and panel.
+    """
+    # Imported here since horizon.base imports this module.
+    import horizon
+
+    names = set(_list_templates(os.path.join(horizon.__path__[0],
+                                             "templates")))
+    for dashboard in horizon.get_dashboards():
+        dashboard_mod = import_module(dashboard.__module__)
+        template_dir = os.path.join(os.path.dirname(dashboard_mod.__file__),
+                                    "templates")
+        names.update(_list_templates(template_dir))
+    for key, template_dir in panel_template_dirs.items():
+        # Panel templates are named "<dashboard>/<panel>/<path>".
+        dash_name, panel_name = key.split(os.path.sep)
+        names.update(_list_templates(os.path.join(template_dir, panel_name),
+                                     os.path.join(dash_name, panel_name)))
+    return sorted(names)
+
+
+def precompile_templates():
+    """Loads and compiles the templates returned by
+    :func:`get_template_names`.
+
+    With :class:`CachedTemplateLoader` in ``TEMPLATE_LOADERS`` this means
+    the first requests served by the process don't pay for reading and
+    parsing them. Templates which fail to compile are logged and skipped.
+
+    Returns a tuple of the list of compiled template names and a dict
+    mapping the names of the failed ones to their errors.
+    """
+    # Loading the URLconf registers every dashboard and panel.
+    urlresolvers.get_resolver(None).reverse_dict
+    compiled = []
+    failed = {}
+    for name in get_template_names():
+        try:
+            loader.get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as e:
+            LOG.warning("Could not compile template %s: %s" % (name, e))
+            failed[name] = e
+        else:
+            compiled.append(name)
+    return compiled, failed
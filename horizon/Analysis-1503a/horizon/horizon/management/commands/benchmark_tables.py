@@ -0,0 +1,107 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+from optparse import make_option  # noqa
+import time
+
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+from django.template.defaultfilters import title  # noqa
+from django.test.client import RequestFactory  # noqa
+
+from horizon import tables
+from horizon.utils import filters
+
+
+class BenchmarkDatum(object):
+    def __init__(self, index):
+        self.id = str(index)
+        self.name = u'<server %s>' % index
+        self.status = ('active', 'build', 'error')[index % 3]
+        self.size = index * 1.5
+        created = datetime.datetime(2014, 1, 1) + \
+            datetime.timedelta(minutes=index)
+        self.created = created.isoformat()
+        self.host = None if index % 2 else 'host-%s' % (index % 7)
+
+
+def get_link(datum):
+    return '/servers/%s/' % datum.id
+
+
+class BenchmarkTable(tables.DataTable):
+    name = tables.Column('name', link=get_link, link_classes=('ajax-modal',))
+    status = tables.Column('status', filters=(title,), status=True,
+                           status_choices=(('active', True),
+                                           ('build', None),
+                                           ('error', False)))
+    size = tables.Column('size', attrs={'data-type': 'size'})
+    host = tables.Column('host', empty_value='-', truncate=10)
+    created = tables.Column('created', filters=(filters.parse_isotime,))
+
+    class Meta:
+        name = "benchmark"
+        status_columns = ["status"]
+
+
+class FastBenchmarkTable(BenchmarkTable):
+    class Meta(BenchmarkTable.Meta):
+        fast_render = True
+
+
+class Command(BaseCommand):
+    help = ("Compares how long the rows of a table take to render with the "
+            "row and cell templates and with the fast_render option.")
+    option_list = BaseCommand.option_list + (
+        make_option('--rows', '-r',
+                    dest='rows',
+                    type='int',
+                    default=2000,
+                    help='Number of rows in the table (default: 2000).'),
+        make_option('--repeat',
+                    dest='repeat',
+                    type='int',
+                    default=3,
+                    help='Number of timed renders of each table; the best '
+                         'one is reported (default: 3).'),
+    )
+
+    def render(self, table_class, request, data):
+        start = time.time()
+        table = table_class(request, data)
+        output = u''.join(row.render() for row in table.get_rows())
+        return time.time() - start, output
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/')
+        data = [BenchmarkDatum(i) for i in range(options['rows'])]
+
+        timings = {}
+        outputs = {}
+        for table_class in (BenchmarkTable, FastBenchmarkTable):
+            for i in range(options['repeat']):
+                elapsed, output = self.render(table_class, request, data)
+                timings.setdefault(table_class, []).append(elapsed)
+            outputs[table_class] = output
+
+        if outputs[BenchmarkTable] != outputs[FastBenchmarkTable]:
+            raise CommandError("The fast_render output differs from the "
+                               "template output.")
+
+        templates = min(timings[BenchmarkTable])
+        fast = min(timings[FastBenchmarkTable])
+        self.stdout.write("Rendered %s rows (best of %s):" %
+                          (len(data), options['repeat']))
+        self.stdout.write("  templates:   %.3fs" % templates)
+        self.stdout.write("  fast_render: %.3fs (%.1fx)" %
+                          (fast, templates / max(fast, 1e-6)))
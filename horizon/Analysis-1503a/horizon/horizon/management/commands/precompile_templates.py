@@ -0,0 +1,36 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from django.core.management.base import CommandError  # noqa
+from django.core.management.base import NoArgsCommand  # noqa
+
+from horizon import loaders
+
+
+class Command(NoArgsCommand):
+    help = ("Compiles the templates of Horizon and of every registered "
+            "dashboard and panel, and reports the ones which fail to "
+            "compile. Run it at deploy time to catch template errors before "
+            "the first request does.")
+
+    def handle_noargs(self, **options):
+        compiled, failed = loaders.precompile_templates()
+        verbosity = int(options.get('verbosity', 1))
+        if verbosity > 1:
+            for name in compiled:
+                self.stdout.write("Compiled %s" % name)
+        for name, error in sorted(failed.items()):
+            self.stderr.write("Failed to compile %s: %s" % (name, error))
+        self.stdout.write("Compiled %s templates." % len(compiled))
+        if failed:
+            raise CommandError("%s templates failed to compile." %
+                               len(failed))
@@ -0,0 +1,79 @@
+/* Floating IP association targets are listed page by page: the form only
+ * renders the first page and marks the select with the URL to load the
+ * following ones from. A search box narrows the list down on the server.
+ */
+horizon.floating_ips = {
+  search_delay: 300,
+
+  load_targets: function ($select, params, replace) {
+    var url = $select.data('targets-url'),
+      $more = $select.siblings('.targets-more');
+
+    $.ajax({
+      url: url,
+      data: params,
+      dataType: 'json',
+      success: function (data) {
+        var selected = $select.val(),
+          known = {};
+
+        if (replace) {
+          // Keep the placeholder and the selected target.
+          $select.find('option').filter(function () {
+            return this.value && this.value !== selected;
+          }).remove();
+        }
+        $select.find('option').each(function () {
+          known[this.value] = true;
+        });
+        $.each(data.targets, function (i, target) {
+          if (!known[target.id]) {
+            $('<option>').val(target.id).text(target.name).appendTo($select);
+          }
+        });
+        if (data.targets.length) {
+          $select.data('targets-marker', data.targets[data.targets.length - 1].id);
+        }
+        $more.toggle(data.has_more);
+      },
+      error: function () {
+        horizon.clearErrorMessages();
+        horizon.alert('error', gettext('There was a problem communicating with the server, please try again.'));
+      }
+    });
+  },
+
+  init_target_select: function (el) {
+    $(el).find('select[data-targets-url]').each(function () {
+      var $select = $(this),
+        $search = $('<input type="text" class="targets-search">'),
+        $more = $('<a href="#" class="targets-more"></a>'),
+        timer = null;
+
+      $search.attr('placeholder', gettext('Search'));
+      $more.text(gettext('Load more'));
+      $select.before($search).after($more);
+
+      $search.on('keyup', function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () {
+          horizon.floating_ips.load_targets($select,
+                                            {search: $search.val()}, true);
+        }, horizon.floating_ips.search_delay);
+      });
+
+      $more.on('click', function (evt) {
+        horizon.floating_ips.load_targets($select, {
+          search: $search.val(),
+          marker: $select.data('targets-marker')
+        }, false);
+        evt.preventDefault();
+      });
+    });
+  }
+};
+
+horizon.addInitFunction(function () {
+  horizon.floating_ips.init_target_select($('body'));
+  horizon.modals.addModalInitFunction(horizon.floating_ips.init_target_select);
+});
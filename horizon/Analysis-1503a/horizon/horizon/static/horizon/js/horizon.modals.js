@@ -48,6 +48,95 @@ horizon.modals.success = function (data, textStatus, jqXHR) {
   return modal;
 };
 
+/* Loads a workflow step whose choices were deferred by the server. If given,
+ * ``done`` is called with whether the step could be loaded.
+ */
+horizon.modals.load_deferred_step = function ($pane, done) {
+  var request;
+
+  if (!$pane.attr('data-deferred-url')) {
+    if (done) {
+      done(true);
+    }
+    return;
+  }
+  request = $pane.data('deferred-request');
+  if (!request) {
+    $pane.html('<p class="deferred-step">' + gettext('Loading...') + '</p>');
+    request = $.ajax({
+      url: $pane.attr('data-deferred-url'),
+      dataType: 'html',
+      success: function (data) {
+        $pane.removeAttr('data-deferred-url').html(data);
+        horizon.forms.bind_add_item_handlers($pane);
+        horizon.forms.init_examples($pane);
+      },
+      error: function () {
+        $pane.html('<p class="deferred-step error">' +
+                   gettext('There was a problem loading this step.') +
+                   ' <a href="#" class="deferred-step-retry">' +
+                   gettext('Try again') + '</a></p>');
+      },
+      complete: function () {
+        $pane.removeData('deferred-request');
+      }
+    });
+    $pane.data('deferred-request', request);
+  }
+  if (done) {
+    request.then(function () { done(true); }, function () { done(false); });
+  }
+};
+
+/* Loads each workflow step whose choices were deferred by the server when
+ * its tab is shown. The steps never opened are loaded before the workflow
+ * is submitted, so that their fields and defaults are posted with it; the
+ * workflow is not submitted while any of them fails to load.
+ */
+horizon.modals.load_deferred_steps = function (modal) {
+  var $workflow = $(modal).find('.workflow');
+
+  if (!$workflow.find('fieldset[data-deferred-url]').length) {
+    return;
+  }
+  $workflow.find('.nav-tabs a[data-toggle="tab"]').on('show', function () {
+    horizon.modals.load_deferred_step($($(this).attr('data-target')));
+  });
+  $workflow.on('click', '.deferred-step-retry', function (evt) {
+    horizon.modals.load_deferred_step($(this).closest('fieldset'));
+    evt.preventDefault();
+  });
+  $workflow.find('form').on('submit', function (evt) {
+    var $form = $(this),
+      $submit = $form.find(':submit'),
+      $panes = $form.find('fieldset[data-deferred-url]'),
+      pending = $panes.length,
+      failed = false;
+
+    if (!pending) {
+      return;
+    }
+    // Keep the modal's own submit handler from posting the workflow yet.
+    evt.preventDefault();
+    evt.stopPropagation();
+    $submit.prop('disabled', true);
+    $panes.each(function () {
+      horizon.modals.load_deferred_step($(this), function (loaded) {
+        failed = failed || !loaded;
+        pending -= 1;
+        if (!pending) {
+          $submit.prop('disabled', false);
+          if (failed) {
+            horizon.alert('error', gettext('There was a problem communicating with the server, please try again.'));
+          } else {
+            $form.submit();
+          }
+        }
+      });
+    });
+  });
+};
+
 horizon.modals.modal_spinner = function (text) {
   // Adds a spinner with the desired text in a modal window.
   var template = horizon.templates.compiled_templates["#spinner-modal"];
@@ -155,6 +244,10 @@ horizon.addInitFunction(function() {
     $(modal).find(":text, select, textarea").filter(":visible:first").focus();
   });
 
+  // Workflows are also rendered as standalone pages.
+  horizon.modals.load_deferred_steps($('body'));
+  horizon.modals.addModalInitFunction(horizon.modals.load_deferred_steps);
+
   // If workflow id wizard mode, initialize wizard.
   horizon.modals.addModalInitFunction(function (modal) {
     var _max_visited_step = 0;
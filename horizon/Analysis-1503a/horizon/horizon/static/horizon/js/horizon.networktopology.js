@@ -2,6 +2,7 @@
 
 horizon.network_topology = {
   model: null,
+  model_etag: null,
   svg:'#topology_canvas',
   svg_container:'#topologyCanvasContainer',
   post_messages:'#topologyMessages',
@@ -120,15 +121,27 @@ horizon.network_topology = {
     if($('#networktopology').length === 0) {
       return;
     }
-    $.getJSON($('#networktopology').data('networktopology') + '?' + $.now(),
-      function(data) {
-        self.model = data;
-        self.data_convert();
+    var headers = {};
+    if (self.model_etag) {
+      headers['If-None-Match'] = self.model_etag;
+    }
+    $.ajax({
+      url: $('#networktopology').data('networktopology') + '?' + $.now(),
+      dataType: 'json',
+      headers: headers,
+      success: function(data, status, xhr) {
+        // An unchanged topology comes back as "304 Not Modified" with no
+        // body; keep the current drawing as it is.
+        if (xhr.status !== 304) {
+          self.model = data;
+          self.model_etag = xhr.getResponseHeader('ETag');
+          self.data_convert();
+        }
         setTimeout(function(){
           self.load_network_info();
         }, self.reload_duration);
       }
-    );
+    });
   },
   select_draw_mode:function() {
     var self = this;
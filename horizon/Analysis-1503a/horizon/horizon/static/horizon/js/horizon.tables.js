@@ -1,117 +1,165 @@
 /* Namespace for core functionality related to DataTables. */
 horizon.datatables = {
+  // Longest wait between two updates of a row.
+  max_poll_interval: 30 * 1000,
+
   update: function () {
-    var $rows_to_update = $('tr.status_unknown.ajax-update');
-    if ($rows_to_update.length) {
-      var interval = $rows_to_update.attr('data-update-interval'),
-        $table = $rows_to_update.closest('table'),
-        decay_constant = $table.attr('decay_constant');
-
-      // Do not update this row if the action column is expanded
-      if ($rows_to_update.find('.actions_column .btn-group.open').length) {
-        // Wait and try to update again in next interval instead
-        setTimeout(horizon.datatables.update, interval);
-        // Remove interval decay, since this will not hit server
-        $table.removeAttr('decay_constant');
+    var now = $.now(),
+      batches = {},
+      pending = 0,
+      next_due = null;
+
+    // Gather the rows which are due, one batch per table.
+    $('tr.status_unknown.ajax-update').each(function () {
+      var $row = $(this),
+        interval = parseInt($row.attr('data-update-interval'), 10),
+        due = $row.data('update-due') || now,
+        url;
+
+      // Do not update this row if the action column is expanded;
+      // try again in the next interval instead, without backing off.
+      if (due <= now && $row.find('.actions_column .btn-group.open').length) {
+        due = now + interval;
+        $row.data('update-due', due);
+      }
+      if (due > now) {
+        next_due = next_due === null ? due : Math.min(next_due, due);
         return;
       }
-      // Trigger the update handlers.
-      $rows_to_update.each(function(index, row) {
-        var $row = $(this),
-          $table = $row.closest('table.datatable');
-        horizon.ajax.queue({
-          url: $row.attr('data-update-url'),
-          error: function (jqXHR, textStatus, errorThrown) {
-            switch (jqXHR.status) {
-              // A 404 indicates the object is gone, and should be removed from the table
-              case 404:
-                // Update the footer count and reset to default empty row if needed
-                var $footer, row_count, footer_text, colspan, template, params, $empty_row;
-
-                // existing count minus one for the row we're removing
-                row_count = horizon.datatables.update_footer_count($table, -1);
-
-                if(row_count === 0) {
-                  colspan = $table.find('th[colspan]').attr('colspan');
-                  template = horizon.templates.compiled_templates["#empty_row_template"];
-                  params = {
-                      "colspan": colspan,
-                      no_items_label: gettext("No items to display.")
-                  };
-                  empty_row = template.render(params);
-                  $row.replaceWith(empty_row);
-                } else {
-                  $row.remove();
-                }
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                break;
-              default:
-                horizon.utils.log(gettext("An error occurred while updating."));
-                $row.removeClass("ajax-update");
-                $row.find("i.ajax-updating").remove();
-                break;
-            }
-          },
-          success: function (data, textStatus, jqXHR) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('status_unknown')) {
-              var spinner_elm = $new_row.find("td.status_unknown:last");
-
-              if ($new_row.find('.btn-action-required').length > 0) {
-                spinner_elm.prepend(
-                  $("<div />")
-                    .addClass("action_required_img")
-                    .append(
-                      $("<img />")
-                        .attr("src", "/static/dashboard/img/action_required.png")));
-              } else {
-                // Replacing spin.js here with an animated gif to reduce CPU
-                spinner_elm.prepend(
-                  $("<div />")
-                    .addClass("loading_gif")
-                    .append(
-                      $("<img />")
-                        .attr("src", "/static/dashboard/img/loading.gif")));
-              }
-            }
+      url = $row.attr('data-batch-update-url');
+      if (!batches[url]) {
+        batches[url] = [];
+        pending++;
+      }
+      batches[url].push($row);
+    });
 
-            // Only replace row if the html content has changed
-            if($new_row.html() !== $row.html()) {
-              if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
-                // Preserve the checkbox if it's already clicked
-                $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
-              }
-              $row.replaceWith($new_row);
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-            }
-          },
-          complete: function (jqXHR, textStatus) {
-            // Revalidate the button check for the updated table
-            horizon.datatables.validate_button();
-
-            // Set interval decay to this table, and increase if it already exist
-            if(decay_constant === undefined) {
-              decay_constant = 1;
+    clearTimeout(horizon.datatables._update_timer);
+    if (!pending) {
+      // Poll until there are no rows in an "unknown" state on the page.
+      if (next_due !== null) {
+        horizon.datatables._update_timer = setTimeout(
+          horizon.datatables.update, next_due - now);
+      }
+      return;
+    }
+
+    $.each(batches, function (url, rows) {
+      horizon.ajax.queue({
+        url: url,
+        data: {obj_id: $.map(rows, function ($row) {
+          return $row.attr('data-object-id');
+        })},
+        traditional: true,
+        dataType: 'json',
+        error: function (jqXHR, textStatus, errorThrown) {
+          horizon.utils.log(gettext("An error occurred while updating."));
+          $.each(rows, function (i, $row) {
+            horizon.datatables.stop_row_update($row);
+          });
+        },
+        success: function (data, textStatus, jqXHR) {
+          $.each(rows, function (i, $row) {
+            var obj_id = $row.attr('data-object-id');
+            if (!data.rows.hasOwnProperty(obj_id)) {
+              horizon.utils.log(gettext("An error occurred while updating."));
+              horizon.datatables.stop_row_update($row);
+            } else if (data.rows[obj_id] === null) {
+              // The object is gone, and should be removed from the table.
+              horizon.datatables.remove_row($row);
             } else {
-              decay_constant++;
+              horizon.datatables.replace_row($row, data.rows[obj_id]);
             }
-            $table.attr('decay_constant', decay_constant);
-            // Poll until there are no rows in an "unknown" state on the page.
-            next_poll = interval * decay_constant;
-            // Limit the interval to 30 secs
-            if(next_poll > 30 * 1000) { next_poll = 30 * 1000; }
-            setTimeout(horizon.datatables.update, next_poll);
+          });
+        },
+        complete: function (jqXHR, textStatus) {
+          // Revalidate the button check for the updated table
+          horizon.datatables.validate_button();
+          pending--;
+          if (!pending) {
+            horizon.datatables.update();
           }
-        });
+        }
       });
+    });
+  },
+
+  replace_row: function ($row, html) {
+    var $new_row = $(html),
+      $table = $row.closest('table.datatable'),
+      interval = parseInt($row.attr('data-update-interval'), 10),
+      decay;
+
+    if ($new_row.hasClass('status_unknown')) {
+      var spinner_elm = $new_row.find("td.status_unknown:last");
+
+      if ($new_row.find('.btn-action-required').length > 0) {
+        spinner_elm.prepend(
+          $("<div />")
+            .addClass("action_required_img")
+            .append(
+              $("<img />")
+                .attr("src", "/static/dashboard/img/action_required.png")));
+      } else {
+        // Replacing spin.js here with an animated gif to reduce CPU
+        spinner_elm.prepend(
+          $("<div />")
+            .addClass("loading_gif")
+            .append(
+              $("<img />")
+                .attr("src", "/static/dashboard/img/loading.gif")));
+      }
+    }
+
+    // Only replace row if the html content has changed
+    if($new_row.html() !== $row.html()) {
+      if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
+        // Preserve the checkbox if it's already clicked
+        $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
+      }
+      $row.replaceWith($new_row);
+      // Reset tablesorter's data cache.
+      $table.trigger("update");
+      // A row which changed is polled again after the normal interval.
+      $new_row.data('update-due', $.now() + interval);
+    } else {
+      // Back off a row which did not change, up to the maximum interval.
+      decay = ($row.data('update-decay') || 0) + 1;
+      $row.data('update-decay', decay);
+      $row.data('update-due', $.now() + Math.min(
+        interval * decay, horizon.datatables.max_poll_interval));
     }
   },
 
+  remove_row: function ($row) {
+    // Update the footer count and reset to default empty row if needed
+    var $table = $row.closest('table.datatable'),
+      row_count, colspan, template, params, empty_row;
+
+    // existing count minus one for the row we're removing
+    row_count = horizon.datatables.update_footer_count($table, -1);
+
+    if(row_count === 0) {
+      colspan = $table.find('th[colspan]').attr('colspan');
+      template = horizon.templates.compiled_templates["#empty_row_template"];
+      params = {
+          "colspan": colspan,
+          no_items_label: gettext("No items to display.")
+      };
+      empty_row = template.render(params);
+      $row.replaceWith(empty_row);
+    } else {
+      $row.remove();
+    }
+    // Reset tablesorter's data cache.
+    $table.trigger("update");
+  },
+
+  stop_row_update: function ($row) {
+    $row.removeClass("ajax-update");
+    $row.find("i.ajax-updating").remove();
+  },
+
   validate_button: function () {
     // Disable form button if checkbox are not checked
     $("form").each(function (i) {
@@ -26,10 +26,13 @@ from django.core import urlresolvers
 from django import forms
 from django.http import HttpResponse  # noqa
 from django import template
+from django.template.base import render_value_in_context  # noqa
 from django.template.defaultfilters import truncatechars  # noqa
 from django.template.loader import render_to_string
 from django.utils.datastructures import SortedDict
+from django.utils.html import conditional_escape  # noqa
 from django.utils.html import escape
+from django.utils.html import strip_spaces_between_tags  # noqa
 from django.utils import http
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
@@ -39,8 +42,10 @@ from django.utils.translation import ugettext_lazy as _
 from horizon import conf
 from horizon import exceptions
 from horizon import messages
+from horizon.tables.actions import BaseAction  # noqa
 from horizon.tables.actions import FilterAction  # noqa
 from horizon.tables.actions import LinkAction  # noqa
+from horizon.utils import functions
 from horizon.utils import html
 
 
@@ -49,6 +54,12 @@ PALETTE = termcolors.PALETTES[termcolors.DEFAULT_PALETTE]
 STRING_SEPARATOR = "__"
 
 
+def _unicode_id(obj_id):
+    if not isinstance(obj_id, unicode):
+        obj_id = unicode(str(obj_id), 'utf-8')
+    return obj_id
+
+
 class Column(html.HTMLElement):
     """A class which represents a single column in a :class:`.DataTable`.
 
@@ -72,6 +83,14 @@ class Column(html.HTMLElement):
         Boolean to determine whether this column should be sortable or not.
         Defaults to ``True``.
 
+    .. attribute:: sort_key
+
+        The name of the field the data is sorted on when the table is
+        sorted on the server (see the ``server_sort`` option of
+        :class:`.DataTableOptions`), e.g. ``"display_name"``. Sortable
+        columns without a ``sort_key`` are only sorted in the browser.
+        Default: ``None``.
+
     .. attribute:: hidden
 
         Boolean to determine whether or not this column should be displayed
@@ -235,7 +254,7 @@ class Column(html.HTMLElement):
                  empty_value=None, filters=None, classes=None, summation=None,
                  auto=None, truncate=None, link_classes=None, wrap_list=False,
                  form_field=None, form_field_attributes=None,
-                 update_action=None):
+                 update_action=None, sort_key=None):
 
         self.classes = list(classes or getattr(self, "classes", []))
         super(Column, self).__init__()
@@ -259,6 +278,7 @@ class Column(html.HTMLElement):
 
         self.auto = auto
         self.sortable = sortable
+        self.sort_key = sort_key
         self.link = link
         self.allowed_data_types = allowed_data_types
         self.hidden = hidden
@@ -389,6 +409,12 @@ class Column(html.HTMLElement):
         except urlresolvers.NoReverseMatch:
             return self.link
 
+    def get_sort_string(self):
+        """Returns the query parameter string to sort the table by this
+        column on the server, or ``None`` if it is not sorted there.
+        """
+        return self.table.get_sort_string(self)
+
     def get_summation(self):
         """Returns the summary value for the data in this column if a
         valid summation method is specified for it. Otherwise returns ``None``.
@@ -463,6 +489,13 @@ class Row(html.HTMLElement):
         updates. Generally you won't need to change this value.
         Default: ``"row_update"``.
 
+    .. attribute:: ajax_batch_action_name
+
+        String that is used for the query parameter key to request AJAX
+        updates of several rows at once (see
+        :meth:`~horizon.tables.Row.get_data_batch`). Generally you won't
+        need to change this value. Default: ``"rows_update"``.
+
     .. attribute:: ajax_cell_action_name
 
         String that is used for the query parameter key to request AJAX
@@ -472,6 +505,7 @@ class Row(html.HTMLElement):
     """
     ajax = False
     ajax_action_name = "row_update"
+    ajax_batch_action_name = "rows_update"
     ajax_cell_action_name = "cell_update"
 
     def __init__(self, table, datum=None):
@@ -514,6 +548,8 @@ class Row(html.HTMLElement):
             interval = conf.HORIZON_CONFIG['ajax_poll_interval']
             self.attrs['data-update-interval'] = interval
             self.attrs['data-update-url'] = self.get_ajax_update_url()
+            self.attrs['data-batch-update-url'] = \
+                self.get_ajax_batch_update_url()
             self.classes.append("ajax-update")
 
         self.attrs['data-object-id'] = table.get_object_id(datum)
@@ -554,6 +590,8 @@ class Row(html.HTMLElement):
             return ''
 
     def render(self):
+        if self.table._meta.fast_render:
+            return self.table.row_renderer.render(self)
         return render_to_string("horizon/common/_data_table_row.html",
                                 {"row": self})
 
@@ -568,6 +606,12 @@ class Row(html.HTMLElement):
                             "obj_id": self.table.get_object_id(self.datum)})
         return "%s?%s" % (table_url, params)
 
+    def get_ajax_batch_update_url(self):
+        table_url = self.table.get_absolute_url()
+        params = urlencode({"table": self.table.name,
+                            "action": self.ajax_batch_action_name})
+        return "%s?%s" % (table_url, params)
+
     def can_be_selected(self, datum):
         """By default if multiselect enabled return True. You can remove the
         checkbox after an ajax update here if required.
@@ -581,6 +625,27 @@ class Row(html.HTMLElement):
         raise NotImplementedError("You must define a get_data method on %s"
                                   % self.__class__.__name__)
 
+    def get_data_batch(self, request, obj_ids):
+        """Fetches the updated data for several rows at once.
+
+        Returns a dict mapping each of the given object ids to its data,
+        or to ``None`` if the object no longer exists. Ids left out of the
+        dict could not be updated.
+
+        By default this calls :meth:`~horizon.tables.Row.get_data` for
+        each id in turn. Override it to look all of them up with a single
+        list call when the API allows it.
+        """
+        data = {}
+        for obj_id in obj_ids:
+            try:
+                data[obj_id] = self.get_data(request, obj_id)
+            except Exception:
+                error = exceptions.handle(request, ignore=True)
+                if error.status_code == 404:
+                    data[obj_id] = None
+        return data
+
 
 class Cell(html.HTMLElement):
     """Represents a single cell in the table."""
@@ -683,12 +748,12 @@ class Cell(html.HTMLElement):
 
     @property
     def url(self):
-        if self.column.link:
-            url = self.column.get_link_url(self.datum)
-            if url:
-                return url
-        else:
-            return None
+        # Both the value and the classes of the cell depend on the link.
+        if not hasattr(self, '_url'):
+            self._url = None
+            if self.column.link:
+                self._url = self.column.get_link_url(self.datum) or None
+        return self._url
 
     @property
     def status(self):
@@ -756,6 +821,78 @@ class Cell(html.HTMLElement):
                                 {"cell": self})
 
 
+class RowRenderer(object):
+    """Renders the rows of a table without going through the row and cell
+    templates, for tables with the ``fast_render`` option set.
+
+    The markup of ``_data_table_row.html`` and ``_data_table_cell.html`` is
+    compiled into a string builder for each column of the table, and the
+    link, escaping and localization of each cell are done exactly once.
+    The output is the same as the templates'. Cells with inline editing,
+    and cell classes which override ``value`` or ``render``, are still
+    rendered by the cell template.
+    """
+    row_format = u'<tr%s>\n    %s\n</tr>\n'
+    cell_format = u'<td%s>%s</td>'
+    link_format = u'<a href="%s" class="%s">%s</a>'
+
+    def __init__(self, table):
+        self.table = table
+        self.context = template.Context()
+        cell_class = table._meta.cell_class
+        self.compiles_cells = (
+            cell_class.value is Cell.value and
+            cell_class.render.im_func is Cell.render.im_func)
+        self.builders = dict((name, self.compile_column(column))
+                             for name, column in table.columns.items())
+
+    def compile_column(self, column):
+        """Returns a function rendering a cell of the given column, or
+        ``None`` if its cells have to be rendered by the template.
+        """
+        if not self.compiles_cells or column.update_action is not None:
+            return None
+        cell_format = self.cell_format
+        link_format = self.link_format
+        link_classes = escape(' '.join(column.link_classes))
+        empty_value = column.empty_value
+        context = self.context
+        flatatt = self.flatatt
+
+        def build(cell):
+            data = column.get_data(cell.datum)
+            if data is None:
+                if callable(empty_value):
+                    data = empty_value(cell.datum)
+                else:
+                    data = empty_value
+            url = cell.url
+            if url:
+                value = link_format % (escape(url), link_classes,
+                                       escape(unicode(data)))
+            else:
+                value = render_value_in_context(data, context)
+            return cell_format % (flatatt(cell), value)
+        return build
+
+    def flatatt(self, element):
+        """Same as ``element.attr_string``, without the lazy string
+        handling of ``format_html`` for every attribute.
+        """
+        attrs = sorted(element.get_final_attrs().items())
+        return u''.join([u' %s="%s"' % (key, conditional_escape(value))
+                         for key, value in attrs])
+
+    def render(self, row):
+        cells = []
+        for cell in row:
+            build = self.builders.get(cell.column.name, None)
+            cells.append(build(cell) if build else cell.render())
+        # Matches the {% spaceless %} block of the row template.
+        cells = strip_spaces_between_tags(u''.join(cells).strip())
+        return mark_safe(self.row_format % (self.flatatt(row), cells))
+
+
 class DataTableOptions(object):
     """Contains options for :class:`.DataTable` objects.
 
@@ -818,6 +955,43 @@ class DataTableOptions(object):
         view this will need to be changed to differentiate between the
         tables. Default: ``"marker"``.
 
+    .. attribute:: prev_pagination_param
+
+        The name of the query string parameter which will be used when
+        paginating this table backwards. Default: ``"prev_marker"``.
+
+    .. attribute:: page_size
+
+        The number of rows shown on each page of the table. Defaults to the
+        page size chosen by the user (see ``API_RESULT_PAGE_SIZE``).
+
+    .. attribute:: server_sort
+
+        Boolean to control whether the columns which have a ``sort_key`` are
+        sorted on the server rather than in the browser. Their headers link
+        back to the view with the sort in the query string, and the view is
+        expected to pass :meth:`~horizon.tables.DataTable.get_sort_params`
+        on to the API it lists the data from, or to call
+        :meth:`~horizon.tables.DataTable.sort_and_page` if that API cannot
+        sort. Default: ``False``.
+
+    .. attribute:: default_sort
+
+        A ``(column_name, direction)`` tuple giving the sort used by a
+        ``server_sort`` table when the query string has none, e.g.
+        ``("name", "asc")``. Default: ``None`` (the API's own order).
+
+    .. attribute:: sort_param
+
+        The name of the query string parameter holding the name of the
+        column a ``server_sort`` table is sorted by. Default: ``"sort_key"``.
+
+    .. attribute:: sort_dir_param
+
+        The name of the query string parameter holding the sort direction
+        (``"asc"`` or ``"desc"``) of a ``server_sort`` table.
+        Default: ``"sort_dir"``.
+
     .. attribute:: status_columns
 
         A list or tuple of column names which represents the "state"
@@ -871,6 +1045,14 @@ class DataTableOptions(object):
 
         A list of permission names which this table requires in order to be
         displayed. Defaults to an empty list (``[]``).
+
+    .. attribute:: fast_render
+
+        Boolean to control whether the rows are rendered by a
+        :class:`~horizon.tables.base.RowRenderer` instead of the row and
+        cell templates. The markup is the same, but large tables render
+        several times faster. Leave it off if the templates are
+        overridden. Default: ``False``.
     """
     def __init__(self, options):
         self.name = getattr(options, 'name', self.__class__.__name__)
@@ -885,12 +1067,21 @@ class DataTableOptions(object):
         self.row_class = getattr(options, 'row_class', Row)
         self.column_class = getattr(options, 'column_class', Column)
         self.pagination_param = getattr(options, 'pagination_param', 'marker')
+        self.prev_pagination_param = getattr(options,
+                                             'prev_pagination_param',
+                                             'prev_marker')
+        self.page_size = getattr(options, 'page_size', None)
+        self.server_sort = getattr(options, 'server_sort', False)
+        self.default_sort = getattr(options, 'default_sort', None)
+        self.sort_param = getattr(options, 'sort_param', 'sort_key')
+        self.sort_dir_param = getattr(options, 'sort_dir_param', 'sort_dir')
         self.browser_table = getattr(options, 'browser_table', None)
         self.footer = getattr(options, 'footer', True)
         self.no_data_message = getattr(options,
                                        "no_data_message",
                                        _("No items to display."))
         self.permissions = getattr(options, 'permissions', [])
+        self.fast_render = getattr(options, 'fast_render', False)
 
         # Set self.filter if we have any FilterActions
         filter_actions = [action for action in self.table_actions if
@@ -923,6 +1114,7 @@ class DataTableOptions(object):
 
         # Set runtime table defaults; not configurable.
         self.has_more_data = False
+        self.has_prev_data = False
 
         # Set mixed data type table attr
         self.mixed_data_type = getattr(options, 'mixed_data_type', False)
@@ -1018,6 +1210,89 @@ class DataTableMetaclass(type):
         return type.__new__(mcs, name, bases, attrs)
 
 
+class RowActionBinder(object):
+    """Binds one of a table's row actions to each of the table's rows.
+
+    Row actions are defined once per table class, so rendering a row used to
+    mean copying every action, checking whether it is allowed and reversing
+    its URL. A binder lives as long as the table instance and avoids most of
+    that work:
+
+    * Each row gets a lightweight view of the action: an instance of a
+      subclass created once per table whose class attributes are the
+      action's own attributes, so only ``datum`` (and, for actions with an
+      :meth:`~horizon.tables.Action.update` hook, ``attrs``) is set per row.
+    * Actions which rely on the default
+      :meth:`~horizon.tables.Action.allowed` and
+      :meth:`~horizon.tables.Action.get_policy_target` can't depend on the
+      row, so whether they are allowed is only checked once.
+    * For link actions whose ``url`` is a URL name, the URL is reversed once
+      and the object id substituted into it for each row.
+    """
+    _UNKNOWN = object()
+    # Stands for the object id when reversing a link action's URL; it is
+    # rejected by patterns which only accept numbers or UUIDs, whose URLs
+    # are then reversed per row.
+    ROW_ID_PLACEHOLDER = "horizon_row_id_placeholder"
+
+    def __init__(self, table, action):
+        self.table = table
+        self.action = action
+        cls = action.__class__
+        self.view_class = type(cls.__name__, (cls,), dict(action.__dict__))
+        self.copies_attrs = not self._is_default(action, 'update')
+        self.row_independent = (
+            not table._meta.mixed_data_type and
+            all(self._is_default(action, name) for name in
+                ('allowed', 'get_policy_target', '_allowed')))
+        self._allowed = self._UNKNOWN
+        self._url_template = self._UNKNOWN
+
+    @staticmethod
+    def _is_default(action, name):
+        if name in action.__dict__:
+            return False
+        method = getattr(action.__class__, name)
+        return method.im_func is getattr(BaseAction, name).im_func
+
+    def bind(self, datum):
+        view = self.view_class.__new__(self.view_class)
+        view.datum = datum
+        if self.copies_attrs:
+            # Copy to allow modifying attributes per row
+            view.attrs = copy.copy(view.attrs)
+        return view
+
+    def allowed(self, view, datum):
+        table = self.table
+        if not self.row_independent:
+            return table._filter_action(view, table.request, datum)
+        if self._allowed is self._UNKNOWN:
+            self._allowed = table._filter_action(view, table.request, datum)
+        return self._allowed
+
+    def _get_url_template(self, view):
+        url = view.url
+        default_get_link_url = LinkAction.get_link_url.im_func
+        if (not isinstance(url, basestring) or
+                view.get_link_url.im_func is not default_get_link_url):
+            return None
+        try:
+            return urlresolvers.reverse(url, args=(self.ROW_ID_PLACEHOLDER,))
+        except urlresolvers.NoReverseMatch:
+            return None
+
+    def link_url(self, view, datum):
+        if self._url_template is self._UNKNOWN:
+            self._url_template = self._get_url_template(view)
+        if self._url_template and datum:
+            obj_id = _unicode_id(self.table.get_object_id(datum))
+            if "/" not in obj_id:
+                return self._url_template.replace(self.ROW_ID_PLACEHOLDER,
+                                                  http.urlquote(obj_id))
+        return view.get_link_url(datum)
+
+
 class DataTable(object):
     """A class which defines a table with all data and associated actions.
 
@@ -1061,6 +1336,8 @@ class DataTable(object):
             column.table = self
             columns.append((key, column))
         self.columns = SortedDict(columns)
+        if self._meta.server_sort:
+            self._set_sort_classes()
         self._populate_data_cache()
 
         # Associate these actions with this table
@@ -1076,6 +1353,16 @@ class DataTable(object):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._meta.name)
 
+    def _get_data(self):
+        return self._data
+
+    def _set_data(self, data):
+        self._data = data
+        # Reassigning the data invalidates the id lookup index.
+        self._object_index = None
+
+    data = property(_get_data, _set_data)
+
     @property
     def name(self):
         return self._meta.name
@@ -1088,6 +1375,26 @@ class DataTable(object):
     def multi_select(self):
         return self._meta.multi_select
 
+    @property
+    def row_renderer(self):
+        if getattr(self, '_row_renderer', None) is None:
+            self._row_renderer = RowRenderer(self)
+        return self._row_renderer
+
+    def _set_sort_classes(self):
+        # Columns sorted on the server are left alone by the tablesorter
+        # plugin; the one the table is sorted by shows the direction.
+        sort_column, sort_dir = self.get_sort()
+        for column in self.columns.values():
+            if not (column.sortable and column.sort_key):
+                continue
+            classes = [cls for cls in column.classes if cls != "sortable"]
+            if column is sort_column:
+                classes.append("headerSortDown" if sort_dir == "asc"
+                               else "headerSortUp")
+            # The class list is shared with the declared column.
+            column.classes = classes
+
     @property
     def filtered_data(self):
         # This function should be using django.utils.functional.cached_property
@@ -1177,6 +1484,32 @@ class DataTable(object):
         """Returns the message to be displayed when there is no data."""
         return self._no_data_message
 
+    def _get_object_index(self):
+        """Returns a dict mapping the unicode id of every datum to the datum.
+
+        Ids shared by several data objects map to the list of all of them.
+        The index is built on first use and rebuilt whenever ``data`` is
+        reassigned or its length changes.
+        """
+        data = self.data or []
+        index = self._object_index
+        if index is None or self._object_index_size != len(data):
+            index = {}
+            duplicates = set()
+            for datum in data:
+                obj_id = _unicode_id(self.get_object_id(datum))
+                if obj_id in index:
+                    if obj_id not in duplicates:
+                        index[obj_id] = [index[obj_id]]
+                        duplicates.add(obj_id)
+                    index[obj_id].append(datum)
+                else:
+                    index[obj_id] = datum
+            self._object_index = index
+            self._object_index_duplicates = duplicates
+            self._object_index_size = len(data)
+        return index
+
     def get_object_by_id(self, lookup):
         """Returns the data object from the table's dataset which matches
         the ``lookup`` parameter specified. An error will be raised if
@@ -1185,25 +1518,19 @@ class DataTable(object):
         We will convert the object id and ``lookup`` to unicode before
         comparison.
 
-        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally.
+        Uses :meth:`~horizon.tables.DataTable.get_object_id` internally
+        to build an index of the data the first time it is called.
         """
-        if not isinstance(lookup, unicode):
-            lookup = unicode(str(lookup), 'utf-8')
-        matches = []
-        for datum in self.data:
-            obj_id = self.get_object_id(datum)
-            if not isinstance(obj_id, unicode):
-                obj_id = unicode(str(obj_id), 'utf-8')
-            if obj_id == lookup:
-                matches.append(datum)
-        if len(matches) > 1:
+        lookup = _unicode_id(lookup)
+        index = self._get_object_index()
+        if lookup in self._object_index_duplicates:
             raise ValueError("Multiple matches were returned for that id: %s."
-                           % matches)
-        if not matches:
+                           % index[lookup])
+        if lookup not in index:
             raise exceptions.Http302(self.get_absolute_url(),
                                      _('No match returned for the id "%s".')
                                        % lookup)
-        return matches[0]
+        return index[lookup]
 
     @property
     def has_actions(self):
@@ -1236,23 +1563,25 @@ class DataTable(object):
         """Returns a list of the action instances for a specific row."""
         bound_actions = []
         for action in self._meta.row_actions:
-            # Copy to allow modifying properties per row
-            bound_action = copy.copy(self.base_actions[action.name])
-            bound_action.attrs = copy.copy(bound_action.attrs)
-            bound_action.datum = datum
+            binder = self._get_row_action_binder(action.name)
+            bound_action = binder.bind(datum)
             # Remove disallowed actions.
-            if not self._filter_action(bound_action,
-                                       self.request,
-                                       datum):
+            if not binder.allowed(bound_action, datum):
                 continue
             # Hook for modifying actions based on data. No-op by default.
             bound_action.update(self.request, datum)
             # Pre-create the URL for this link with appropriate parameters
             if issubclass(bound_action.__class__, LinkAction):
-                bound_action.bound_url = bound_action.get_link_url(datum)
+                bound_action.bound_url = binder.link_url(bound_action, datum)
             bound_actions.append(bound_action)
         return bound_actions
 
+    def _get_row_action_binder(self, name):
+        binders = self.__dict__.setdefault('_row_action_binders', {})
+        if name not in binders:
+            binders[name] = RowActionBinder(self, self.base_actions[name])
+        return binders[name]
+
     def render_table_actions(self):
         """Renders the actions specified in ``Meta.table_actions``."""
         template_path = self._meta.table_actions_template
@@ -1366,6 +1695,10 @@ class DataTable(object):
                         return HttpResponse(new_row.render())
                     else:
                         return HttpResponse(status=error.status_code)
+            elif new_row.ajax and \
+                    new_row.ajax_batch_action_name == action_name:
+                if request.is_ajax():
+                    return self.batch_row_update(request)
             elif new_row.ajax_cell_action_name == action_name:
                 # inline edit of the cell actions
                 return self.inline_edit_handle(request, table_name,
@@ -1382,6 +1715,34 @@ class DataTable(object):
                             return handled
         return None
 
+    def batch_row_update(self, request):
+        """Handles a batched AJAX row update.
+
+        Every ``obj_id`` in the query string is looked up through
+        :meth:`~horizon.tables.Row.get_data_batch` and the response is a
+        JSON object mapping each id to its rendered row, or to ``null``
+        for objects which no longer exist.
+        """
+        raw_ids = request.GET.getlist("obj_id")
+        obj_ids = [self.sanitize_id(obj_id) for obj_id in raw_ids]
+        try:
+            data = self._meta.row_class(self).get_data_batch(request,
+                                                             obj_ids)
+        except Exception:
+            error = exceptions.handle(request, ignore=True)
+            return HttpResponse(status=error.status_code)
+        rows = {}
+        for raw_id, obj_id in zip(raw_ids, obj_ids):
+            if obj_id not in data:
+                continue
+            datum = data[obj_id]
+            if datum is None:
+                rows[raw_id] = None
+            else:
+                rows[raw_id] = self._meta.row_class(self, datum).render()
+        return HttpResponse(json.dumps({'rows': rows}),
+                            content_type="application/json")
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -1526,7 +1887,130 @@ class DataTable(object):
 
     def get_pagination_string(self):
         """Returns the query parameter string to paginate this table."""
-        return "=".join([self._meta.pagination_param, self.get_marker()])
+        query = "=".join([self._meta.pagination_param, self.get_marker()])
+        return self._append_sort_string(query)
+
+    def has_prev_data(self):
+        """Returns a boolean value indicating whether there is data before
+        the current data set, i.e. whether the table was paginated forwards.
+        """
+        return self._meta.has_prev_data
+
+    def get_prev_marker(self):
+        """Returns the identifier for the first object in the current data set
+        for APIs that use marker/limit-based paging.
+        """
+        return http.urlquote_plus(self.get_object_id(self.data[0]))
+
+    def get_prev_pagination_string(self):
+        """Returns the query parameter string to paginate this table
+        backwards.
+        """
+        query = "=".join([self._meta.prev_pagination_param,
+                          self.get_prev_marker()])
+        return self._append_sort_string(query)
+
+    def _append_sort_string(self, query):
+        sort_column, sort_dir = self.get_sort()
+        if sort_column is None:
+            return query
+        return "&".join([query, urlencode([
+            (self._meta.sort_param, sort_column.name),
+            (self._meta.sort_dir_param, sort_dir)])])
+
+    def get_page_size(self):
+        """Returns the number of rows shown on each page of this table."""
+        return self._meta.page_size or functions.get_page_size(self.request)
+
+    def get_sort(self):
+        """Returns a ``(column, direction)`` tuple for the sort requested in
+        the query string of a ``server_sort`` table, falling back to its
+        ``default_sort``. Returns ``(None, None)`` if the table is not
+        sorted on the server.
+        """
+        if not self._meta.server_sort:
+            return None, None
+        name = self.request.GET.get(self._meta.sort_param, None)
+        sort_dir = self.request.GET.get(self._meta.sort_dir_param, None)
+        if name is None and self._meta.default_sort:
+            name, sort_dir = self._meta.default_sort
+        column = self.columns.get(name, None)
+        # Only the declared sort keys ever reach the API.
+        if column is None or not (column.sortable and column.sort_key):
+            return None, None
+        if sort_dir not in ("asc", "desc"):
+            sort_dir = "asc"
+        return column, sort_dir
+
+    def get_sort_params(self):
+        """Returns the ``sort_key`` and ``sort_dir`` keyword arguments to
+        pass on to the API the data of this table is listed from, or an
+        empty dict if the table is not sorted on the server.
+        """
+        sort_column, sort_dir = self.get_sort()
+        if sort_column is None:
+            return {}
+        return {'sort_key': sort_column.sort_key, 'sort_dir': sort_dir}
+
+    def get_sort_string(self, column):
+        """Returns the query parameter string to sort this table by the
+        given column, reversing the direction if the table is already
+        sorted by it. Returns ``None`` if the column is not sorted on the
+        server.
+        """
+        if not (self._meta.server_sort and column.sortable and
+                column.sort_key):
+            return None
+        sort_column, sort_dir = self.get_sort()
+        if column is sort_column and sort_dir == "asc":
+            sort_dir = "desc"
+        else:
+            sort_dir = "asc"
+        return urlencode([(self._meta.sort_param, column.name),
+                          (self._meta.sort_dir_param, sort_dir)])
+
+    def sort_and_page(self, data):
+        """Sorts and paginates a list the backing API returned in full.
+
+        This is the fallback for ``server_sort`` tables whose API can
+        neither sort nor page. The list is sorted on the ``sort_key`` of
+        the requested column once per request and the page is then cut
+        out around the marker in the query string.
+
+        Returns a ``(page, has_prev_data, has_more_data)`` tuple.
+        """
+        sort_column, sort_dir = self.get_sort()
+        cached = getattr(self, '_sorted_data', None)
+        if (cached is None or cached[0] is not data or
+                cached[1] != (sort_column, sort_dir)):
+            items = list(data)
+            if sort_column is not None:
+                sort_key = sort_column.sort_key
+
+                def get_value(datum):
+                    if isinstance(datum, collections.Mapping):
+                        return datum.get(sort_key, None)
+                    return getattr(datum, sort_key, None)
+
+                items.sort(key=get_value, reverse=(sort_dir == "desc"))
+            positions = dict((_unicode_id(self.get_object_id(datum)), i)
+                             for i, datum in enumerate(items))
+            cached = (data, (sort_column, sort_dir), items, positions)
+            self._sorted_data = cached
+        items, positions = cached[2], cached[3]
+
+        page_size = self.get_page_size()
+        prev_marker = self.request.GET.get(self._meta.prev_pagination_param,
+                                           None)
+        marker = self.request.GET.get(self._meta.pagination_param, None)
+        # An unknown marker (e.g. a deleted row) starts over at the top.
+        if prev_marker in positions:
+            end = positions[prev_marker]
+            start = max(end - page_size, 0)
+        else:
+            start = positions.get(marker, -1) + 1
+            end = start + page_size
+        return items[start:end], start > 0, end < len(items)
 
     def calculate_row_status(self, statuses):
         """Returns a boolean value determining the overall row status
@@ -1574,9 +2058,17 @@ class DataTable(object):
         """Return the row data for this table broken out by columns."""
         rows = []
         try:
+            current_items = []
+            if self.current_item_id is not None:
+                current_id = _unicode_id(self.current_item_id)
+                index = self._get_object_index()
+                if current_id in self._object_index_duplicates:
+                    current_items = index[current_id]
+                elif current_id in index:
+                    current_items = [index[current_id]]
             for datum in self.filtered_data:
                 row = self._meta.row_class(self, datum)
-                if self.get_object_id(datum) == self.current_item_id:
+                if any(datum is item for item in current_items):
                     self.selected = True
                     row.classes.append('current_selected')
                 rows.append(row)
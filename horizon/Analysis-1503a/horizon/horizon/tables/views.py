@@ -113,11 +113,15 @@ class MultiTableMixin(object):
     def has_more_data(self, table):
         return False
 
+    def has_prev_data(self, table):
+        return False
+
     def handle_table(self, table):
         name = table.name
         data = self._get_data_dict()
         self._tables[name].data = data[table._meta.name]
         self._tables[name]._meta.has_more_data = self.has_more_data(table)
+        self._tables[name]._meta.has_prev_data = self.has_prev_data(table)
         handled = self._tables[name].maybe_handle()
         return handled
 
@@ -170,8 +174,8 @@ class DataTableView(MultiTableView):
     define a ``get_data`` method which returns a set of data for the
     table; and specify a template for the ``template_name`` attribute.
 
-    Optionally, you can override the ``has_more_data`` method to trigger
-    pagination handling for APIs that support it.
+    Optionally, you can override the ``has_more_data`` and ``has_prev_data``
+    methods to trigger pagination handling for APIs that support it.
     """
     table_class = None
     context_object_name = 'table'
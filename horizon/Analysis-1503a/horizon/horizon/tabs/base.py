@@ -430,6 +430,7 @@ class TableTab(Tab):
                 # Load the data.
                 table.data = data_func()
                 table._meta.has_more_data = self.has_more_data(table)
+                table._meta.has_prev_data = self.has_prev_data(table)
             # Mark our data as loaded so we don't run the loaders again.
             self._table_data_loaded = True
 
@@ -453,3 +454,6 @@ class TableTab(Tab):
 
     def has_more_data(self, table):
         return False
+
+    def has_prev_data(self, table):
+        return False
@@ -21,12 +21,15 @@ from django.utils.datastructures import SortedDict
 from django.utils.encoding import force_unicode
 from django.utils.translation import ugettext_lazy as _
 
-from horizon.base import Horizon  # noqa
+from horizon import base
 from horizon import conf
 
 
 register = template.Library()
 
+# Maximum number of navigation trees kept before the cache is emptied.
+NAV_CACHE_SIZE = 1000
+
 
 @register.filter
 def has_permissions(user, component):
@@ -42,30 +45,81 @@ def has_permissions_on_list(components, user):
                 in components if has_permissions(user, component)]
 
 
+def _nav_allowed(component, context):
+    if callable(component.nav):
+        return component.nav(context)
+    return component.nav
+
+
+def _nav_cache_key(request):
+    """Returns what the navigation shown to a request depends on.
+
+    These are the project, the region and the service catalog of the user,
+    the permissions derived from their roles and services, and the current
+    dashboard, which some ``nav`` callables look at.
+    """
+    user = request.user
+    dashboard = request.horizon.get('dashboard', None)
+    return (getattr(user, 'tenant_id', None),
+            getattr(user, 'services_region', None),
+            hash(repr(getattr(user, 'service_catalog', None))),
+            frozenset(user.get_all_permissions()),
+            dashboard.slug if dashboard else None)
+
+
+def _build_nav_tree(context):
+    user = context['request'].user
+    accordion = []
+    main = []
+    panels = {}
+    for dash in base.Horizon.get_dashboards():
+        non_empty_groups = []
+        for group in dash.get_panel_groups().values():
+            allowed_panels = [panel for panel in group
+                              if _nav_allowed(panel, context) and
+                              has_permissions(user, panel)]
+            if allowed_panels:
+                non_empty_groups.append((group.name, allowed_panels))
+        panels[dash.slug] = SortedDict(non_empty_groups)
+        if not has_permissions(user, dash):
+            continue
+        if _nav_allowed(dash, context):
+            accordion.append((dash, panels[dash.slug]))
+        if callable(dash.nav) and dash.nav(context):
+            main.append(dash)
+        elif dash.nav:
+            main.append(dash)
+    return {'accordion': accordion, 'main': main, 'panels': panels}
+
+
+def get_nav_tree(context):
+    """Returns the dashboards and panels the navigation shows for the
+    request in ``context``, already filtered by their ``nav`` attributes
+    and by the permissions of the user.
+
+    The tree is only built the first time it is asked for with a given
+    :func:`_nav_cache_key`, so it is built again after switching projects
+    or regions, but not on every page. Registering or unregistering a
+    dashboard or panel empties the cache.
+    """
+    request = context['request']
+    cache = base.Horizon._nav_cache
+    key = _nav_cache_key(request)
+    tree = cache.get(key, None)
+    if tree is None:
+        if len(cache) >= NAV_CACHE_SIZE:
+            cache.clear()
+        tree = cache[key] = _build_nav_tree(context)
+    return tree
+
+
 @register.inclusion_tag('horizon/_accordion_nav.html', takes_context=True)
 def horizon_nav(context):
     if 'request' not in context:
         return {}
     current_dashboard = context['request'].horizon.get('dashboard', None)
     current_panel = context['request'].horizon.get('panel', None)
-    dashboards = []
-    for dash in Horizon.get_dashboards():
-        panel_groups = dash.get_panel_groups()
-        non_empty_groups = []
-        for group in panel_groups.values():
-            allowed_panels = []
-            for panel in group:
-                if callable(panel.nav) and panel.nav(context):
-                    allowed_panels.append(panel)
-                elif not callable(panel.nav) and panel.nav:
-                    allowed_panels.append(panel)
-            if allowed_panels:
-                non_empty_groups.append((group.name, allowed_panels))
-        if callable(dash.nav) and dash.nav(context):
-            dashboards.append((dash, SortedDict(non_empty_groups)))
-        elif not callable(dash.nav) and dash.nav:
-            dashboards.append((dash, SortedDict(non_empty_groups)))
-    return {'components': dashboards,
+    return {'components': get_nav_tree(context)['accordion'],
             'user': context['request'].user,
             'current': current_dashboard,
             'current_panel': current_panel.slug if current_panel else '',
@@ -78,13 +132,7 @@ def horizon_main_nav(context):
     if 'request' not in context:
         return {}
     current_dashboard = context['request'].horizon.get('dashboard', None)
-    dashboards = []
-    for dash in Horizon.get_dashboards():
-        if callable(dash.nav) and dash.nav(context):
-            dashboards.append(dash)
-        elif dash.nav:
-            dashboards.append(dash)
-    return {'components': dashboards,
+    return {'components': get_nav_tree(context)['main'],
             'user': context['request'].user,
             'current': current_dashboard,
             'request': context['request']}
@@ -96,20 +144,8 @@ def horizon_dashboard_nav(context):
     if 'request' not in context:
         return {}
     dashboard = context['request'].horizon['dashboard']
-    panel_groups = dashboard.get_panel_groups()
-    non_empty_groups = []
-
-    for group in panel_groups.values():
-        allowed_panels = []
-        for panel in group:
-            if callable(panel.nav) and panel.nav(context):
-                allowed_panels.append(panel)
-            elif not callable(panel.nav) and panel.nav:
-                allowed_panels.append(panel)
-        if allowed_panels:
-            non_empty_groups.append((group.name, allowed_panels))
-
-    return {'components': SortedDict(non_empty_groups),
+    panels = get_nav_tree(context)['panels']
+    return {'components': panels.get(dashboard.slug, SortedDict()),
             'user': context['request'].user,
             'current': context['request'].horizon['panel'].slug,
             'request': context['request']}
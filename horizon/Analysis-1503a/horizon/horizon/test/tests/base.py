@@ -23,11 +23,16 @@ from django.conf import settings
 from django.contrib.auth.models import User  # noqa
 from django.core.exceptions import ImproperlyConfigured  # noqa
 from django.core import urlresolvers
+from django.template import Context  # noqa
+from django.template import loader as template_loader
+from django.test.utils import override_settings  # noqa
 from django.utils.importlib import import_module  # noqa
 
 import horizon
 from horizon import base
 from horizon import conf
+from horizon import loaders
+from horizon.templatetags import horizon as horizon_tags
 from horizon.test import helpers as test
 from horizon.test.test_dashboards.cats.dashboard import Cats  # noqa
 from horizon.test.test_dashboards.cats.kittens.panel import Kittens  # noqa
@@ -221,6 +226,28 @@ class HorizonTests(BaseHorizonTests):
         iter(urlpatterns)
         reversed(urlpatterns)
 
+    def test_warm_up(self):
+        self._reload_urls()
+        profile = horizon.warm_up()
+        panels = [panel for panel, seconds in profile]
+        for panel in ('cats/kittens', 'cats/tigers', 'dogs/puppies'):
+            self.assertIn(panel, panels)
+        times = [seconds for panel, seconds in profile]
+        self.assertEqual(sorted(times, reverse=True), times)
+
+    def test_import_profile(self):
+        kittens = horizon.get_dashboard("cats").get_panel("kittens")
+        package = kittens.__module__.rsplit('.', 1)[0]
+        import_times = dict(base._import_times)
+        base._import_times.update({package + '.panel': 3.0,
+                                   package + '.urls': 2.0})
+        try:
+            profile = base.Horizon.get_import_profile()
+        finally:
+            base._import_times.clear()
+            base._import_times.update(import_times)
+        self.assertEqual(('cats/kittens', 5.0), profile[0])
+
     def test_horizon_test_isolation_1(self):
         """Isolation Test Part 1: sets a value."""
         cats = horizon.get_dashboard("cats")
@@ -351,6 +378,97 @@ class GetUserHomeTests(BaseHorizonTests):
                          base.Horizon.get_user_home(self.test_user))
 
 
+class TemplateCacheTests(BaseHorizonTests):
+    cached_loaders = (
+        ('horizon.loaders.CachedTemplateLoader', settings.TEMPLATE_LOADERS),
+    )
+
+    def test_template_names(self):
+        names = loaders.get_template_names()
+        self.assertIn('horizon/common/_data_table.html', names)
+        self.assertIn('cats/base.html', names)
+        self.assertIn('cats/kittens/index.html', names)
+        self.assertIn('dogs/puppies/index.html', names)
+
+    def test_precompile_templates(self):
+        with override_settings(TEMPLATE_LOADERS=self.cached_loaders):
+            compiled, failed = loaders.precompile_templates()
+            self.assertEqual({}, failed)
+            self.assertIn('cats/kittens/index.html', compiled)
+
+            cache = template_loader.template_source_loaders[0]
+            self.assertIsInstance(cache, loaders.CachedTemplateLoader)
+            template = cache.template_cache['cats/kittens/index.html']
+            self.assertIs(template,
+                          template_loader.get_template(
+                              'cats/kittens/index.html'))
+
+    def _load_stale_template(self):
+        cache = loaders.CachedTemplateLoader(settings.TEMPLATE_LOADERS)
+        name = 'cats/kittens/index.html'
+        template = cache.load_template(name)[0]
+        self.assertIs(template, cache.load_template(name)[0])
+        path, mtime = cache.template_files[name]
+        self.assertTrue(path.endswith(name.replace('cats/', 'templates/')))
+        # Pretend the file changed after the template was compiled.
+        cache.template_files[name] = (path, mtime - 1)
+        return template, cache.load_template(name)[0]
+
+    @override_settings(DEBUG=True)
+    def test_changed_template_recompiled_in_debug(self):
+        template, reloaded = self._load_stale_template()
+        self.assertIsNot(template, reloaded)
+
+    @override_settings(DEBUG=False)
+    def test_template_files_not_checked(self):
+        template, reloaded = self._load_stale_template()
+        self.assertIs(template, reloaded)
+
+
+class NavigationCacheTests(BaseHorizonTests):
+    def setUp(self):
+        super(NavigationCacheTests, self).setUp()
+        self._reload_urls()
+        self.cats = horizon.get_dashboard("cats")
+        self.request.user = self.user
+        self.request.horizon['dashboard'] = self.cats
+        self.request.horizon['panel'] = self.cats.get_panel("kittens")
+        self.context = Context({'request': self.request})
+
+    def _nav_panels(self, dashboard):
+        tree = horizon_tags.get_nav_tree(self.context)
+        return [panel.slug for group in tree['panels'][dashboard].values()
+                for panel in group]
+
+    def test_nav_tree_cached(self):
+        calls = []
+        kittens = self.cats.get_panel("kittens")
+        kittens.nav = lambda context: calls.append(context) or True
+
+        horizon_tags.horizon_nav(self.context)
+        horizon_tags.horizon_dashboard_nav(self.context)
+        horizon_tags.horizon_main_nav(self.context)
+        self.assertEqual(1, len(calls))
+
+        # Navigating to another dashboard builds the tree again.
+        self.request.horizon['dashboard'] = horizon.get_dashboard("dogs")
+        horizon_tags.horizon_nav(self.context)
+        self.assertEqual(2, len(calls))
+
+    def test_nav_tree_permissions(self):
+        # Both panels require the "horizon.test" permission.
+        self.assertEqual([], self._nav_panels('cats'))
+
+        self.set_permissions(permissions=['test'])
+        self.assertEqual(['kittens', 'tigers'], self._nav_panels('cats'))
+
+    def test_nav_cache_emptied_on_register(self):
+        horizon_tags.get_nav_tree(self.context)
+        self.assertTrue(base.Horizon._nav_cache)
+        self.cats.unregister(Tigers)
+        self.assertEqual({}, base.Horizon._nav_cache)
+
+
 class CustomPanelTests(BaseHorizonTests):
 
     """Test customization of dashboards and panels
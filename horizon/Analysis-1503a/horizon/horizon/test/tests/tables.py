@@ -14,20 +14,31 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+import json
+import logging
+import time
+
+from django.core import urlresolvers
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
 from django import shortcuts
 from django.template import defaultfilters
+from django.utils.http import urlencode
 
 from mox import IsA  # noqa
 
+from horizon import exceptions
 from horizon import tables
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
 from horizon.test import helpers as test
 
 
+LOG = logging.getLogger(__name__)
+
+
 class FakeObject(object):
     def __init__(self, id, name, value, status, optional=None, excluded=None):
         self.id = id
@@ -116,6 +127,22 @@ class MyRow(tables.Row):
         return TEST_DATA_2[0]
 
 
+class MyBatchRow(tables.Row):
+    ajax = True
+
+    def get_data(self, request, obj_id):
+        if obj_id == '2':
+            raise exceptions.Conflict("Object 2 is busy.")
+        return dict((datum.id, datum) for datum in TEST_DATA)[obj_id]
+
+    def get_data_batch(self, request, obj_ids):
+        data = super(MyBatchRow, self).get_data_batch(
+            request, [obj_id for obj_id in obj_ids if obj_id != 'gone'])
+        if 'gone' in obj_ids:
+            data['gone'] = None
+        return data
+
+
 class MyBatchAction(tables.BatchAction):
     name = "batch"
     action_present = "Batch"
@@ -234,6 +261,19 @@ class MyTableNotAllowedInlineEdit(MyTable):
         row_class = MyRow
 
 
+class MyBatchRowTable(MyTable):
+    class Meta:
+        name = "my_table"
+        columns = ('id', 'name', 'value', 'status')
+        row_class = MyBatchRow
+        status_columns = ["status"]
+
+
+class MyFastTable(MyTable):
+    class Meta(MyTable.Meta):
+        fast_render = True
+
+
 class NoActionsTable(tables.DataTable):
     id = tables.Column('id')
 
@@ -244,6 +284,17 @@ class NoActionsTable(tables.DataTable):
         row_actions = ()
 
 
+class ServerSortTable(tables.DataTable):
+    name = tables.Column(get_name, verbose_name='Name', sort_key='name')
+    value = tables.Column('value', sort_key='value')
+    status = tables.Column('status')
+
+    class Meta:
+        name = "server_sort_table"
+        server_sort = True
+        page_size = 2
+
+
 class DataTableTests(test.TestCase):
     def test_table_instantiation(self):
         """Tests everything that happens when the table is instantiated."""
@@ -1035,6 +1086,149 @@ class DataTableTests(test.TestCase):
         self.assertEqual(list(req._messages)[0].message,
                         u"Downed Item: N/A")
 
+    def test_get_object_by_id(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        self.assertEqual(self.table.get_object_by_id('2'), TEST_DATA[1])
+        self.assertEqual(self.table.get_object_by_id(3), TEST_DATA[2])
+        self.assertRaises(exceptions.Http302,
+                          self.table.get_object_by_id, '4')
+
+        # Reassigning the data rebuilds the index.
+        self.table.data = TEST_DATA_2
+        self.assertEqual(self.table.get_object_by_id('1'), TEST_DATA_2[0])
+        self.assertRaises(exceptions.Http302,
+                          self.table.get_object_by_id, '2')
+
+        # Only lookups of duplicated ids are ambiguous.
+        self.table.data = TEST_DATA + TEST_DATA_2
+        self.assertRaises(ValueError, self.table.get_object_by_id, '1')
+        self.assertEqual(self.table.get_object_by_id('2'), TEST_DATA[1])
+
+    def test_batch_action_large_table(self):
+        """Benchmarks a batch action over every row of a 10k row table.
+
+        Each selected id used to be looked up by scanning the whole table,
+        so the table must now only compute every object id once.
+        """
+        class CountingTable(MyTable):
+            calls = 0
+
+            def get_object_id(self, datum):
+                CountingTable.calls += 1
+                return datum.id
+
+            class Meta:
+                name = "my_table"
+                columns = ('id', 'name', 'status')
+                table_actions = (MyBatchAction,)
+
+        data = [FakeObject(str(i), 'object_%s' % i, 'value', 'up')
+                for i in range(10000)]
+        object_ids = [datum.id for datum in data]
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': object_ids})
+        self.table = CountingTable(req, data)
+        start = time.time()
+        handled = self.table.maybe_handle()
+        elapsed = time.time() - start
+
+        self.assertEqual(handled.status_code, 302)
+        self.assertEqual(CountingTable.calls, len(data))
+        self.assertEqual(list(req._messages)[0].message,
+                         u"Batched Items: %s" % ", ".join(
+                             datum.name for datum in data))
+        LOG.debug("Batch action over %s rows took %.3fs."
+                  % (len(data), elapsed))
+
+        # The current item is highlighted through the same index.
+        req = self.factory.get('/my_url/')
+        self.table = CountingTable(req, data)
+        self.table.current_item_id = '9999'
+        rows = self.table.get_rows()
+        self.assertIn('current_selected', rows[-1].classes)
+        self.assertNotIn('current_selected', rows[0].classes)
+
+    def test_row_actions_large_table(self):
+        """Benchmarks rendering the row actions of a 1000 row table.
+
+        Actions which only use the default permission checks are checked
+        once per table, and link URLs are only reversed once per action.
+        """
+        class DetailAction(tables.LinkAction):
+            name = "detail"
+            verbose_name = "Detail"
+            url = "horizon.test.jasmine.jasmine.dispatcher"
+
+        class StatusAction(tables.LinkAction):
+            name = "status"
+            verbose_name = "Status"
+            url = "horizon.test.jasmine.jasmine.dispatcher"
+
+            def update(self, request, datum):
+                self.attrs['data-status'] = datum.status
+
+        class CountingTable(MyTable):
+            checks = {}
+
+            def _filter_action(self, action, request, datum=None):
+                CountingTable.checks.setdefault(action.name, 0)
+                CountingTable.checks[action.name] += 1
+                return super(CountingTable, self)._filter_action(
+                    action, request, datum)
+
+            class Meta:
+                name = "my_table"
+                columns = ('id', 'name', 'status')
+                row_actions = (MyAction, DetailAction, StatusAction,
+                               MyLinkAction)
+
+        reversed_urls = []
+
+        def counting_reverse(*args, **kwargs):
+            reversed_urls.append(args[0])
+            return reverse(*args, **kwargs)
+        self.mox.stubs.Set(urlresolvers, 'reverse', counting_reverse)
+
+        data = [FakeObject(str(i), 'object_%s' % i, 'value',
+                           'down' if i % 2 else 'up')
+                for i in range(1000)]
+        self.table = CountingTable(self.request, data)
+        start = time.time()
+        rows = self.table.get_rows()
+        for row in rows:
+            row.render()
+        elapsed = time.time() - start
+
+        self.assertEqual(CountingTable.checks,
+                         {"delete": len(data), "detail": 1, "status": 1,
+                          "login": 1})
+        # Once for each of the two actions sharing the URL.
+        self.assertEqual(reversed_urls.count(DetailAction.url), 2)
+
+        actions = self.table.get_row_actions(data[1])
+        self.assertEqual([a.name for a in actions],
+                         ["detail", "status", "login"])
+        self.assertEqual(actions[0].bound_url, "/jasmine/1")
+        self.assertEqual(actions[1].attrs['data-status'], 'down')
+        self.assertEqual(actions[2].bound_url, reverse("login"))
+        # Bound actions don't leak state into each other or the table.
+        other = dict((a.name, a)
+                     for a in self.table.get_row_actions(data[2]))
+        self.assertEqual(other['status'].bound_url, "/jasmine/2")
+        self.assertEqual(other['status'].attrs['data-status'], 'up')
+        self.assertEqual(actions[1].attrs['data-status'], 'down')
+        self.assertNotIn('data-status',
+                         self.table.base_actions['status'].attrs)
+        self.assertIs(actions[0].datum, data[1])
+        self.assertIsInstance(actions[0], DetailAction)
+
+        # Ids which can't stand in for the placeholder are reversed per row.
+        actions = self.table.get_row_actions(FakeObject('a/b', 'x', 'y',
+                                                        'down'))
+        self.assertEqual(actions[0].bound_url, "/jasmine/a/b")
+        LOG.debug("Row actions of %s rows took %.3fs."
+                  % (len(data), elapsed))
+
     def test_table_column_can_be_selected(self):
         self.table = MyTableSelectable(self.request, TEST_DATA_6)
         #non selectable row
@@ -1105,6 +1299,123 @@ class DataTableTests(test.TestCase):
         resp = http.HttpResponse(table.render())
         self.assertContains(resp, value)
 
+    def test_fast_render(self):
+        data = list(TEST_DATA) + [
+            FakeObject('4', 'object_4', 1.5, 'up', datetime.date(2014, 5, 1)),
+            FakeObject('5', '<object_5>', None, 'unknown', 7)]
+        for rows in (TEST_DATA, TEST_DATA_4, data):
+            table = MyTable(self.request, rows)
+            fast_table = MyFastTable(self.request, rows)
+            self.assertEqual([row.render() for row in table.get_rows()],
+                             [row.render() for row in fast_table.get_rows()])
+            self.assertEqual(MyTable(self.request, rows).render(),
+                             MyFastTable(self.request, rows).render())
+
+    def test_batch_row_update(self):
+        table = MyBatchRowTable(self.request, TEST_DATA)
+        row = table.get_rows()[0]
+        self.assertEqual(row.get_ajax_batch_update_url(),
+                         row.attrs['data-batch-update-url'])
+
+        params = [("table", "my_table"), ("action", "rows_update"),
+                  ("obj_id", "1"), ("obj_id", "2"), ("obj_id", "gone")]
+        req = self.factory.get('/my_url/?%s' % urlencode(params),
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        table = MyBatchRowTable(req)
+        resp = table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        rows = json.loads(resp.content)['rows']
+        self.assertIn('id="my_table__row__1"', rows['1'])
+        # Objects which are gone are removed, failed ones are left alone.
+        self.assertIsNone(rows['gone'])
+        self.assertNotIn('2', rows)
+
+    def _server_sort_table(self, query=''):
+        request = self.factory.get('/my_url/?%s' % query)
+        request.user = self.user
+        return ServerSortTable(request, TEST_DATA)
+
+    def test_server_sort_params(self):
+        table = self._server_sort_table('sort_key=value&sort_dir=desc')
+        self.assertEqual({'sort_key': 'value', 'sort_dir': 'desc'},
+                         table.get_sort_params())
+        self.assertEqual('sort_key=value&sort_dir=asc',
+                         table.get_sort_string(table.columns['value']))
+        self.assertEqual('sort_key=name&sort_dir=asc',
+                         table.get_sort_string(table.columns['name']))
+        self.assertIsNone(table.get_sort_string(table.columns['status']))
+        self.assertEqual('marker=3&sort_key=value&sort_dir=desc',
+                         table.get_pagination_string())
+        self.assertEqual('prev_marker=1&sort_key=value&sort_dir=desc',
+                         table.get_prev_pagination_string())
+
+        # Columns without a sort key never reach the API.
+        table = self._server_sort_table('sort_key=status')
+        self.assertEqual({}, table.get_sort_params())
+        self.assertEqual('marker=3', table.get_pagination_string())
+
+        # Tables sorted in the browser ignore the query string.
+        request = self.factory.get('/my_url/?sort_key=value')
+        table = MyTable(request, TEST_DATA)
+        self.assertEqual({}, table.get_sort_params())
+        self.assertIsNone(table.get_sort_string(table.columns['value']))
+
+    def test_server_sort_rendering(self):
+        table = self._server_sort_table('sort_key=value&sort_dir=asc')
+        resp = http.HttpResponse(table.render())
+        self.assertContains(resp, '<a href="?sort_key=value&amp;'
+                                  'sort_dir=desc">Value</a>')
+        self.assertContains(resp, '<a href="?sort_key=name&amp;'
+                                  'sort_dir=asc">Name</a>')
+        value_classes = table.columns['value'].get_final_attrs()['class']
+        self.assertIn('headerSortDown', value_classes)
+        self.assertNotIn('sortable', value_classes)
+        # The declared columns are left untouched.
+        declared = ServerSortTable.base_columns['value']
+        self.assertIn('sortable', declared.classes)
+
+    def test_sort_and_page(self):
+        data = [FakeObject(str(i), 'object_%s' % i, i % 3, 'up')
+                for i in range(5)]
+        table = self._server_sort_table('sort_key=value&sort_dir=desc')
+        page, has_prev, has_more = table.sort_and_page(data)
+        # Rows with the same value keep the order the API returned them in.
+        self.assertEqual(['2', '1'], [datum.id for datum in page])
+        self.assertEqual((False, True), (has_prev, has_more))
+
+        table = self._server_sort_table(
+            'sort_key=value&sort_dir=desc&marker=1')
+        page, has_prev, has_more = table.sort_and_page(data)
+        self.assertEqual(['4', '0'], [datum.id for datum in page])
+        self.assertEqual((True, True), (has_prev, has_more))
+
+        table = self._server_sort_table(
+            'sort_key=value&sort_dir=desc&prev_marker=3')
+        page, has_prev, has_more = table.sort_and_page(data)
+        self.assertEqual(['4', '0'], [datum.id for datum in page])
+        self.assertEqual((True, True), (has_prev, has_more))
+
+        table = self._server_sort_table(
+            'sort_key=value&sort_dir=desc&marker=0')
+        page, has_prev, has_more = table.sort_and_page(data)
+        self.assertEqual(['3'], [datum.id for datum in page])
+        self.assertEqual((True, False), (has_prev, has_more))
+
+        # A marker which is gone starts over at the first page.
+        table = self._server_sort_table('marker=missing')
+        page, has_prev, has_more = table.sort_and_page(data)
+        self.assertEqual(['0', '1'], [datum.id for datum in page])
+        self.assertEqual((False, True), (has_prev, has_more))
+
+    def test_sort_and_page_sorts_once(self):
+        data = [FakeObject(str(i), 'object_%s' % i, i % 3, 'up')
+                for i in range(5)]
+        table = self._server_sort_table('sort_key=value')
+        page, has_prev, has_more = table.sort_and_page(data)
+        # Sorting again would move the changed value to the end.
+        data[0].value = 10
+        self.assertEqual(page, table.sort_and_page(data)[0])
+
 
 class SingleTableView(table_views.DataTableView):
     table_class = MyTable
@@ -16,12 +16,14 @@
 
 import datetime
 import os
+import threading
 
 from django.core.exceptions import ValidationError  # noqa
 import django.template
 from django.template import defaultfilters
 
 from horizon.test import helpers as test
+from horizon.utils import concurrency
 from horizon.utils import fields
 from horizon.utils import filters
 # we have to import the filter in order to register it
@@ -353,3 +355,54 @@ class MemoizedTests(test.TestCase):
         for x in range(0, 5):
             cache_calls(1)
         self.assertEqual(len(values_list), 1)
+
+
+class ConcurrencyTests(test.TestCase):
+    def test_submit_returns_result(self):
+        with concurrency.Executor(max_workers=2) as executor:
+            futures = [executor.submit(lambda x: x * 2, i) for i in range(5)]
+        self.assertEqual([f.result() for f in futures], [0, 2, 4, 6, 8])
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Event()
+
+        def wait_for_barrier():
+            return barrier.wait(5)
+
+        with concurrency.Executor(max_workers=2) as executor:
+            waiter = executor.submit(wait_for_barrier)
+            executor.submit(barrier.set)
+        self.assertTrue(waiter.result())
+
+    def test_result_reraises_worker_exception(self):
+        def fail():
+            raise ValueError("boom")
+
+        with concurrency.Executor() as executor:
+            future = executor.submit(fail)
+        self.assertRaises(ValueError, future.result)
+
+    def test_max_workers_bounds_threads(self):
+        executor = concurrency.Executor(max_workers=3)
+        event = threading.Event()
+        futures = executor.map(lambda x: event.wait(5) and x, range(10))
+        self.assertTrue(executor._running <= 3)
+        event.set()
+        executor.shutdown()
+        self.assertEqual([f.result() for f in futures], range(10))
+        self.assertEqual(executor._running, 0)
+
+    def test_zero_workers_runs_inline(self):
+        executor = concurrency.Executor(max_workers=0)
+        future = executor.submit(threading.current_thread)
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), threading.current_thread())
+
+    def test_result_timeout(self):
+        event = threading.Event()
+        executor = concurrency.Executor(max_workers=1)
+        future = executor.submit(event.wait, 5)
+        self.assertRaises(concurrency.TimeoutError, future.result, 0.01)
+        event.set()
+        executor.shutdown()
+        self.assertTrue(future.result())
@@ -14,6 +14,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+
 from django import forms
 from django import http
 
@@ -72,6 +74,33 @@ class TestActionThree(workflows.Action):
         slug = "test_action_three"
 
 
+class TestConcurrentAction(TestActionOne):
+    class Meta:
+        name = "Test Concurrent Action"
+        slug = "test_concurrent_action"
+        independent_choices = ("project_id", "user_id")
+
+    def populate_project_id_choices(self, request, context):
+        self.threads.append(threading.current_thread())
+        return super(TestConcurrentAction,
+                     self).populate_project_id_choices(request, context)
+
+    def populate_user_id_choices(self, request, context):
+        self.threads.append(threading.current_thread())
+        return [(INSTANCE_ID, "test_user")]
+
+
+class TestDeferredAction(workflows.Action):
+    flavor = forms.ChoiceField(label="Flavor")
+
+    class Meta:
+        name = "Test Deferred Action"
+        slug = "test_deferred_action"
+
+    def populate_flavor_choices(self, request, context):
+        return [("deferred_flavor", "Deferred Flavor")]
+
+
 class AdminAction(workflows.Action):
     admin_id = forms.CharField(label="Admin")
 
@@ -103,6 +132,11 @@ class TestExtraStep(workflows.Step):
     before = TestStepTwo
 
 
+class TestDeferredStep(workflows.Step):
+    action_class = TestDeferredAction
+    contributes = ("flavor",)
+
+
 class AdminStep(workflows.Step):
     action_class = AdminAction
     contributes = ("admin_id",)
@@ -120,6 +154,17 @@ class TestWorkflowView(workflows.WorkflowView):
     template_name = "workflow.html"
 
 
+class TestDeferredWorkflow(workflows.Workflow):
+    slug = "test_deferred_workflow"
+    default_steps = (TestStepOne, TestDeferredStep)
+    defer_choices = True
+
+
+class TestDeferredWorkflowView(workflows.WorkflowView):
+    workflow_class = TestDeferredWorkflow
+    template_name = "workflow.html"
+
+
 class TestFullscreenWorkflow(workflows.Workflow):
     slug = 'test_fullscreen_workflow'
     default_steps = (TestStepOne, TestStepTwo)
@@ -292,3 +337,46 @@ class WorkflowsTests(test.TestCase):
         output = res.render()
         self.assertNotRegexpMatches(str(output),
                                     'class="[^"]*\\bfullscreen\\b[^"]*"')
+
+    def test_independent_choices(self):
+        TestConcurrentAction.threads = []
+        action = TestConcurrentAction(self.request, {})
+        self.assertEqual([(PROJECT_ID, "test_project")],
+                         action.fields['project_id'].choices)
+        self.assertEqual([(INSTANCE_ID, "test_user")],
+                         action.fields['user_id'].choices)
+        self.assertEqual(2, len(TestConcurrentAction.threads))
+        self.assertNotIn(threading.current_thread(),
+                         TestConcurrentAction.threads)
+
+    def test_deferred_choices(self):
+        req = self.factory.get("/foo")
+        flow = TestDeferredWorkflow(req)
+        step = flow.get_step("test_deferred_action")
+        self.assertTrue(step.action.choices_deferred)
+        self.assertEqual([], step.action.fields['flavor'].choices)
+        self.assertEqual("/foo?deferred_step=test_deferred_action",
+                         step.get_deferred_url())
+        # Rendering the step populates its choices.
+        self.assertIn("Deferred Flavor", step.render())
+        self.assertFalse(step.action.choices_deferred)
+
+    def test_deferred_step_view(self):
+        view = TestDeferredWorkflowView.as_view()
+        req = self.factory.get("/foo", {"deferred_step":
+                                        "test_deferred_action"})
+        res = view(req)
+        self.assertContains(res, "Deferred Flavor")
+        self.assertNotContains(res, "test_project")
+
+        req = self.factory.get("/foo", {"deferred_step": "unknown"})
+        with self.assertRaises(http.Http404):
+            view(req)
+
+    def test_deferred_choices_populated_on_post(self):
+        req = self.factory.post("/foo", {"flavor": "deferred_flavor"})
+        req.user = self.user
+        flow = TestDeferredWorkflow(req)
+        step = flow.get_step("test_deferred_action")
+        self.assertFalse(step.action.choices_deferred)
+        self.assertTrue(step.action.is_valid())
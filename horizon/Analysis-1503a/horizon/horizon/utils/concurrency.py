@@ -0,0 +1,163 @@
+# vim: tabstop=4 shiftwidth=4 softtabstop=4
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Helpers for issuing independent API calls concurrently within a request.
+
+Views commonly need several unrelated lists (flavors, images, ports...)
+before they can render. Rather than paying the sum of those round trips,
+the calls can be submitted to an :class:`Executor` and collected
+afterwards::
+
+    with concurrency.Executor() as executor:
+        flavors = executor.submit(api.nova.flavor_list, request)
+        images = executor.submit(api.glance.image_list_detailed, request)
+
+    try:
+        flavors = flavors.result()
+    except Exception:
+        flavors = []
+        exceptions.handle(request, ignore=True)
+
+:meth:`Future.result` re-raises any exception from the worker thread in the
+calling thread with its original traceback, so the usual
+:func:`horizon.exceptions.handle` blocks keep working unchanged (including
+redirects and user messages, which are only ever issued from the thread
+serving the request).
+"""
+
+import collections
+import sys
+import threading
+
+from django.conf import settings
+from django.utils import translation
+
+
+def _default_max_workers():
+    return getattr(settings, 'API_CONCURRENCY_MAX_WORKERS', 10)
+
+
+class TimeoutError(Exception):
+    """Raised when a :class:`Future` does not complete in time."""
+    pass
+
+
+class Future(object):
+    """The pending result of a call submitted to an :class:`Executor`."""
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._language = translation.get_language()
+        self._event = threading.Event()
+        self._result = None
+        self._exc_info = None
+
+    def run(self):
+        """Runs the call, storing either its result or its exception."""
+        if self._language:
+            translation.activate(self._language)
+        try:
+            self._result = self.func(*self.args, **self.kwargs)
+        except Exception:
+            self._exc_info = sys.exc_info()
+        finally:
+            self._event.set()
+
+    def done(self):
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        self._event.wait(timeout)
+        return self.done()
+
+    def result(self, timeout=None):
+        """Returns the result of the call, waiting for it if necessary.
+
+        If the call raised, the exception is re-raised here. Waiting longer
+        than ``timeout`` seconds raises :class:`TimeoutError`.
+        """
+        if not self.wait(timeout):
+            raise TimeoutError("%s did not complete within %s seconds."
+                               % (getattr(self.func, '__name__', self.func),
+                                  timeout))
+        if self._exc_info:
+            exc_type, exc_value, exc_traceback = self._exc_info
+            raise exc_type, exc_value, exc_traceback
+        return self._result
+
+
+class Executor(object):
+    """A small bounded thread pool meant to live for a single request.
+
+    Worker threads are started lazily, up to ``max_workers``, and exit as
+    soon as there is nothing left to do. ``max_workers`` defaults to the
+    ``API_CONCURRENCY_MAX_WORKERS`` setting; a value of ``1`` effectively
+    serialises the calls, while ``0`` runs them inline in the calling thread.
+    """
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = _default_max_workers()
+        self.max_workers = max_workers
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._running = 0
+        self._threads = []
+
+    def submit(self, func, *args, **kwargs):
+        """Schedules ``func(*args, **kwargs)`` and returns a :class:`Future`.
+        """
+        future = Future(func, args, kwargs)
+        if self.max_workers < 1:
+            future.run()
+            return future
+        with self._lock:
+            self._pending.append(future)
+            if self._running < self.max_workers:
+                self._running += 1
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def map(self, func, *iterables):
+        """Like the builtin ``map`` but returns a list of futures."""
+        return [self.submit(func, *args) for args in zip(*iterables)]
+
+    def _work(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._running -= 1
+                    return
+                future = self._pending.popleft()
+            future.run()
+
+    def shutdown(self, wait=True):
+        """Waits for every worker thread to finish if ``wait`` is True."""
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = [t for t in self._threads if t.is_alive()]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+        return False
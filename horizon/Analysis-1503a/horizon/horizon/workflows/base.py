@@ -24,17 +24,22 @@ from django.template.defaultfilters import linebreaks  # noqa
 from django.template.defaultfilters import safe  # noqa
 from django.template.defaultfilters import slugify  # noqa
 from django.utils.encoding import force_unicode
+from django.utils import http
 from django.utils.importlib import import_module  # noqa
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import base
 from horizon import exceptions
 from horizon.templatetags.horizon import has_permissions  # noqa
+from horizon.utils import concurrency
 from horizon.utils import html
 
 
 LOG = logging.getLogger(__name__)
 
+# Query parameter asking a workflow view for the rendering of a single step.
+DEFERRED_STEP_PARAM = "deferred_step"
+
 
 class WorkflowContext(dict):
     def __init__(self, workflow, *args, **kwargs):
@@ -70,6 +75,7 @@ class ActionMetaclass(forms.forms.DeclarativeFieldsMetaclass):
                                        _("Processing..."))
         cls.help_text = getattr(opts, "help_text", "")
         cls.help_text_template = getattr(opts, "help_text_template", None)
+        cls.independent_choices = getattr(opts, "independent_choices", ())
         return cls
 
 
@@ -121,11 +127,19 @@ class Action(forms.Form):
         displayed alongside the Action's fields. In conjunction with
         :meth:`~horizon.workflows.Action.get_help_text` method you can
         customize your help text template to display practically anything.
+
+    .. attribute:: independent_choices
+
+        A list of field names whose ``populate_<field>_choices`` methods
+        neither depend on each other nor on the other populate methods. They
+        are run concurrently, before the remaining populate methods are run
+        one after the other. Defaults to an empty list (``()``).
     """
 
     __metaclass__ = ActionMetaclass
 
     def __init__(self, request, context, *args, **kwargs):
+        defer_choices = kwargs.pop('defer_choices', False)
         if request.method == "POST":
             super(Action, self).__init__(request.POST, initial=context)
         else:
@@ -135,7 +149,12 @@ class Action(forms.Form):
             raise AttributeError("The action %s must define a handle method."
                                  % self.__class__.__name__)
         self.request = request
-        self._populate_choices(request, context)
+        # Deferred choices are filled in by populate_choices() once the
+        # action is actually rendered.
+        self.choices_deferred = bool(defer_choices and
+                                     self._choice_populators())
+        if not self.choices_deferred:
+            self._populate_choices(request, context)
         self.required_css_class = 'required'
 
     def __unicode__(self):
@@ -144,11 +163,38 @@ class Action(forms.Form):
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
 
-    def _populate_choices(self, request, context):
-        for field_name, bound_field in self.fields.items():
+    def _choice_populators(self):
+        populators = []
+        for field_name in self.fields:
             meth = getattr(self, "populate_%s_choices" % field_name, None)
             if meth is not None and callable(meth):
-                bound_field.choices = meth(request, context)
+                populators.append((field_name, meth))
+        return populators
+
+    def _populate_choices(self, request, context):
+        populators = self._choice_populators()
+        independent = [(field_name, meth) for field_name, meth in populators
+                       if field_name in self.independent_choices]
+        choices = {}
+        if len(independent) > 1:
+            with concurrency.Executor() as executor:
+                futures = [(field_name,
+                            executor.submit(meth, request, context))
+                           for field_name, meth in independent]
+            for field_name, future in futures:
+                choices[field_name] = future.result()
+        for field_name, meth in populators:
+            if field_name not in choices:
+                choices[field_name] = meth(request, context)
+            self.fields[field_name].choices = choices[field_name]
+
+    def populate_choices(self):
+        """Populates the choices of the action's fields if they were deferred
+        when the action was created.
+        """
+        if self.choices_deferred:
+            self.choices_deferred = False
+            self._populate_choices(self.request, self.initial)
 
     def get_help_text(self, extra_context=None):
         """Returns the help text for this step."""
@@ -364,8 +410,11 @@ class Step(object):
                 workflow_context = dict(self.workflow.context)
                 context = self.prepare_action_context(self.workflow.request,
                                                       workflow_context)
+                kwargs = {}
+                if self.workflow.defers_choices():
+                    kwargs['defer_choices'] = True
                 self._action = self.action_class(self.workflow.request,
-                                                 context)
+                                                 context, **kwargs)
             except Exception:
                 LOG.exception("Problem instantiating action class.")
                 raise
@@ -385,6 +434,16 @@ class Step(object):
         """Returns the ID for this step. Suitable for use in HTML markup."""
         return "%s__%s" % (self.workflow.slug, self.slug)
 
+    def get_deferred_url(self):
+        """Returns the URL from which this step can be rendered on its own.
+
+        Used to load the steps whose choices were deferred.
+        """
+        path = self.workflow.request.get_full_path()
+        separator = "&" if "?" in path else "?"
+        return "%s%s%s=%s" % (path, separator, DEFERRED_STEP_PARAM,
+                              http.urlquote(self.slug))
+
     def _verify_contributions(self, context):
         for key in self.contributes:
             # Make sure we don't skip steps based on weird behavior of
@@ -418,6 +477,7 @@ class Step(object):
 
     def render(self):
         """Renders the step."""
+        self.action.populate_choices()
         step_template = template.loader.get_template(self.template_name)
         import sys
         fOut = open('/tmp/horizon-django-workflows-base(1).txt','a')
@@ -593,6 +653,14 @@ class Workflow(html.HTMLElement):
         the modal can take advantage of the available screen estate.
         Defaults to ``False``.
 
+    .. attribute:: defer_choices
+
+        If set to True, the choices of the workflow's steps are only
+        retrieved when a step is rendered. When the workflow is displayed,
+        only the step it begins on is rendered right away; the other steps
+        are loaded when their tabs are first shown, or just before the
+        workflow is submitted. Defaults to ``False``.
+
     """
     __metaclass__ = WorkflowMetaclass
     slug = None
@@ -605,6 +673,7 @@ class Workflow(html.HTMLElement):
     multipart = False
     wizard = False
     fullscreen = False
+    defer_choices = False
     _registerable_class = Step
 
     def __unicode__(self):
@@ -727,6 +796,16 @@ class Workflow(html.HTMLElement):
         # If nothing else, just return the first step.
         return self.steps[0].slug
 
+    def defers_choices(self):
+        """Returns True if the steps' choices are retrieved only when the
+        steps are rendered.
+
+        Choices are never deferred when the workflow is submitted, since
+        every step is then validated.
+        """
+        return bool(self.defer_choices and self.request and
+                    self.request.method == "GET")
+
     def _trigger_handlers(self, key):
         responses = []
         handlers = [(step.slug, f) for step in self.steps
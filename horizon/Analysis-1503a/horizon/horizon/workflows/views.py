@@ -25,6 +25,7 @@ from django.views import generic
 from horizon import exceptions
 from horizon.forms.views import ADD_TO_FIELD_HEADER  # noqa
 from horizon import messages
+from horizon.workflows.base import DEFERRED_STEP_PARAM  # noqa
 
 
 class WorkflowView(generic.TemplateView):
@@ -141,6 +142,14 @@ class WorkflowView(generic.TemplateView):
         """Handler for HTTP GET requests."""
         context = self.get_context_data(**kwargs)
         self.set_workflow_step_errors(context)
+        deferred_step = request.GET.get(DEFERRED_STEP_PARAM, None)
+        if deferred_step:
+            # Render only the step requested by a workflow whose steps'
+            # choices were deferred.
+            step = context[self.context_object_name].get_step(deferred_step)
+            if step is None:
+                raise http.Http404
+            return http.HttpResponse(step.render())
         return self.render_to_response(context)
 
     def validate_steps(self, request, workflow, start, end):
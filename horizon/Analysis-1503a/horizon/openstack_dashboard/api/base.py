@@ -18,16 +18,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 from collections import Sequence  # noqa
+import functools
+import hashlib
 import logging
+import thread
+import threading
+import time
 
 from django.conf import settings
+from django.core import cache as django_cache
+
+from openstack_auth import utils as auth_utils
 
 from horizon import exceptions
 
 
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
-           'get_service_from_catalog', 'url_for',)
+           'get_service_from_catalog', 'url_for', 'cached_client',
+           'shared_memoized',)
 
 
 LOG = logging.getLogger(__name__)
@@ -284,3 +294,228 @@ def is_service_enabled(request, service_type, service_name=None):
                 else:
                     return True
     return False
+
+
+class ClientCache(object):
+    """A bounded, per-process LRU cache of API client objects.
+
+    Building a client for every API call means a new HTTP connection (and TLS
+    handshake) each time. Clients are instead kept here, keyed by the service,
+    the token, the endpoint and the SSL options, so that keep-alive
+    connections are reused across calls and across requests made with the
+    same token. Entries are dropped once their token expires.
+
+    Several of the underlying HTTP clients (httplib2, swiftclient's
+    connection) are not thread-safe, so a client is only ever shared with
+    later calls made from the same thread.
+
+    The size of the cache is controlled by the ``API_CLIENT_CACHE_SIZE``
+    setting; a size of ``0`` disables caching altogether.
+    """
+
+    def __init__(self, max_size=None):
+        self._max_size = max_size
+        self._clients = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self):
+        if self._max_size is None:
+            return getattr(settings, 'API_CLIENT_CACHE_SIZE', 100)
+        return self._max_size
+
+    def get(self, request, service_type, endpoint, factory, *extra_key):
+        """Returns a cached client, creating it with ``factory()`` if needed.
+
+        ``extra_key`` holds any further values the client depends on (an API
+        version, for instance).
+        """
+        if self.max_size < 1:
+            return factory()
+        token = request.user.token
+        key = (service_type, token.id, endpoint,
+               getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False),
+               getattr(settings, 'OPENSTACK_SSL_CACERT', None),
+               thread.get_ident()) + extra_key
+        with self._lock:
+            entry = self._clients.pop(key, None)
+            if entry is not None and self._is_valid(entry[0]):
+                self._clients[key] = entry
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        client = factory()
+        with self._lock:
+            self._clients[key] = (token, client)
+            self._evict()
+        return client
+
+    def _is_valid(self, token):
+        return getattr(token, 'expires', None) is not None and \
+            auth_utils.is_token_valid(token)
+
+    def _evict(self):
+        if len(self._clients) <= self.max_size:
+            return
+        for key, (token, client) in self._clients.items():
+            if not self._is_valid(token):
+                del self._clients[key]
+                self.evictions += 1
+        while len(self._clients) > self.max_size:
+            self._clients.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self):
+        return {'size': len(self._clients),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+
+CLIENT_CACHE = ClientCache()
+
+
+def cached_client(request, service_type, endpoint, factory, *extra_key):
+    """Returns a client for ``service_type`` from the shared client cache.
+
+    See :class:`ClientCache`.
+    """
+    return CLIENT_CACHE.get(request, service_type, endpoint, factory,
+                            *extra_key)
+
+
+# How long a caller waits for another process to fill a shared cache entry
+# before fetching the data itself, and how long such a fill may take before
+# its lock is considered stale.
+SHARED_CACHE_LOCK_WAIT = 2
+SHARED_CACHE_LOCK_TIMEOUT = 30
+# Must outlive any cached entry, see shared_memoized's invalidate().
+SHARED_CACHE_GENERATION_TIMEOUT = 86400
+
+
+def shared_cache():
+    """Returns the Django cache backend used by :func:`shared_memoized`.
+
+    This is the ``API_CACHE_BACKEND`` alias from ``CACHES``, which defaults to
+    ``"default"``.
+    """
+    return django_cache.get_cache(getattr(settings, 'API_CACHE_BACKEND',
+                                          'default'))
+
+
+def _shared_cache_key(*parts):
+    return "horizon:api:%s" % hashlib.md5(repr(parts)).hexdigest()
+
+
+def _pack_resources(resources):
+    return [(resource.__class__, resource._info) for resource in resources]
+
+
+def shared_memoized(service_type, timeout, per_project=False, manager=None):
+    """Decorator caching an API call across requests in Django's cache.
+
+    :func:`horizon.utils.memoized.memoized` only lasts for a single request.
+    Slow-changing data (flavors, extension lists...) can instead be kept in
+    the configured cache backend (locmem, memcached...) for ``timeout``
+    seconds so that it is fetched once for all requests and, with a shared
+    backend, all processes.
+
+    Entries are scoped to the endpoint of ``service_type``; with
+    ``per_project`` they are also scoped to the user's project and roles.
+    The timeout can be overridden (``0`` disables caching) through the
+    ``API_CACHE_TIMEOUTS`` setting, keyed by ``"<module>.<function>"``, e.g.
+    ``"nova.flavor_list"``.
+
+    API client resources are not picklable, so when ``manager`` is given
+    the results are stored as their raw ``_info`` dicts and rebuilt with
+    ``manager(request)`` when read back.
+
+    The decorated function gains an ``invalidate(request)`` method, which
+    drops every cached variant of the call for the request's endpoint and
+    should be called whenever Horizon changes the underlying data.
+    """
+    def decorator(func):
+        name = "%s.%s" % (func.__module__.rsplit('.', 1)[-1], func.__name__)
+
+        def get_timeout():
+            timeouts = getattr(settings, 'API_CACHE_TIMEOUTS', {})
+            return timeouts.get(name, timeout)
+
+        def generation_key(endpoint):
+            return _shared_cache_key('generation', name, endpoint)
+
+        def get_endpoint(request):
+            try:
+                return url_for(request, service_type)
+            except exceptions.ServiceCatalogException:
+                return None
+
+        def unpack(request, value):
+            if manager is None:
+                return value
+            resource_manager = manager(request)
+            return [cls(resource_manager, info, loaded=True)
+                    for cls, info in value]
+
+        def fetch(cache, request, key, cache_timeout, args, kwargs):
+            result = func(request, *args, **kwargs)
+            value = _pack_resources(result) if manager else result
+            cache.set(key, (value,), cache_timeout)
+            return result
+
+        @functools.wraps(func)
+        def wrapped(request, *args, **kwargs):
+            cache_timeout = get_timeout()
+            endpoint = get_endpoint(request)
+            if not cache_timeout or endpoint is None:
+                return func(request, *args, **kwargs)
+            cache = shared_cache()
+
+            scope = [endpoint, cache.get(generation_key(endpoint), 0)]
+            if per_project:
+                roles = sorted(role['name'] for role in
+                               getattr(request.user, 'roles', []))
+                scope += [request.user.tenant_id, roles]
+            key = _shared_cache_key(name, scope, args, sorted(kwargs.items()))
+
+            cached = cache.get(key)
+            if cached is not None:
+                return unpack(request, cached[0])
+
+            # Only one caller refills an expired entry; the others wait a
+            # little for it rather than all hitting the API at once.
+            lock_key = key + ":lock"
+            if cache.add(lock_key, True, SHARED_CACHE_LOCK_TIMEOUT):
+                try:
+                    return fetch(cache, request, key, cache_timeout, args,
+                                 kwargs)
+                finally:
+                    cache.delete(lock_key)
+            deadline = time.time() + SHARED_CACHE_LOCK_WAIT
+            while time.time() < deadline:
+                time.sleep(0.05)
+                cached = cache.get(key)
+                if cached is not None:
+                    return unpack(request, cached[0])
+            return fetch(cache, request, key, cache_timeout, args, kwargs)
+
+        def invalidate(request):
+            endpoint = get_endpoint(request)
+            if endpoint is None:
+                return
+            # Move to a new generation rather than deleting entries: every
+            # project/argument variant then misses at once.
+            shared_cache().set(generation_key(endpoint), time.time(),
+                               SHARED_CACHE_GENERATION_TIMEOUT)
+
+        wrapped.invalidate = invalidate
+        return wrapped
+    return decorator
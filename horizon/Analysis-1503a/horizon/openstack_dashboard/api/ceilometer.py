@@ -13,7 +13,7 @@
 # under the License.
 
 import logging
-import threading
+import sys
 
 from ceilometerclient import client as ceilometer_client
 from django.conf import settings
@@ -21,6 +21,7 @@ from django.utils import datastructures
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import keystone
@@ -260,12 +261,14 @@ def ceilometerclient(request):
     endpoint = base.url_for(request, 'metering')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
+    timeout = _statistics_config().get('timeout')
     LOG.debug('ceilometerclient connection created using token "%s" '
               'and endpoint "%s"' % (request.user.token.id, endpoint))
     return ceilometer_client.Client('2', endpoint,
                                     token=(lambda: request.user.token.id),
                                     insecure=insecure,
-                                    ca_file=cacert)
+                                    ca_file=cacert,
+                                    timeout=timeout)
 
 
 def resource_list(request, query=None, ceilometer_usage_object=None):
@@ -295,19 +298,33 @@ def statistic_list(request, meter_name, query=None, period=None):
     return [Statistic(s) for s in statistics]
 
 
-class ThreadedUpdateResourceWithStatistics(threading.Thread):
+def _statistics_config():
+    return getattr(settings, 'OPENSTACK_CEILOMETER_STATISTICS', {})
+
+
+class ThreadedUpdateResourceWithStatistics(object):
     """Multithread wrapper for update_with_statistics method of
     resource_usage.
 
-    A join logic is placed in process_list class method. All resources
-    will have its statistics attribute filled in separate threads.
+    The process_list class method fills the statistics attributes of all
+    resources using a bounded pool of worker threads, configured by the
+    ``OPENSTACK_CEILOMETER_STATISTICS`` setting:
+
+      - `max_workers`: Maximum number of concurrent statistics jobs.
+      - `meters_per_job`: Number of meters of one resource fetched by a
+                          single job. By default all meters of a resource
+                          are fetched by the same job.
+      - `timeout`: Timeout in seconds of each call to the Ceilometer API.
 
-    The resource_usage object is shared between threads. Each thread is
+    The resource_usage object is shared between threads. Each job is
     updating one Resource.
 
+    If some of the jobs fail, the meters they were fetching are set to None
+    on their resources and the failures are logged, so that the other
+    results can still be displayed. Only if every job fails is the error
+    raised.
+
     :Parameters:
-      - `resource`: Resource or ResourceAggregate object, that will
-                    be filled by statistic data.
       - `resources`: List of Resource or ResourceAggregate object,
                      that will be filled by statistic data.
       - `resource_usage`: Wrapping resource usage object, that holds
@@ -327,39 +344,44 @@ class ThreadedUpdateResourceWithStatistics(threading.Thread):
     # and group-by, so all of this optimization will not be necessary.
     # It is planned somewhere to I.
 
-    def __init__(self, resource_usage, resource, meter_names=None,
-                 period=None, filter_func=None, stats_attr=None,
-                 additional_query=None):
-        super(ThreadedUpdateResourceWithStatistics, self).__init__()
-        self.resource_usage = resource_usage
-        self.resource = resource
-        self.meter_names = meter_names
-        self.period = period
-        self.stats_attr = stats_attr
-        self.additional_query = additional_query
-
-    def run(self):
-        # Run the job
-        self.resource_usage.update_with_statistics(self.resource,
-            meter_names=self.meter_names, period=self.period,
-            stats_attr=self.stats_attr, additional_query=self.additional_query)
-
     @classmethod
     def process_list(cls, resource_usage, resources, meter_names=None,
                  period=None, filter_func=None, stats_attr=None,
                  additional_query=None):
-        threads = []
-
-        for resource in resources:
-            # add statistics data into resource
-            thread = cls(resource_usage, resource, meter_names=meter_names,
-                period=period, stats_attr=stats_attr,
-                additional_query=additional_query)
-            thread.start()
-            threads.append(thread)
-
-        for thread in threads:
-            thread.join()
+        config = _statistics_config()
+        meters_per_job = config.get('meters_per_job') or \
+            len(meter_names or []) or 1
+        meter_batches = [meter_names[i:i + meters_per_job] for i in
+                         range(0, len(meter_names), meters_per_job)] \
+            if meter_names else [meter_names]
+
+        jobs = []
+        with concurrency.Executor(config.get('max_workers', 10)) as executor:
+            for resource in resources:
+                for meters in meter_batches:
+                    # add statistics data into resource
+                    job = executor.submit(
+                        resource_usage.update_with_statistics, resource,
+                        meter_names=meters, period=period,
+                        stats_attr=stats_attr,
+                        additional_query=additional_query)
+                    jobs.append((resource, meters, job))
+
+        failures = []
+        for resource, meters, job in jobs:
+            try:
+                job.result()
+            except Exception:
+                failures.append(sys.exc_info())
+                LOG.warning("Unable to retrieve statistics %s for resource "
+                            "%s: %s" % (meters, resource.id,
+                                        failures[-1][1]))
+                for meter in meters or []:
+                    setattr(resource, meter.replace(".", "_"), None)
+
+        if failures and len(failures) == len(jobs):
+            exc_type, exc_value, exc_traceback = failures[0]
+            raise exc_type, exc_value, exc_traceback
 
 
 class CeilometerUsage(object):
@@ -114,18 +114,22 @@ def cinderclient(request):
     except exceptions.ServiceCatalogException:
         LOG.debug('no volume service configured.')
         return None
-    LOG.debug('cinderclient connection created using token "%s" and url "%s"' %
-              (request.user.token.id, cinder_url))
-    c = api_version['client'].Client(request.user.username,
-                                     request.user.token.id,
-                                     project_id=request.user.tenant_id,
-                                     auth_url=cinder_url,
-                                     insecure=insecure,
-                                     cacert=cacert,
-                                     http_log_debug=settings.DEBUG)
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = cinder_url
-    return c
+
+    def create():
+        LOG.debug('cinderclient connection created using token "%s" and url '
+                  '"%s"' % (request.user.token.id, cinder_url))
+        c = api_version['client'].Client(request.user.username,
+                                         request.user.token.id,
+                                         project_id=request.user.tenant_id,
+                                         auth_url=cinder_url,
+                                         insecure=insecure,
+                                         cacert=cacert,
+                                         http_log_debug=settings.DEBUG)
+        c.client.auth_token = request.user.token.id
+        c.client.management_url = cinder_url
+        return c
+    return base.cached_client(request, 'volume', cinder_url, create,
+                              api_version['version'])
 
 
 def _replace_v2_parameters(data):
@@ -137,14 +141,27 @@ def _replace_v2_parameters(data):
     return data
 
 
-def volume_list(request, search_opts=None):
+def volume_list(request, search_opts=None, sort_key=None, sort_dir=None):
     """To see all volumes in the cloud as an admin you can pass in a special
     search option: {'all_tenants': 1}
+
+    The volumes are sorted on ``sort_key`` (e.g. ``'name'``) by Cinder if it
+    supports it (API v2), and here otherwise.
     """
     c_client = cinderclient(request)
     if c_client is None:
         return []
-    return [Volume(v) for v in c_client.volumes.list(search_opts=search_opts)]
+    if sort_key and VERSIONS.active >= 2:
+        volumes = c_client.volumes.list(search_opts=search_opts,
+                                        sort_key=sort_key,
+                                        sort_dir=sort_dir or 'asc')
+        return [Volume(v) for v in volumes]
+    volumes = [Volume(v)
+               for v in c_client.volumes.list(search_opts=search_opts)]
+    if sort_key:
+        volumes.sort(key=lambda volume: getattr(volume, sort_key, None),
+                     reverse=(sort_dir == 'desc'))
+    return volumes
 
 
 def volume_get(request, volume_id):
@@ -273,6 +290,9 @@ def availability_zone_list(request, detailed=False):
 
 
 @memoized
+@base.shared_memoized('volume', 600,
+                      manager=lambda request: cinder_list_extensions
+                      .ListExtManager(cinderclient(request)))
 def list_extensions(request):
     return cinder_list_extensions.ListExtManager(cinderclient(request))\
         .show_all()
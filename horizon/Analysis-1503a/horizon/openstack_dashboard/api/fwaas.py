@@ -16,8 +16,6 @@
 
 from __future__ import absolute_import
 
-from django.utils.datastructures import SortedDict
-
 from openstack_dashboard.api import neutron
 
 neutronclient = neutron.neutronclient
@@ -72,6 +70,22 @@ def rule_create(request, **kwargs):
     return Rule(rule)
 
 
+def _expand_policies(request, ids):
+    return neutron.expand(request, 'firewall_policy', _list_policies, ids)
+
+
+def _list_policies(request, **kwargs):
+    return _policy_list(request, expand_rule=False, **kwargs)
+
+
+def _expand_rules(request, ids):
+    return neutron.expand(request, 'firewall_rule', _list_rules, ids)
+
+
+def _list_rules(request, **kwargs):
+    return _rule_list(request, expand_policy=False, **kwargs)
+
+
 def rule_list(request, **kwargs):
     return _rule_list(request, expand_policy=True, **kwargs)
 
@@ -80,8 +94,8 @@ def _rule_list(request, expand_policy, **kwargs):
     rules = neutronclient(request).list_firewall_rules(
         **kwargs).get('firewall_rules')
     if expand_policy:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = SortedDict((p.id, p) for p in policies)
+        policy_dict = _expand_policies(
+            request, [rule['firewall_policy_id'] for rule in rules])
         for rule in rules:
             rule['policy'] = policy_dict.get(rule['firewall_policy_id'])
     return [Rule(r) for r in rules]
@@ -139,8 +153,8 @@ def _policy_list(request, expand_rule, **kwargs):
     policies = neutronclient(request).list_firewall_policies(
         **kwargs).get('firewall_policies')
     if expand_rule:
-        rules = _rule_list(request, expand_policy=False)
-        rule_dict = SortedDict((rule.id, rule) for rule in rules)
+        rule_dict = _expand_rules(
+            request, [rule for p in policies for rule in p['firewall_rules']])
         for p in policies:
             p['rules'] = [rule_dict.get(rule) for rule in p['firewall_rules']]
     return [Policy(p) for p in policies]
@@ -156,9 +170,7 @@ def _policy_get(request, policy_id, expand_rule):
     if expand_rule:
         policy_rules = policy['firewall_rules']
         if policy_rules:
-            rules = _rule_list(request, expand_policy=False,
-                               firewall_policy_id=policy_id)
-            rule_dict = SortedDict((rule.id, rule) for rule in rules)
+            rule_dict = _expand_rules(request, policy_rules)
             policy['rules'] = [rule_dict.get(rule) for rule in policy_rules]
         else:
             policy['rules'] = []
@@ -212,8 +224,8 @@ def _firewall_list(request, expand_policy, **kwargs):
     firewalls = neutronclient(request).list_firewalls(
         **kwargs).get('firewalls')
     if expand_policy:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = SortedDict((p.id, p) for p in policies)
+        policy_dict = _expand_policies(
+            request, [fw['firewall_policy_id'] for fw in firewalls])
         for fw in firewalls:
             fw['policy'] = policy_dict.get(fw['firewall_policy_id'])
     return [Firewall(f) for f in firewalls]
@@ -42,14 +42,24 @@ def glanceclient(request):
     url = "://".join((o.scheme, o.netloc))
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    LOG.debug('glanceclient connection created using token "%s" and url "%s"'
-              % (request.user.token.id, url))
-    return glance_client.Client('1', url, token=request.user.token.id,
-                                insecure=insecure, cacert=cacert)
+
+    def create():
+        LOG.debug('glanceclient connection created using token "%s" and url '
+                  '"%s"' % (request.user.token.id, url))
+        return glance_client.Client('1', url, token=request.user.token.id,
+                                    insecure=insecure, cacert=cacert)
+    return base.cached_client(request, 'image', url, create)
+
+
+def _invalidate_image_lists(request):
+    image_list_public.invalidate(request)
+    image_list_owned.invalidate(request)
 
 
 def image_delete(request, image_id):
-    return glanceclient(request).images.delete(image_id)
+    result = glanceclient(request).images.delete(image_id)
+    _invalidate_image_lists(request)
+    return result
 
 
 def image_get(request, image_id):
@@ -62,7 +72,14 @@ def image_get(request, image_id):
     return image
 
 
-def image_list_detailed(request, marker=None, filters=None, paginate=False):
+def image_list_detailed(request, marker=None, filters=None, paginate=False,
+                        sort_key=None, sort_dir=None, prev_marker=None):
+    """Lists images, optionally sorted by Glance on ``sort_key``.
+
+    A page starts after ``marker``, or ends before ``prev_marker`` when
+    paging backwards; in the latter case ``has_more_data`` tells whether
+    there are more pages before it.
+    """
     limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
     page_size = utils.get_page_size(request)
 
@@ -72,8 +89,18 @@ def image_list_detailed(request, marker=None, filters=None, paginate=False):
         request_size = limit
 
     kwargs = {'filters': filters or {}}
+    if prev_marker:
+        # Glance only pages forwards, so list the previous page in the
+        # opposite order and put it back the right way round.
+        marker = prev_marker
+        sort_key = sort_key or 'created_at'
+        sort_dir = 'desc' if sort_dir == 'asc' else 'asc'
     if marker:
         kwargs['marker'] = marker
+    if sort_key:
+        kwargs['sort_key'] = sort_key
+    if sort_dir:
+        kwargs['sort_dir'] = sort_dir
 
     images_iter = glanceclient(request).images.list(page_size=request_size,
                                                     limit=limit,
@@ -86,11 +113,43 @@ def image_list_detailed(request, marker=None, filters=None, paginate=False):
             has_more_data = True
     else:
         images = list(images_iter)
+    if prev_marker:
+        images.reverse()
     return (images, has_more_data)
 
 
+@base.shared_memoized('image', 60,
+                      manager=lambda request: glanceclient(request).images)
+def image_list_public(request):
+    """Lists the active public images.
+
+    The list is the same for every user of a region, so it is shared
+    between them for a short while (see ``API_CACHE_TIMEOUTS``).
+    """
+    images, _more = image_list_detailed(request,
+                                        filters={'is_public': True,
+                                                 'status': 'active'})
+    return images
+
+
+@base.shared_memoized('image', 30, per_project=True,
+                      manager=lambda request: glanceclient(request).images)
+def image_list_owned(request, project_id):
+    """Lists the active images owned by the given project.
+
+    The list is shared between the users of the project for a short while.
+    """
+    images, _more = image_list_detailed(request,
+                                        filters={'property-owner_id':
+                                                 project_id,
+                                                 'status': 'active'})
+    return images
+
+
 def image_update(request, image_id, **kwargs):
-    return glanceclient(request).images.update(image_id, **kwargs)
+    image = glanceclient(request).images.update(image_id, **kwargs)
+    _invalidate_image_lists(request)
+    return image
 
 
 def image_create(request, **kwargs):
@@ -98,6 +157,7 @@ def image_create(request, **kwargs):
     data = kwargs.pop('data', None)
 
     image = glanceclient(request).images.create(**kwargs)
+    _invalidate_image_lists(request)
 
     if data:
         thread.start_new_thread(image_update,
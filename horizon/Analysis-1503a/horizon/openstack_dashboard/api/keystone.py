@@ -19,6 +19,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import logging
 
 from django.conf import settings
@@ -32,6 +33,7 @@ from openstack_auth import utils as auth_utils
 
 from horizon import exceptions
 from horizon import messages
+from horizon.utils import concurrency
 from horizon.utils import functions as utils
 
 from openstack_dashboard.api import base
@@ -501,6 +503,33 @@ def roles_for_user(request, user, project):
         return manager.list(user=user, project=project)
 
 
+def get_project_users_roles(request, project):
+    """Returns an ordered dict mapping each user of a project to its role ids.
+
+    On Keystone v3 every direct user assignment on the project is fetched
+    with a single role assignments call. Older Keystone versions have no
+    such call, so the project's users are listed and their roles fetched
+    concurrently instead.
+    """
+    users_roles = collections.OrderedDict()
+    if VERSIONS.active < 3:
+        users = user_list(request, project=project)
+        with concurrency.Executor() as executor:
+            futures = [(user.id, executor.submit(roles_for_user, request,
+                                                 user.id, project))
+                       for user in users]
+        for user_id, future in futures:
+            users_roles[user_id] = [role.id for role in future.result()]
+    else:
+        manager = keystoneclient(request, admin=True).role_assignments
+        for assignment in manager.list(project=project):
+            # Roles granted through a group carry a "group" key instead.
+            if hasattr(assignment, 'user'):
+                users_roles.setdefault(assignment.user['id'], []).append(
+                    assignment.role['id'])
+    return users_roles
+
+
 def add_tenant_user_role(request, project=None, user=None, role=None,
                          group=None, domain=None):
     """Adds a role for a user on a tenant."""
@@ -16,7 +16,7 @@
 
 from __future__ import absolute_import
 
-from django.utils.datastructures import SortedDict
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import neutron
 
@@ -145,6 +145,18 @@ def _get_vip_name(request, pool, vip_dict):
         return None
 
 
+def _expand_subnets(request, ids):
+    return neutron.expand(request, 'subnet', neutron.subnet_list, ids)
+
+
+def _expand_vips(request, ids):
+    return neutron.expand(request, 'vip', vip_list, ids)
+
+
+def _expand_pools(request, ids):
+    return neutron.expand(request, 'pool', _pool_list, ids)
+
+
 def pool_list(request, **kwargs):
     return _pool_list(request, expand_subnet=True, expand_vip=True, **kwargs)
 
@@ -152,13 +164,12 @@ def pool_list(request, **kwargs):
 def _pool_list(request, expand_subnet=False, expand_vip=False, **kwargs):
     pools = neutronclient(request).list_pools(**kwargs).get('pools')
     if expand_subnet:
-        subnets = neutron.subnet_list(request)
-        subnet_dict = SortedDict((s.id, s) for s in subnets)
+        subnet_dict = _expand_subnets(request,
+                                      [p['subnet_id'] for p in pools])
         for p in pools:
             p['subnet_name'] = subnet_dict.get(p['subnet_id']).cidr
     if expand_vip:
-        vips = vip_list(request)
-        vip_dict = SortedDict((v.id, v) for v in vips)
+        vip_dict = _expand_vips(request, [p['vip_id'] for p in pools])
         for p in pools:
             p['vip_name'] = _get_vip_name(request, p, vip_dict)
     return [Pool(p) for p in pools]
@@ -266,6 +277,30 @@ def member_create(request, **kwargs):
     return Member(member)
 
 
+def member_create_bulk(request, members, max_workers=None):
+    """Create several load balance members concurrently
+
+    :param request: request context
+    :param members: list of keyword arguments for :func:`member_create`,
+                    one dict per member
+    :param max_workers: maximum number of members created at the same time,
+                        defaults to the API_CONCURRENCY_MAX_WORKERS setting
+    :returns: list of ``(member, error)`` tuples in the order of
+              ``members``; ``error`` is the exception raised creating the
+              member, in which case ``member`` is None
+    """
+    with concurrency.Executor(max_workers) as executor:
+        futures = [executor.submit(member_create, request, **kwargs)
+                   for kwargs in members]
+    results = []
+    for future in futures:
+        try:
+            results.append((future.result(), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
 def member_list(request, **kwargs):
     return _member_list(request, expand_pool=True, **kwargs)
 
@@ -273,8 +308,7 @@ def member_list(request, **kwargs):
 def _member_list(request, expand_pool, **kwargs):
     members = neutronclient(request).list_members(**kwargs).get('members')
     if expand_pool:
-        pools = _pool_list(request)
-        pool_dict = SortedDict((p.id, p) for p in pools)
+        pool_dict = _expand_pools(request, [m['pool_id'] for m in members])
         for m in members:
             m['pool_name'] = pool_dict.get(m['pool_id']).name
     return [Member(m) for m in members]
@@ -76,6 +76,16 @@ def floating_ip_target_list(request):
     return NetworkClient(request).floating_ips.list_targets()
 
 
+def floating_ip_target_list_page(request, search=None, marker=None,
+                                 limit=None):
+    return NetworkClient(request).floating_ips.list_targets_page(
+        search=search, marker=marker, limit=limit)
+
+
+def floating_ip_target_get(request, target_id):
+    return NetworkClient(request).floating_ips.get_target(target_id)
+
+
 def floating_ip_target_get_by_instance(request, instance_id):
     return NetworkClient(request).floating_ips.get_target_id_by_instance(
         instance_id)
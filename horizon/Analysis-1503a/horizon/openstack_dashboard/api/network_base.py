@@ -24,6 +24,23 @@ methods defined in this module.
 import abc
 
 
+def page_targets(targets, marker=None, limit=None):
+    """Orders floating IP association targets by name and pages them.
+
+    Returns a ``(targets, has_more)`` tuple holding at most ``limit``
+    targets which follow the target whose id is ``marker``.
+    """
+    targets = sorted(targets, key=lambda target: (target.name, target.id))
+    if marker:
+        ids = [target.id for target in targets]
+        if marker not in ids:
+            return [], False
+        targets = targets[ids.index(marker) + 1:]
+    if limit is None:
+        return targets, False
+    return targets[:limit], len(targets) > limit
+
+
 class FloatingIpManager(object):
     """Abstract class to implement Floating IP methods
 
@@ -111,6 +128,31 @@ class FloatingIpManager(object):
         """
         pass
 
+    def list_targets_page(self, search=None, marker=None, limit=None):
+        """Returns a page of association targets ordered by name.
+
+        Only the targets whose name contains ``search`` are listed, starting
+        after the target whose id is ``marker``. It returns a tuple of the
+        targets and whether more of them follow. Backends which can narrow
+        the listing down on the server side should override this method.
+        """
+        targets = self.list_targets()
+        if search:
+            search = search.lower()
+            targets = [target for target in targets
+                       if search in target.name.lower()]
+        return page_targets(targets, marker, limit)
+
+    def get_target(self, target_id):
+        """Returns the association target whose id is target_id.
+
+        None is returned if the target is not available to the tenant.
+        """
+        for target in self.list_targets():
+            if target.id == target_id:
+                return target
+        return None
+
     @abc.abstractmethod
     def get_target_id_by_instance(self, instance_id):
         """Returns a target ID of floating IP association based on
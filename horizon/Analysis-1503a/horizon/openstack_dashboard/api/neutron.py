@@ -24,6 +24,7 @@ from __future__ import absolute_import
 import collections
 import logging
 import netaddr
+import re
 
 from django.conf import settings
 from django.utils.datastructures import SortedDict
@@ -374,24 +375,61 @@ class FloatingIpManager(network_base.FloatingIpManager):
         self.client.update_floatingip(floating_ip_id,
                                       {'floatingip': update_dict})
 
-    def list_targets(self):
-        tenant_id = self.request.user.tenant_id
-        ports = port_list(self.request, tenant_id=tenant_id)
-        servers, has_more = nova.server_list(self.request)
-        server_dict = SortedDict([(s.id, s.name) for s in servers])
+    def _target_ports(self, **params):
+        ports = port_list(self.request,
+                          tenant_id=self.request.user.tenant_id,
+                          **params)
+        # Only the ports of instances can be associated with floating IPs.
+        return [p for p in ports if p.device_owner.startswith('compute:')]
+
+    def _server_names(self, device_ids):
+        server_names = nova.server_name_index(self.request)
+        if not set(device_ids).issubset(server_names):
+            # Some of the instances were launched after the index was built.
+            nova.server_name_index.invalidate(self.request)
+            server_names = nova.server_name_index(self.request)
+        return server_names
+
+    def _targets(self, ports, server_names):
         targets = []
         for p in ports:
-            # Remove network ports from Floating IP targets
-            if p.device_owner.startswith('network:'):
-                continue
-            port_id = p.id
-            server_name = server_dict.get(p.device_id)
+            server_name = server_names.get(p.device_id)
             for ip in p.fixed_ips:
                 target = {'name': '%s: %s' % (server_name, ip['ip_address']),
-                          'id': '%s_%s' % (port_id, ip['ip_address'])}
+                          'id': '%s_%s' % (p.id, ip['ip_address'])}
                 targets.append(FloatingIpTarget(target))
         return targets
 
+    def list_targets(self):
+        ports = self._target_ports()
+        server_names = self._server_names(p.device_id for p in ports)
+        return self._targets(ports, server_names)
+
+    def list_targets_page(self, search=None, marker=None, limit=None):
+        if not search:
+            return network_base.page_targets(self.list_targets(),
+                                             marker, limit)
+        # Let Nova find the matching instances and only list their ports.
+        # Nova matches the name against a regular expression.
+        servers, has_more = nova.server_list(
+            self.request, search_opts={'name': re.escape(search)})
+        if not servers:
+            return [], False
+        server_names = dict((s.id, s.name) for s in servers)
+        ports = self._target_ports(device_id=server_names.keys())
+        return network_base.page_targets(self._targets(ports, server_names),
+                                         marker, limit)
+
+    def get_target(self, target_id):
+        # Target ids are made of a port id and one of its fixed IPs.
+        ports = self._target_ports(id=target_id.split('_', 1)[0])
+        targets = self._targets(ports, self._server_names(
+            p.device_id for p in ports))
+        for target in targets:
+            if target.id == target_id:
+                return target
+        return None
+
     def _target_ports_by_instance(self, instance_id):
         if not instance_id:
             return None
@@ -431,26 +469,93 @@ def get_ipver_str(ip_version):
 def neutronclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    LOG.debug('neutronclient connection created using token "%s" and url "%s"'
-              % (request.user.token.id, base.url_for(request, 'network')))
-    LOG.debug('user_id=%(user)s, tenant_id=%(tenant)s' %
-              {'user': request.user.id, 'tenant': request.user.tenant_id})
-    c = neutron_client.Client(token=request.user.token.id,
-                              auth_url=base.url_for(request, 'identity'),
-                              endpoint_url=base.url_for(request, 'network'),
-                              insecure=insecure, ca_cert=cacert)
-    return c
-
-
-def network_list(request, **params):
+    neutron_url = base.url_for(request, 'network')
+
+    def create():
+        LOG.debug('neutronclient connection created using token "%s" and url '
+                  '"%s"' % (request.user.token.id, neutron_url))
+        LOG.debug('user_id=%(user)s, tenant_id=%(tenant)s' %
+                  {'user': request.user.id,
+                   'tenant': request.user.tenant_id})
+        return neutron_client.Client(
+            token=request.user.token.id,
+            auth_url=base.url_for(request, 'identity'),
+            endpoint_url=neutron_url,
+            insecure=insecure, ca_cert=cacert)
+    return base.cached_client(request, 'network', neutron_url, create)
+
+
+class ExpansionRegistry(object):
+    """Request-scoped store of the resources other resources refer to.
+
+    Lists of pools, members, firewalls, VPN services and so on are labelled
+    with the subnets, VIPs, policies... they reference. Rather than listing
+    each of those collections in full every time, the registry asks Neutron
+    only for the referenced ids (with ``id`` filters) and remembers what it
+    got for the rest of the request, so a collection is never fetched twice
+    for the same id.
+
+    Use :func:`expand` instead of instantiating this class directly.
+    """
+    # Keeps the query strings of the filtered lists to a sensible length.
+    chunk_size = 100
+
+    def __init__(self):
+        self._resources = {}
+
+    @classmethod
+    def for_request(cls, request):
+        registry = getattr(request, '_neutron_expansions', None)
+        if registry is None:
+            registry = cls()
+            request._neutron_expansions = registry
+        return registry
+
+    def lookup(self, request, kind, lister, ids):
+        known = self._resources.setdefault(kind, {})
+        missing = []
+        for resource_id in ids:
+            if (resource_id and resource_id not in known and
+                    resource_id not in missing):
+                missing.append(resource_id)
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start:start + self.chunk_size]
+            found = dict((r.id, r) for r in lister(request, id=chunk))
+            for resource_id in chunk:
+                known[resource_id] = found.get(resource_id)
+        return dict((resource_id, known[resource_id])
+                    for resource_id in ids if resource_id)
+
+
+def expand(request, kind, lister, ids):
+    """Returns a dictionary of the referenced resources of a kind by id.
+
+    :param request: request context; resources are only fetched once for
+                    each request
+    :param kind: name under which the resources are remembered, e.g.
+                 ``'subnet'``
+    :param lister: function called as ``lister(request, id=[...])`` to list
+                   the resources which haven't been fetched yet
+    :param ids: ids of the referenced resources; empty ids are skipped
+    :returns: dict mapping each id to its resource, or to None if Neutron
+              didn't return it
+    """
+    return ExpansionRegistry.for_request(request).lookup(request, kind,
+                                                         lister, ids)
+
+
+def network_list(request, expand_subnet=True, **params):
     LOG.debug("network_list(): params=%s" % (params))
     networks = neutronclient(request).list_networks(**params).get('networks')
-    # Get subnet list to expand subnet info in network list.
-    subnets = subnet_list(request)
-    subnet_dict = SortedDict([(s['id'], s) for s in subnets])
-    # Expand subnet list from subnet_id to values.
-    for n in networks:
-        n['subnets'] = [subnet_dict.get(s) for s in n.get('subnets', [])]
+    # Callers that list networks several times (or already hold the
+    # subnets) can skip the expansion and leave subnet ids in place.
+    if expand_subnet:
+        # Get subnet list to expand subnet info in network list.
+        subnets = subnet_list(request)
+        subnet_dict = SortedDict([(s['id'], s) for s in subnets])
+        # Expand subnet list from subnet_id to values.
+        for n in networks:
+            n['subnets'] = [subnet_dict.get(s) for s in n.get('subnets', [])]
     return [Network(n) for n in networks]
 
 
@@ -828,6 +933,7 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
 
 
 @memoized
+@base.shared_memoized('network', 600)
 def list_extensions(request):
     extensions_list = neutronclient(request).list_extensions()
     if 'extensions' in extensions_list:
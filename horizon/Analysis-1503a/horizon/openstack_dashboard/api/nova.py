@@ -372,18 +372,22 @@ class FloatingIpManager(network_base.FloatingIpManager):
 def novaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    LOG.debug('novaclient connection created using token "%s" and url "%s"' %
-              (request.user.token.id, base.url_for(request, 'compute')))
-    c = nova_client.Client(request.user.username,
-                           request.user.token.id,
-                           project_id=request.user.tenant_id,
-                           auth_url=base.url_for(request, 'compute'),
-                           insecure=insecure,
-                           cacert=cacert,
-                           http_log_debug=settings.DEBUG)
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = base.url_for(request, 'compute')
-    return c
+    nova_url = base.url_for(request, 'compute')
+
+    def create():
+        LOG.debug('novaclient connection created using token "%s" and url '
+                  '"%s"' % (request.user.token.id, nova_url))
+        c = nova_client.Client(request.user.username,
+                               request.user.token.id,
+                               project_id=request.user.tenant_id,
+                               auth_url=nova_url,
+                               insecure=insecure,
+                               cacert=cacert,
+                               http_log_debug=settings.DEBUG)
+        c.client.auth_token = request.user.token.id
+        c.client.management_url = nova_url
+        return c
+    return base.cached_client(request, 'compute', nova_url, create)
 
 
 def server_vnc_console(request, instance_id, console_type='novnc'):
@@ -409,11 +413,13 @@ def flavor_create(request, name, memory, vcpu, disk, flavorid='auto',
                                                 swap=swap, is_public=is_public)
     if (metadata):
         flavor_extra_set(request, flavor.id, metadata)
+    flavor_list.invalidate(request)
     return flavor
 
 
 def flavor_delete(request, flavor_id):
     novaclient(request).flavors.delete(flavor_id)
+    flavor_list.invalidate(request)
 
 
 def flavor_get(request, flavor_id):
@@ -421,6 +427,8 @@ def flavor_get(request, flavor_id):
 
 
 @memoized
+@base.shared_memoized('compute', 120, per_project=True,
+                      manager=lambda request: novaclient(request).flavors)
 def flavor_list(request, is_public=True):
     """Get the list of available instance sizes (flavors)."""
     return novaclient(request).flavors.list(is_public=is_public)
@@ -434,14 +442,18 @@ def flavor_access_list(request, flavor=None):
 
 def add_tenant_to_flavor(request, flavor, tenant):
     """Add a tenant to the given flavor access list."""
-    return novaclient(request).flavor_access.add_tenant_access(
+    access = novaclient(request).flavor_access.add_tenant_access(
         flavor=flavor, tenant=tenant)
+    flavor_list.invalidate(request)
+    return access
 
 
 def remove_tenant_from_flavor(request, flavor, tenant):
     """Remove a tenant from the given flavor access list."""
-    return novaclient(request).flavor_access.remove_tenant_access(
+    access = novaclient(request).flavor_access.remove_tenant_access(
         flavor=flavor, tenant=tenant)
+    flavor_list.invalidate(request)
+    return access
 
 
 def flavor_get_extras(request, flavor_id, raw=False):
@@ -512,15 +524,34 @@ def server_get(request, instance_id):
 
 
 def server_list(request, search_opts=None, all_tenants=False):
+    """Lists the instances of the project, or of all projects.
+
+    ``search_opts`` may carry ``sort_key`` and ``sort_dir`` to have Nova
+    sort the list. With ``paginate``, a page starts after ``marker``, or
+    ends before ``prev_marker`` when paging backwards; in the latter case
+    ``has_more_data`` tells whether there are more pages before it.
+    """
     page_size = utils.get_page_size(request)
     c = novaclient(request)
     paginate = False
+    reverse = False
     if search_opts is None:
         search_opts = {}
     elif 'paginate' in search_opts:
         paginate = search_opts.pop('paginate')
         if paginate:
             search_opts['limit'] = page_size + 1
+        prev_marker = search_opts.pop('prev_marker', None)
+        if paginate and prev_marker:
+            # Nova only pages forwards, so list the previous page in the
+            # opposite order and put it back the right way round.
+            reverse = True
+            search_opts['marker'] = prev_marker
+            search_opts.setdefault('sort_key', 'created_at')
+            if search_opts.get('sort_dir') == 'asc':
+                search_opts['sort_dir'] = 'desc'
+            else:
+                search_opts['sort_dir'] = 'asc'
 
     if all_tenants:
         search_opts['all_tenants'] = True
@@ -536,9 +567,18 @@ def server_list(request, search_opts=None, all_tenants=False):
     elif paginate and len(servers) == getattr(settings, 'API_RESULT_LIMIT',
                                               1000):
         has_more_data = True
+    if reverse:
+        servers.reverse()
     return (servers, has_more_data)
 
 
+@base.shared_memoized('compute', 30, per_project=True)
+def server_name_index(request):
+    """Returns the names of the project's instances keyed by their id."""
+    servers, has_more = server_list(request)
+    return dict((server.id, server.name) for server in servers)
+
+
 def server_console_output(request, instance_id, tail_length=None):
     """Gets console output of an instance."""
     return novaclient(request).servers.get_console_output(instance_id,
@@ -575,7 +615,9 @@ def server_rebuild(request, instance_id, image_id, password=None,
 
 
 def server_update(request, instance_id, name):
-    return novaclient(request).servers.update(instance_id, name=name)
+    server = novaclient(request).servers.update(instance_id, name=name)
+    server_name_index.invalidate(request)
+    return server
 
 
 def server_migrate(request, instance_id):
@@ -745,6 +787,9 @@ def remove_host_from_aggregate(request, aggregate_id, host):
 
 
 @memoized
+@base.shared_memoized('compute', 600,
+                      manager=lambda request: nova_list_extensions
+                      .ListExtManager(novaclient(request)))
 def list_extensions(request):
     return nova_list_extensions.ListExtManager(novaclient(request)).show_all()
 
@@ -18,7 +18,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import logging
+import re
+import sys
+import time
 
 import six.moves.urllib.parse as urlparse
 import swiftclient
@@ -37,6 +41,11 @@ FOLDER_DELIMITER = "/"
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
+# Where the segments of large objects are stored, appended to the name of
+# the container the object is uploaded to.
+SEGMENT_CONTAINER_SUFFIX = "_segments"
+# How many names a single filtered listing looks at before giving up.
+FILTER_SCAN_LIMIT = 10000
 
 
 class Container(base.APIDictWrapper):
@@ -109,15 +118,19 @@ def _metadata_to_header(metadata):
 def swift_api(request):
     endpoint = base.url_for(request, 'object-store')
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    LOG.debug('Swift connection created using token "%s" and url "%s"'
-              % (request.user.token.id, endpoint))
-    return swiftclient.client.Connection(None,
-                                         request.user.username,
-                                         None,
-                                         preauthtoken=request.user.token.id,
-                                         preauthurl=endpoint,
-                                         cacert=cacert,
-                                         auth_version="2.0")
+
+    def create():
+        LOG.debug('Swift connection created using token "%s" and url "%s"'
+                  % (request.user.token.id, endpoint))
+        return swiftclient.client.Connection(
+            None,
+            request.user.username,
+            None,
+            preauthtoken=request.user.token.id,
+            preauthurl=endpoint,
+            cacert=cacert,
+            auth_version="2.0")
+    return base.cached_client(request, 'object-store', endpoint, create)
 
 
 def swift_container_exists(request, container_name):
@@ -226,39 +239,53 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
         return (object_objs, False)
 
 
+def _compile_filter(filter_string):
+    """Compiles the whitespace separated terms of ``filter_string`` into
+    regular expressions, ``*`` matching any run of characters.
+    """
+    return [re.compile('.*'.join(re.escape(part)
+                                 for part in term.split('*')),
+                       re.IGNORECASE | re.UNICODE)
+            for term in filter_string.split()]
+
+
 def swift_filter_objects(request, filter_string, container_name, prefix=None,
-                         marker=None):
-    # FIXME(kewu): Swift currently has no real filtering API, thus the marker
-    # parameter here won't actually help the pagination. For now I am just
-    # getting the largest number of objects from a container and filtering
-    # based on those objects.
-    limit = 9999
-    objects = swift_get_objects(request,
-                                container_name,
-                                prefix=prefix,
-                                marker=marker,
-                                limit=limit)
-    filter_string_list = filter_string.lower().strip().split(' ')
-
-    def matches_filter(obj):
-        for q in filter_string_list:
-            return wildcard_search(obj.name.lower(), q)
-
-    return filter(matches_filter, objects[0])
-
-
-def wildcard_search(string, q):
-    q_list = q.split('*')
-    if all(map(lambda x: x == '', q_list)):
-        return True
-    elif q_list[0] not in string:
-        return False
-    else:
-        if q_list[0] == '':
-            tail = string
-        else:
-            head, delimiter, tail = string.partition(q_list[0])
-        return wildcard_search(tail, '*'.join(q_list[1:]))
+                         marker=None, limit=None):
+    """Returns the objects of a folder whose names match ``filter_string``.
+
+    Every whitespace separated term of ``filter_string`` has to be found
+    somewhere in the name of an object within the ``prefix`` folder,
+    regardless of case, ``*`` matching any run of characters. The folder is
+    passed on to Swift as the listing prefix, and the listing is then read
+    a page at a time until ``limit`` matches are found, or until
+    ``FILTER_SCAN_LIMIT`` names have been looked at.
+
+    Returns a tuple of the matching objects, whether there may be more of
+    them and the marker to resume the search from.
+    """
+    limit = limit or getattr(settings, 'API_RESULT_LIMIT', 1000)
+    prefix = prefix or ''
+    patterns = _compile_filter(filter_string)
+
+    conn = swift_api(request)
+    matches = []
+    scanned = 0
+    while True:
+        headers, items = conn.get_container(container_name,
+                                            prefix=prefix,
+                                            marker=marker,
+                                            limit=limit,
+                                            delimiter=FOLDER_DELIMITER)
+        for item in items:
+            marker = item.get('subdir', item.get('name'))
+            scanned += 1
+            name = marker[len(prefix):]
+            if all(pattern.search(name) for pattern in patterns):
+                matches.append(item)
+            if len(matches) >= limit or scanned >= FILTER_SCAN_LIMIT:
+                return (_objectify(matches, container_name), True, marker)
+        if len(items) < limit:
+            return (_objectify(matches, container_name), False, None)
 
 
 def swift_copy_object(request, orig_container_name, orig_object_name,
@@ -274,18 +301,182 @@ def swift_copy_object(request, orig_container_name, orig_object_name,
                                          headers=headers)
 
 
+def _large_object_config():
+    config = {'threshold': 1024 ** 3,
+              'segment_size': 256 * 1024 ** 2,
+              'manifest': 'dynamic'}
+    config.update(getattr(settings, 'SWIFT_LARGE_OBJECT_UPLOAD', {}))
+    return config
+
+
+class _SegmentReader(object):
+    """A file-like view of the next ``length`` bytes of ``object_file``.
+
+    swiftclient reads it in small chunks while sending a segment, so only
+    one such chunk is ever held in memory.
+    """
+    def __init__(self, object_file, length):
+        self.object_file = object_file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return ''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.object_file.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def _head_object(conn, container_name, object_name):
+    """Returns the headers of an object, or ``None`` if it does not exist."""
+    try:
+        return conn.head_object(container_name, object_name)
+    except swiftclient.client.ClientException as e:
+        if e.http_status == 404:
+            return None
+        raise
+
+
+def _is_static_manifest(headers):
+    return headers.get('x-static-large-object', '').lower() == 'true'
+
+
+def _large_object_segments(conn, container_name, object_name, headers):
+    """Returns the ``(container, name)`` of every segment behind a large
+    object manifest with the given ``headers``, or an empty list for an
+    ordinary object.
+    """
+    if _is_static_manifest(headers):
+        headers, manifest = conn.get_object(
+            container_name, object_name,
+            query_string='multipart-manifest=get')
+        return [tuple(segment['name'].lstrip('/').split('/', 1))
+                for segment in json.loads(manifest)]
+    manifest = headers.get('x-object-manifest')
+    if not manifest:
+        return []
+    segment_container, prefix = urlparse.unquote(manifest).split('/', 1)
+    headers, listing = conn.get_container(segment_container,
+                                          prefix=prefix,
+                                          full_listing=True)
+    return [(segment_container, item['name']) for item in listing]
+
+
+def _delete_segments(conn, segments):
+    for segment_container, segment_name in segments:
+        try:
+            conn.delete_object(segment_container, segment_name)
+        except Exception:
+            LOG.warning('Unable to remove segment "%s" of "%s".'
+                        % (segment_name, segment_container))
+
+
 def swift_upload_object(request, container_name, object_name,
                         object_file=None):
+    """Uploads ``object_file`` as ``object_name``.
+
+    Files larger than the ``threshold`` of the ``SWIFT_LARGE_OBJECT_UPLOAD``
+    setting are handed to :func:`swift_upload_large_object`. When an
+    existing large object is replaced, its segments are removed once the
+    new upload has succeeded.
+    """
+    conn = swift_api(request)
+    old_headers = _head_object(conn, container_name, object_name)
+    old_segments = []
+    if old_headers:
+        old_segments = _large_object_segments(conn, container_name,
+                                              object_name, old_headers)
+
     headers = {}
     size = 0
-    if object_file:
-        headers['X-Object-Meta-Orig-Filename'] = object_file.name
-        size = object_file.size
-
-    etag = swift_api(request).put_object(container_name,
-                                         object_name,
-                                         object_file,
-                                         headers=headers)
+    threshold = _large_object_config()['threshold']
+    if object_file and threshold is not None and object_file.size > threshold:
+        obj = swift_upload_large_object(request,
+                                        container_name,
+                                        object_name,
+                                        object_file)
+    else:
+        if object_file:
+            headers['X-Object-Meta-Orig-Filename'] = object_file.name
+            size = object_file.size
+        etag = conn.put_object(container_name,
+                               object_name,
+                               object_file,
+                               headers=headers)
+        obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
+        obj = StorageObject(obj_info, container_name)
+
+    _delete_segments(conn, old_segments)
+    return obj
+
+
+def swift_upload_large_object(request, container_name, object_name,
+                              object_file):
+    """Uploads ``object_file`` as a segmented Swift large object.
+
+    The file is sent in segments of the ``segment_size`` configured in the
+    ``SWIFT_LARGE_OBJECT_UPLOAD`` setting, stored in a
+    ``<container_name>_segments`` container, followed by a Dynamic Large
+    Object manifest (or a Static one when ``manifest`` is ``"static"``)
+    stitching them together under ``object_name``. This lifts Swift's
+    single object size limit and never reads more than one chunk of the
+    file into memory.
+
+    Segments already uploaded are removed again if any part of the upload
+    fails.
+    """
+    config = _large_object_config()
+    segment_size = config['segment_size']
+    size = object_file.size
+    segment_container = container_name + SEGMENT_CONTAINER_SUFFIX
+    segment_prefix = "%s/%s/%s/%s/" % (object_name, time.time(),
+                                       size, segment_size)
+    conn = swift_api(request)
+    conn.put_container(segment_container)
+
+    if hasattr(object_file, 'seek'):
+        object_file.seek(0)
+    segments = []
+    uploaded = 0
+    try:
+        while uploaded < size:
+            length = min(segment_size, size - uploaded)
+            segment_name = "%s%08d" % (segment_prefix, len(segments))
+            etag = conn.put_object(segment_container,
+                                   segment_name,
+                                   _SegmentReader(object_file, length),
+                                   content_length=length)
+            segments.append((segment_name, etag, length))
+            uploaded += length
+            LOG.debug('Uploaded segment %s of "%s" (%s of %s bytes).'
+                      % (len(segments), object_name, uploaded, size))
+
+        headers = {'X-Object-Meta-Orig-Filename': object_file.name}
+        if config['manifest'] == 'static':
+            manifest = [{'path': "/%s/%s" % (segment_container, segment[0]),
+                         'etag': segment[1],
+                         'size_bytes': segment[2]}
+                        for segment in segments]
+            etag = conn.put_object(container_name,
+                                   object_name,
+                                   json.dumps(manifest),
+                                   headers=headers,
+                                   query_string='multipart-manifest=put')
+        else:
+            manifest = "%s/%s" % (segment_container, segment_prefix)
+            headers['X-Object-Manifest'] = urlparse.quote(
+                manifest.encode('utf-8'))
+            etag = conn.put_object(container_name,
+                                   object_name,
+                                   '',
+                                   headers=headers)
+    except Exception:
+        exc_info = sys.exc_info()
+        _delete_segments(conn, [(segment_container, segment[0])
+                                for segment in segments])
+        raise exc_info[0], exc_info[1], exc_info[2]
 
     obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
     return StorageObject(obj_info, container_name)
@@ -306,14 +497,40 @@ def swift_create_pseudo_folder(request, container_name, pseudo_folder_name):
 
 
 def swift_delete_object(request, container_name, object_name):
-    swift_api(request).delete_object(container_name, object_name)
+    """Deletes an object, along with the segments of a large object."""
+    conn = swift_api(request)
+    headers = conn.head_object(container_name, object_name)
+    if _is_static_manifest(headers):
+        # Swift removes the segments of a Static Large Object itself.
+        conn.delete_object(container_name, object_name,
+                           query_string='multipart-manifest=delete')
+        return True
+    segments = _large_object_segments(conn, container_name, object_name,
+                                      headers)
+    conn.delete_object(container_name, object_name)
+    _delete_segments(conn, segments)
     return True
 
 
-def swift_get_object(request, container_name, object_name, with_data=True):
+def swift_get_object(request, container_name, object_name, with_data=True,
+                     resp_chunk_size=None, byte_range=None):
+    """Returns a :class:`StorageObject`, optionally with its contents.
+
+    When ``resp_chunk_size`` is given, ``data`` is an iterator yielding the
+    contents in chunks of that size instead of a string, so that large
+    objects never have to be held in memory. ``byte_range`` is the value
+    of an HTTP ``Range`` header (e.g. ``"bytes=0-1023"``) restricting the
+    data returned; the resulting ``content_range`` is set on the object.
+    """
     if with_data:
+        kwargs = {}
+        if resp_chunk_size:
+            kwargs['resp_chunk_size'] = resp_chunk_size
+        if byte_range:
+            kwargs['headers'] = {'Range': byte_range}
         headers, data = swift_api(request).get_object(container_name,
-                                                      object_name)
+                                                      object_name,
+                                                      **kwargs)
     else:
         data = None
         headers = swift_api(request).head_object(container_name,
@@ -331,6 +548,7 @@ def swift_get_object(request, container_name, object_name, with_data=True):
         'content_type': headers.get('content-type'),
         'etag': headers.get('etag'),
         'timestamp': timestamp,
+        'content_range': headers.get('content-range'),
     }
     return StorageObject(obj_info,
                          container_name,
@@ -21,7 +21,9 @@ from troveclient.v1 import client
 
 from openstack_dashboard.api import base
 
+from horizon.utils import concurrency
 from horizon.utils import functions as utils
+from horizon.utils.memoized import memoized  # noqa
 
 LOG = logging.getLogger(__name__)
 
@@ -49,10 +51,47 @@ def instance_list(request, marker=None):
     return troveclient(request).instances.list(limit=page_size, marker=marker)
 
 
+def instance_list_all(request):
+    """Lists all of the database instances, following every page."""
+    instances = []
+    marker = None
+    while True:
+        page = instance_list(request, marker=marker)
+        instances.extend(page)
+        if not page.next or page.next == marker:
+            return instances
+        marker = page.next
+
+
 def instance_get(request, instance_id):
     return troveclient(request).instances.get(instance_id)
 
 
+def instances_by_id(request, instance_ids):
+    """Returns the given database instances as a dictionary keyed by id.
+
+    All of the instances are listed once and indexed by id; the instances
+    which aren't in that list are then fetched concurrently. Instances
+    which can't be retrieved are left out of the dictionary.
+    """
+    instance_ids = set(instance_ids)
+    instances = dict((instance.id, instance)
+                     for instance in instance_list_all(request)
+                     if instance.id in instance_ids)
+    missing = instance_ids.difference(instances)
+    if missing:
+        with concurrency.Executor() as executor:
+            futures = [executor.submit(instance_get, request, instance_id)
+                       for instance_id in missing]
+        for future in futures:
+            try:
+                instance = future.result()
+            except Exception:
+                continue
+            instances[instance.id] = instance
+    return instances
+
+
 def instance_delete(request, instance_id):
     return troveclient(request).instances.delete(instance_id)
 
@@ -114,6 +153,16 @@ def flavor_get(request, flavor_id):
     return troveclient(request).flavors.get(flavor_id)
 
 
+@memoized
+def flavors_by_id(request):
+    """Returns all of the database flavors keyed by their id as a string.
+
+    The flavors are only listed once per request.
+    """
+    return dict((unicode(flavor.id), flavor)
+                for flavor in flavor_list(request))
+
+
 def users_list(request, instance_id):
     return troveclient(request).users.list(instance_id)
 
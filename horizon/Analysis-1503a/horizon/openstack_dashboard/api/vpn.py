@@ -18,8 +18,6 @@
 
 from __future__ import absolute_import
 
-from django.utils.datastructures import SortedDict
-
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import neutron
@@ -91,13 +89,13 @@ def _vpnservice_list(request, expand_subnet=False, expand_router=False,
     vpnservices = neutronclient(request).list_vpnservices(
         **kwargs).get('vpnservices')
     if expand_subnet:
-        subnets = neutron.subnet_list(request)
-        subnet_dict = SortedDict((s.id, s) for s in subnets)
+        subnet_dict = neutron.expand(request, 'subnet', neutron.subnet_list,
+                                     [s['subnet_id'] for s in vpnservices])
         for s in vpnservices:
             s['subnet_name'] = subnet_dict.get(s['subnet_id']).cidr
     if expand_router:
-        routers = neutron.router_list(request)
-        router_dict = SortedDict((r.id, r) for r in routers)
+        router_dict = neutron.expand(request, 'router', neutron.router_list,
+                                     [s['router_id'] for s in vpnservices])
         for s in vpnservices:
             s['router_name'] = router_dict.get(s['router_id']).name_or_id
     if expand_conns:
@@ -326,19 +324,22 @@ def _ipsecsiteconnection_list(request, expand_ikepolicies=False,
     ipsecsiteconnections = neutronclient(request).list_ipsec_site_connections(
         **kwargs).get('ipsec_site_connections')
     if expand_ikepolicies:
-        ikepolicies = _ikepolicy_list(request, **kwargs)
-        policy_dict = SortedDict((p.id, p) for p in ikepolicies)
+        policy_dict = neutron.expand(
+            request, 'ikepolicy', _ikepolicy_list,
+            [c['ikepolicy_id'] for c in ipsecsiteconnections])
         for c in ipsecsiteconnections:
             c['ikepolicy_name'] = policy_dict.get(c['ikepolicy_id']).name_or_id
     if expand_ipsecpolicies:
-        ipsecpolicies = _ipsecpolicy_list(request, **kwargs)
-        policy_dict = SortedDict((p.id, p) for p in ipsecpolicies)
+        policy_dict = neutron.expand(
+            request, 'ipsecpolicy', _ipsecpolicy_list,
+            [c['ipsecpolicy_id'] for c in ipsecsiteconnections])
         for c in ipsecsiteconnections:
             c['ipsecpolicy_name'] = policy_dict.get(c['ipsecpolicy_id']
                                                     ).name_or_id
     if expand_vpnservices:
-        vpnservices = _vpnservice_list(request, **kwargs)
-        service_dict = SortedDict((s.id, s) for s in vpnservices)
+        service_dict = neutron.expand(
+            request, 'vpnservice', _vpnservice_list,
+            [c['vpnservice_id'] for c in ipsecsiteconnections])
         for c in ipsecsiteconnections:
             c['vpnservice_name'] = service_dict.get(c['vpnservice_id']
                                                     ).name_or_id
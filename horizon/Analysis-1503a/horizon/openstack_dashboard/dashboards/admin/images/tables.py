@@ -53,10 +53,12 @@ class UpdateRow(tables.Row):
 class AdminImagesTable(project_tables.ImagesTable):
     name = tables.Column("name",
                          link="horizon:admin:images:detail",
-                         verbose_name=_("Image Name"))
+                         verbose_name=_("Image Name"),
+                         sort_key="name")
 
     class Meta:
         name = "images"
+        server_sort = True
         row_class = UpdateRow
         status_columns = ["status"]
         verbose_name = _("Images")
@@ -39,20 +39,34 @@ class IndexView(tables.DataTableView):
     def has_more_data(self, table):
         return self._more
 
+    def has_prev_data(self, table):
+        return self._prev
+
     def get_data(self):
         images = []
         filters = {'is_public': None}
-        marker = self.request.GET.get(
-            project_tables.AdminImagesTable._meta.pagination_param, None)
+        table = self.get_table()
+        marker = self.request.GET.get(table._meta.pagination_param, None)
+        prev_marker = self.request.GET.get(table._meta.prev_pagination_param,
+                                           None)
+        kwargs = table.get_sort_params()
+        if prev_marker:
+            kwargs['prev_marker'] = prev_marker
         try:
-            images, self._more = api.glance.image_list_detailed(self.request,
-                                                            marker=marker,
-                                                            paginate=True,
-                                                            filters=filters)
+            images, more = api.glance.image_list_detailed(self.request,
+                                                          marker=marker,
+                                                          paginate=True,
+                                                          filters=filters,
+                                                          **kwargs)
         except Exception:
-            self._more = False
+            more = False
             msg = _('Unable to retrieve image list.')
             exceptions.handle(self.request, msg)
+        # Paging backwards, "more" tells whether there are earlier pages.
+        if prev_marker:
+            self._prev, self._more = more, bool(images)
+        else:
+            self._prev, self._more = bool(marker and images), more
         return images
 
 
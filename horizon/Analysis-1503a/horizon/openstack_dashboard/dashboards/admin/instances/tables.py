@@ -82,6 +82,11 @@ class AdminUpdateRow(project_tables.UpdateRow):
         instance.tenant_name = getattr(tenant, "name", None)
         return instance
 
+    def get_data_batch(self, request, instance_ids):
+        # Listing the instances of every project costs more than getting
+        # the few rows being updated one by one.
+        return tables.Row.get_data_batch(self, request, instance_ids)
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     filter_type = "server"
@@ -127,10 +132,12 @@ class AdminInstancesTable(tables.DataTable):
     #user = tables.Column("user_id", verbose_name=_("User"))
     host = tables.Column("OS-EXT-SRV-ATTR:host",
                          verbose_name=_("Host"),
-                         classes=('nowrap-col',))
+                         classes=('nowrap-col',),
+                         sort_key="host")
     name = tables.Column("name",
                          link=("horizon:admin:instances:detail"),
-                         verbose_name=_("Name"))
+                         verbose_name=_("Name"),
+                         sort_key="display_name")
     image_name = tables.Column("image_name",
                                verbose_name=_("Image Name"))
     ip = tables.Column(project_tables.get_ips,
@@ -146,13 +153,15 @@ class AdminInstancesTable(tables.DataTable):
                            status=True,
                            status_choices=STATUS_CHOICES,
                            display_choices=
-                               project_tables.STATUS_DISPLAY_CHOICES)
+                               project_tables.STATUS_DISPLAY_CHOICES,
+                           sort_key="vm_state")
     task = tables.Column("OS-EXT-STS:task_state",
                          verbose_name=_("Task"),
                          filters=(title, filters.replace_underscores),
                          status=True,
                          status_choices=TASK_STATUS_CHOICES,
-                         display_choices=project_tables.TASK_DISPLAY_CHOICES)
+                         display_choices=project_tables.TASK_DISPLAY_CHOICES,
+                         sort_key="task_state")
     state = tables.Column(project_tables.get_power_state,
                           filters=(title, filters.replace_underscores),
                           verbose_name=_("Power State"))
@@ -160,11 +169,13 @@ class AdminInstancesTable(tables.DataTable):
                             verbose_name=_("Uptime"),
                             filters=(filters.parse_isotime,
                                      filters.timesince_sortable),
-                            attrs={'data-type': 'timesince'})
+                            attrs={'data-type': 'timesince'},
+                            sort_key="created_at")
 
     class Meta:
         name = "instances"
         verbose_name = _("Instances")
+        server_sort = True
         status_columns = ["status", "task"]
         table_actions = (project_tables.TerminateInstance,
                          AdminInstanceFilterAction)
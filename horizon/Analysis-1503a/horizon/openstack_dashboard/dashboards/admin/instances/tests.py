@@ -56,6 +56,37 @@ class InstanceViewTest(test.BaseAdminViewTests):
         instances = res.context['table'].data
         self.assertItemsEqual(instances, servers)
 
+    @test.create_stubs({api.nova: ('flavor_list', 'server_list',
+                                   'extension_supported',),
+                        api.keystone: ('tenant_list',),
+                        api.network: ('servers_update_addresses',)})
+    def test_index_sorted_prev_page(self):
+        servers = self.servers.list()
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([self.tenants.list(), False])
+        search_opts = {'marker': None, 'prev_marker': 'next',
+                       'sort_key': 'display_name', 'sort_dir': 'desc',
+                       'paginate': True}
+        api.nova.server_list(IsA(http.HttpRequest),
+                             all_tenants=True, search_opts=search_opts) \
+            .AndReturn([servers, False])
+        api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        self.mox.ReplayAll()
+
+        res = self.client.get(INDEX_URL + '?prev_marker=next&sort_key=name'
+                                          '&sort_dir=desc')
+        table = res.context['table']
+        # The first page has no previous one, but the page it came from.
+        self.assertFalse(table.has_prev_data())
+        self.assertTrue(table.has_more_data())
+        self.assertContains(res, 'href="?marker=%s&amp;sort_key=name&amp;'
+                                 'sort_dir=desc"' % servers[-1].id)
+        self.assertContains(res, 'href="?sort_key=name&amp;sort_dir=asc"')
+
     @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
                                     'server_list', 'extension_supported',),
                         api.keystone: ('tenant_list',),
@@ -27,6 +27,7 @@ from django.utils.translation import ugettext_lazy as _
 from horizon import exceptions
 from horizon import forms
 from horizon import tables
+from horizon.utils import concurrency
 from horizon.utils import memoized
 
 from openstack_dashboard import api
@@ -70,23 +71,47 @@ class AdminIndexView(tables.DataTableView):
     def has_more_data(self, table):
         return self._more
 
+    def has_prev_data(self, table):
+        return self._prev
+
     def get_data(self):
         instances = []
-        marker = self.request.GET.get(
-            project_tables.AdminInstancesTable._meta.pagination_param, None)
+        table = self.get_table()
+        marker = self.request.GET.get(table._meta.pagination_param, None)
+        prev_marker = self.request.GET.get(table._meta.prev_pagination_param,
+                                           None)
+        search_opts = {'marker': marker, 'paginate': True}
+        if prev_marker:
+            search_opts['prev_marker'] = prev_marker
+        search_opts.update(table.get_sort_params())
         try:
-            instances, self._more = api.nova.server_list(
+            instances, more = api.nova.server_list(
                 self.request,
-                search_opts={'marker': marker,
-                             'paginate': True},
+                search_opts=search_opts,
                 all_tenants=True)
         except Exception:
-            self._more = False
+            more = False
             exceptions.handle(self.request,
                               _('Unable to retrieve instance list.'))
+        # Paging backwards, "more" tells whether there are earlier pages.
+        if prev_marker:
+            self._prev, self._more = more, bool(instances)
+        else:
+            self._prev, self._more = bool(marker and instances), more
         if instances:
+            # The address, flavor and tenant lookups are independent of each
+            # other, so issue them concurrently.
+            with concurrency.Executor() as executor:
+                addresses_call = executor.submit(
+                    api.network.servers_update_addresses,
+                    self.request, instances)
+                flavors_call = executor.submit(api.nova.flavor_list,
+                                               self.request)
+                tenants_call = executor.submit(api.keystone.tenant_list,
+                                               self.request)
+
             try:
-                api.network.servers_update_addresses(self.request, instances)
+                addresses_call.result()
             except Exception:
                 exceptions.handle(
                     self.request,
@@ -95,14 +120,14 @@ class AdminIndexView(tables.DataTableView):
 
             # Gather our flavors to correlate against IDs
             try:
-                flavors = api.nova.flavor_list(self.request)
+                flavors = flavors_call.result()
             except Exception:
                 # If fails to retrieve flavor list, creates an empty list.
                 flavors = []
 
             # Gather our tenants to correlate against IDs
             try:
-                tenants, has_more = api.keystone.tenant_list(self.request)
+                tenants, has_more = tenants_call.result()
             except Exception:
                 tenants = []
                 msg = _('Unable to retrieve instance project information.')
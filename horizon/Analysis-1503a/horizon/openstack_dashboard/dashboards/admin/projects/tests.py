@@ -14,6 +14,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import copy
 import datetime
 import logging
@@ -719,12 +720,16 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
         return [user for user in self.users.list()
                 if user.project_id == project_id]
 
+    def _get_proj_users_roles(self, users, roles):
+        return collections.OrderedDict((user.id, [role.id for role in roles])
+                                       for user in users)
+
     def _get_proj_groups(self, project_id):
         return [group for group in self.groups.list()
                 if group.project_id == project_id]
 
     @test.create_stubs({api.keystone: ('get_default_role',
-                                       'roles_for_user',
+                                       'get_project_users_roles',
                                        'tenant_get',
                                        'domain_get',
                                        'user_list',
@@ -762,12 +767,9 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(roles)
         api.keystone.group_list(IsA(http.HttpRequest), domain=domain_id) \
             .AndReturn(groups)
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
-        for user in proj_users:
-            api.keystone.roles_for_user(IsA(http.HttpRequest),
-                                        user.id,
-                                        self.tenant.id).AndReturn(roles)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(self._get_proj_users_roles(proj_users, roles))
 
         for group in groups:
             api.keystone.roles_for_group(IsA(http.HttpRequest),
@@ -804,7 +806,7 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                        'domain_get',
                                        'tenant_update',
                                        'get_default_role',
-                                       'roles_for_user',
+                                       'get_project_users_roles',
                                        'remove_tenant_user_role',
                                        'add_tenant_user_role',
                                        'user_list',
@@ -848,13 +850,10 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(roles)
         api.keystone.group_list(IsA(http.HttpRequest), domain=domain_id) \
             .AndReturn(groups)
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(self._get_proj_users_roles(proj_users, roles))
         workflow_data = {}
-        for user in proj_users:
-            api.keystone.roles_for_user(IsA(http.HttpRequest),
-                                        user.id,
-                                        self.tenant.id).AndReturn(roles)
         for group in groups:
             api.keystone.roles_for_group(IsA(http.HttpRequest),
                                          group=group.id,
@@ -885,18 +884,17 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                    **updated_project) \
             .AndReturn(project)
 
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
-
-        # admin user - try to remove all roles on current project, warning
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '1',
-                                    self.tenant.id) \
-                           .AndReturn(roles)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(collections.OrderedDict([
+                # admin user - try to remove all roles on current project,
+                # warning
+                ('1', [role.id for role in roles]),
+                # member user 1 - has role 1, will remove it
+                ('2', [roles[0].id]),
+                # member user 3 - has role 2
+                ('3', [roles[1].id])]))
 
-        # member user 1 - has role 1, will remove it
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '2',
-                                    self.tenant.id) \
-                           .AndReturn((roles[0],))
         # remove role 1
         api.keystone.remove_tenant_user_role(IsA(http.HttpRequest),
                                              project=self.tenant.id,
@@ -908,10 +906,6 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                           user='2',
                                           role='2')
 
-        # member user 3 - has role 2
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '3',
-                                    self.tenant.id) \
-                           .AndReturn((roles[1],))
         # remove role 2
         api.keystone.remove_tenant_user_role(IsA(http.HttpRequest),
                                              project=self.tenant.id,
@@ -1038,7 +1032,7 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                        'domain_get',
                                        'tenant_update',
                                        'get_default_role',
-                                       'roles_for_user',
+                                       'get_project_users_roles',
                                        'remove_tenant_user',
                                        'add_tenant_user_role',
                                        'user_list',
@@ -1080,14 +1074,12 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(roles)
         api.keystone.group_list(IsA(http.HttpRequest), domain=domain_id) \
             .AndReturn(groups)
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(self._get_proj_users_roles(proj_users, roles))
 
         workflow_data = {}
         for user in proj_users:
-            api.keystone.roles_for_user(IsA(http.HttpRequest),
-                                        user.id,
-                                        self.tenant.id).AndReturn(roles)
             role_ids = [role.id for role in roles]
             if role_ids:
                 workflow_data.setdefault(USER_ROLE_PREFIX + role_ids[0], []) \
@@ -1142,7 +1134,7 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                        'domain_get',
                                        'tenant_update',
                                        'get_default_role',
-                                       'roles_for_user',
+                                       'get_project_users_roles',
                                        'remove_tenant_user_role',
                                        'add_tenant_user_role',
                                        'user_list',
@@ -1185,16 +1177,12 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(roles)
         api.keystone.group_list(IsA(http.HttpRequest), domain=domain_id) \
             .AndReturn(groups)
-        api.keystone.user_list(IsA(http.HttpRequest),
-                       project=self.tenant.id).AndReturn(proj_users)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(self._get_proj_users_roles(proj_users, roles))
 
         workflow_data = {}
 
-        for user in proj_users:
-            api.keystone.roles_for_user(IsA(http.HttpRequest),
-                                        user.id,
-                                        self.tenant.id).AndReturn(roles)
-
         for group in groups:
             api.keystone.roles_for_group(IsA(http.HttpRequest),
                                          group=group.id,
@@ -1225,23 +1213,17 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                    **updated_project) \
             .AndReturn(project)
 
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(collections.OrderedDict([
+                # admin user - try to remove all roles on current project,
+                # warning
+                ('1', [role.id for role in roles]),
+                # member user 1 - has role 1, will remove it
+                ('2', [roles[1].id]),
+                # member user 3 - has role 2
+                ('3', [roles[0].id])]))
 
-        # admin user - try to remove all roles on current project, warning
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '1',
-                                    self.tenant.id) \
-                           .AndReturn(roles)
-
-        # member user 1 - has role 1, will remove it
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '2',
-                                    self.tenant.id) \
-                           .AndReturn((roles[1],))
-
-        # member user 3 - has role 2
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '3',
-                                    self.tenant.id) \
-                           .AndReturn((roles[0],))
         # add role 2
         api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                           project=self.tenant.id,
@@ -1306,7 +1288,7 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                        'domain_get',
                                        'tenant_update',
                                        'get_default_role',
-                                       'roles_for_user',
+                                       'get_project_users_roles',
                                        'remove_tenant_user_role',
                                        'add_tenant_user_role',
                                        'user_list',
@@ -1347,14 +1329,11 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(roles)
         api.keystone.group_list(IsA(http.HttpRequest), domain=domain_id) \
             .AndReturn(groups)
-        api.keystone.user_list(IsA(http.HttpRequest),
-                       project=self.tenant.id).AndReturn(proj_users)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(self._get_proj_users_roles(proj_users, roles))
 
         workflow_data = {}
-        for user in proj_users:
-            api.keystone.roles_for_user(IsA(http.HttpRequest),
-                                        user.id,
-                                        self.tenant.id).AndReturn(roles)
         for group in groups:
             api.keystone.roles_for_group(IsA(http.HttpRequest),
                                          group=group.id,
@@ -1384,20 +1363,17 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                    **updated_project) \
             .AndReturn(project)
 
-        api.keystone.user_list(IsA(http.HttpRequest),
-                               project=self.tenant.id).AndReturn(proj_users)
-
-        # admin user - try to remove all roles on current project, warning
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '1',
-                                    self.tenant.id).AndReturn(roles)
-
-        # member user 1 - has role 1, will remove it
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '2',
-                                    self.tenant.id).AndReturn((roles[1],))
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             project=self.tenant.id) \
+            .AndReturn(collections.OrderedDict([
+                # admin user - try to remove all roles on current project,
+                # warning
+                ('1', [role.id for role in roles]),
+                # member user 1 - has role 1, will remove it
+                ('2', [roles[1].id]),
+                # member user 3 - has role 2
+                ('3', [roles[0].id])]))
 
-        # member user 3 - has role 2
-        api.keystone.roles_for_user(IsA(http.HttpRequest), '3',
-                                    self.tenant.id).AndReturn((roles[0],))
         # add role 2
         api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                           project=self.tenant.id,
@@ -199,23 +199,17 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
         # Figure out users & roles
         if project_id:
             try:
-                project_members = api.keystone.user_list(request,
-                                                         project=project_id)
+                users_roles = api.keystone.get_project_users_roles(
+                    request, project=project_id)
             except Exception:
-                exceptions.handle(request, err_msg)
+                exceptions.handle(request,
+                                  err_msg,
+                                  redirect=reverse(INDEX_URL))
 
-            for user in project_members:
-                try:
-                    roles = api.keystone.roles_for_user(self.request,
-                                                        user.id,
-                                                        project_id)
-                except Exception:
-                    exceptions.handle(request,
-                                      err_msg,
-                                      redirect=reverse(INDEX_URL))
-                for role in roles:
-                    field_name = self.get_member_field_name(role.id)
-                    self.fields[field_name].initial.append(user.id)
+            for user_id in users_roles:
+                for role_id in users_roles[user_id]:
+                    field_name = self.get_member_field_name(role_id)
+                    self.fields[field_name].initial.append(user_id)
 
     class Meta:
         name = _("Project Members")
@@ -1276,29 +1270,26 @@ class UpdateProject(workflows.Workflow):
             available_roles = api.keystone.role_list(request)
             # Get the users currently associated with this project so we
             # can diff against it.
-            project_members = api.keystone.user_list(request,
-                                                     project=project_id)
-            users_to_modify = len(project_members)
+            users_roles = api.keystone.get_project_users_roles(
+                request, project=project_id)
+            users_to_modify = len(users_roles)
 
-            for user in project_members:
+            for user_id in users_roles:
                 # Check if there have been any changes in the roles of
                 # Existing project members.
-                current_roles = api.keystone.roles_for_user(self.request,
-                                                            user.id,
-                                                            project_id)
-                current_role_ids = [role.id for role in current_roles]
+                current_role_ids = list(users_roles[user_id])
 
                 for role in available_roles:
                     field_name = member_step.get_member_field_name(role.id)
                     # Check if the user is in the list of users with this role.
-                    if user.id in data[field_name]:
+                    if user_id in data[field_name]:
                         # Add it if necessary
                         if role.id not in current_role_ids:
                             # user role has changed
                             api.keystone.add_tenant_user_role(
                                 request,
                                 project=project_id,
-                                user=user.id,
+                                user=user_id,
                                 role=role.id)
                         else:
                             # User role is unchanged, so remove it from the
@@ -1307,10 +1298,11 @@ class UpdateProject(workflows.Workflow):
                             current_role_ids.pop(index)
 
                 # Prevent admins from doing stupid things to themselves.
-                is_current_user = user.id == request.user.id
+                is_current_user = user_id == request.user.id
                 is_current_project = project_id == request.user.tenant_id
-                admin_roles = [role for role in current_roles
-                               if role.name.lower() == 'admin']
+                admin_roles = [role for role in available_roles
+                               if role.id in users_roles[user_id] and
+                               role.name.lower() == 'admin']
                 if len(admin_roles):
                     removing_admin = any([role.id in current_role_ids
                                           for role in admin_roles])
@@ -1331,7 +1323,7 @@ class UpdateProject(workflows.Workflow):
                         api.keystone.remove_tenant_user_role(
                             request,
                             project=project_id,
-                            user=user.id,
+                            user=user_id,
                             role=id_to_delete)
                 users_to_modify -= 1
 
@@ -1344,7 +1336,7 @@ class UpdateProject(workflows.Workflow):
                 users_added = 0
                 field_name = member_step.get_member_field_name(role.id)
                 for user_id in data[field_name]:
-                    if not filter(lambda x: user_id == x.id, project_members):
+                    if user_id not in users_roles:
                         api.keystone.add_tenant_user_role(request,
                                                           project=project_id,
                                                           user=user_id,
@@ -1456,6 +1448,7 @@ class UpdateProject(workflows.Workflow):
                 api.neutron.tenant_quota_update(request,
                                                 project_id,
                                                 **neutron_data)
+            quotas.invalidate_cached_usages(request, tenant_id=project_id)
             return True
         except Exception:
             exceptions.handle(request, _('Modified project information and '
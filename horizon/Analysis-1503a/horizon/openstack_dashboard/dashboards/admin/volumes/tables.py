@@ -47,14 +47,20 @@ class VolumesFilterAction(tables.FilterAction):
 class VolumesTable(project_tables.VolumesTable):
     name = tables.Column("name",
                          verbose_name=_("Name"),
-                         link="horizon:admin:volumes:detail")
-    host = tables.Column("os-vol-host-attr:host", verbose_name=_("Host"))
-    tenant = tables.Column("tenant_name", verbose_name=_("Project"))
+                         link="horizon:admin:volumes:detail",
+                         sort_key="name")
+    host = tables.Column("os-vol-host-attr:host", verbose_name=_("Host"),
+                         sort_key="os-vol-host-attr:host")
+    tenant = tables.Column("tenant_name", verbose_name=_("Project"),
+                           sort_key="tenant_name")
 
     class Meta:
         name = "volumes"
         verbose_name = _("Volumes")
         status_columns = ["status"]
+        # Cinder cannot page through the volumes of all projects, so they
+        # are sorted and paged in the view.
+        server_sort = True
         row_class = project_tables.UpdateRow
         table_actions = (project_tables.DeleteVolume, VolumesFilterAction)
         row_actions = (project_tables.DeleteVolume,)
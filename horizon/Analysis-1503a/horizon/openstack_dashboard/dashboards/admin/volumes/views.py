@@ -64,8 +64,20 @@ class IndexView(tables.MultiTableView, project_tabs.VolumeTableMixIn):
             tenant = tenant_dict.get(tenant_id, None)
             volume.tenant_name = getattr(tenant, "name", None)
 
+        table = self.get_tables()['volumes']
+        volumes, self._prev, self._more = table.sort_and_page(volumes)
         return volumes
 
+    def has_more_data(self, table):
+        if table.name == 'volumes':
+            return self._more
+        return False
+
+    def has_prev_data(self, table):
+        if table.name == 'volumes':
+            return self._prev
+        return False
+
     def get_volume_types_data(self):
         try:
             volume_types = cinder.volume_type_list(self.request)
@@ -49,6 +49,7 @@ class FloatingIpAllocate(forms.SelfHandlingForm):
 
             fip = api.network.tenant_floating_ip_allocate(request,
                                                        pool=data['pool'])
+            quotas.tally_cached_usages(request, floating_ips=1)
             messages.success(request,
                              _('Allocated Floating IP %(ip)s.')
                              % {"ip": fip.ip})
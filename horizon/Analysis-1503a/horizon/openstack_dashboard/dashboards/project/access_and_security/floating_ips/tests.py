@@ -19,6 +19,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 from django.core.urlresolvers import reverse
 from django import http
 from django.test.utils import override_settings
@@ -37,10 +39,12 @@ NAMESPACE = "horizon:project:access_and_security:floating_ips"
 
 class FloatingIpViewTests(test.TestCase):
     def test_associate(self):
-        self.mox.StubOutWithMock(api.network, 'floating_ip_target_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        api.network.floating_ip_target_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.servers.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((self.servers.list(), False))
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.floating_ips.list())
         self.mox.ReplayAll()
@@ -58,12 +62,62 @@ class FloatingIpViewTests(test.TestCase):
         server = self.servers.first()
         self.mox.StubOutWithMock(api.network, 'floating_ip_associate')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'floating_ip_target_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
+
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.floating_ips.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((self.servers.list(), False))
+        api.network.floating_ip_associate(IsA(http.HttpRequest),
+                                          floating_ip.id,
+                                          server.id)
+        self.mox.ReplayAll()
+
+        form_data = {'instance_id': server.id,
+                     'ip_id': floating_ip.id}
+        url = reverse('%s:associate' % NAMESPACE)
+        res = self.client.post(url, form_data)
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
+    def test_associate_more_targets(self):
+        servers = self.servers.list()
+        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.floating_ips.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((servers[:1], True))
+        self.mox.ReplayAll()
+
+        res = self.client.get(reverse('%s:associate' % NAMESPACE))
+        widget = res.context['workflow'].steps[0].action \
+            .fields['instance_id'].widget
+        self.assertEqual(reverse('%s:targets' % NAMESPACE),
+                         widget.attrs['data-targets-url'])
+        self.assertEqual(servers[0].id, widget.attrs['data-targets-marker'])
+
+    def test_associate_post_target_not_listed(self):
+        floating_ip = self.floating_ips.list()[1]
+        server = self.servers.list()[1]
+        self.mox.StubOutWithMock(api.network, 'floating_ip_associate')
+        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
+        self.mox.StubOutWithMock(api.network, 'floating_ip_target_get')
 
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.floating_ips.list())
-        api.network.floating_ip_target_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.servers.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((self.servers.list()[:1], True))
+        # The target was loaded from a later page.
+        api.network.floating_ip_target_get(IsA(http.HttpRequest),
+                                           server.id) \
+                .AndReturn(server)
         api.network.floating_ip_associate(IsA(http.HttpRequest),
                                           floating_ip.id,
                                           server.id)
@@ -75,17 +129,35 @@ class FloatingIpViewTests(test.TestCase):
         res = self.client.post(url, form_data)
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    @test.create_stubs({api.network: ('floating_ip_target_list_page',)})
+    def test_targets(self):
+        server = self.servers.first()
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), search='server', marker='1',
+            limit=20) \
+                .AndReturn(([server], True))
+        self.mox.ReplayAll()
+
+        res = self.client.get(reverse('%s:targets' % NAMESPACE),
+                              {'search': 'server', 'marker': '1'})
+        self.assertEqual({'targets': [{'id': server.id,
+                                       'name': server.name}],
+                          'has_more': True},
+                         json.loads(res.content))
+
     def test_associate_post_with_redirect(self):
         floating_ip = self.floating_ips.list()[1]
         server = self.servers.first()
         self.mox.StubOutWithMock(api.network, 'floating_ip_associate')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'floating_ip_target_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
 
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.floating_ips.list())
-        api.network.floating_ip_target_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.servers.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((self.servers.list(), False))
         api.network.floating_ip_associate(IsA(http.HttpRequest),
                                           floating_ip.id,
                                           server.id)
@@ -103,12 +175,14 @@ class FloatingIpViewTests(test.TestCase):
         server = self.servers.first()
         self.mox.StubOutWithMock(api.network, 'floating_ip_associate')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'floating_ip_target_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
 
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.floating_ips.list())
-        api.network.floating_ip_target_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.servers.list())
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((self.servers.list(), False))
         api.network.floating_ip_associate(IsA(http.HttpRequest),
                                           floating_ip.id,
                                           server.id) \
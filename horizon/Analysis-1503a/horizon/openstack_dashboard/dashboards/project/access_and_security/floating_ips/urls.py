@@ -27,5 +27,6 @@ from openstack_dashboard.dashboards.project.access_and_security.\
 
 urlpatterns = patterns('',
     url(r'^associate/$', views.AssociateView.as_view(), name='associate'),
-    url(r'^allocate/$', views.AllocateView.as_view(), name='allocate')
+    url(r'^allocate/$', views.AllocateView.as_view(), name='allocate'),
+    url(r'^targets/$', views.TargetsView.as_view(), name='targets')
 )
@@ -23,11 +23,16 @@
 Views for managing floating IPs.
 """
 
+import json
+
 from django.core.urlresolvers import reverse_lazy
+from django import http
 from django.utils.translation import ugettext_lazy as _
+from django.views.generic import View  # noqa
 
 from horizon import exceptions
 from horizon import forms
+from horizon.utils import functions as utils
 from horizon import workflows
 
 from openstack_dashboard import api
@@ -43,6 +48,29 @@ class AssociateView(workflows.WorkflowView):
     workflow_class = project_workflows.IPAssociationWorkflow
 
 
+class TargetsView(View):
+    """Lists floating IP association targets page by page as JSON.
+
+    Used by the association form to load more targets as the user scrolls
+    the list or types in a search term.
+    """
+    def get(self, request, *args, **kwargs):
+        try:
+            targets, has_more = api.network.floating_ip_target_list_page(
+                request,
+                search=request.GET.get('search') or None,
+                marker=request.GET.get('marker') or None,
+                limit=utils.get_page_size(request))
+        except Exception:
+            exceptions.handle(request,
+                              _('Unable to retrieve instance list.'))
+            return http.HttpResponseServerError()
+        data = {'targets': [{'id': t.id, 'name': t.name} for t in targets],
+                'has_more': has_more}
+        return http.HttpResponse(json.dumps(data),
+                                 content_type='application/json')
+
+
 class AllocateView(forms.ModalFormView):
     form_class = project_forms.FloatingIpAllocate
     template_name = 'project/access_and_security/floating_ips/allocate.html'
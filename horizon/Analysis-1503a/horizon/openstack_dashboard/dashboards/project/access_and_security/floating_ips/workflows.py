@@ -20,6 +20,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon import forms
+from horizon.utils import functions as utils
 from horizon import workflows
 
 from openstack_dashboard import api
@@ -27,6 +28,7 @@ from openstack_dashboard.utils import filters
 
 
 ALLOCATE_URL = "horizon:project:access_and_security:floating_ips:allocate"
+TARGETS_URL = "horizon:project:access_and_security:floating_ips:targets"
 
 
 class AssociateIPAction(workflows.Action):
@@ -49,17 +51,6 @@ class AssociateIPAction(workflows.Action):
             label = _("Instance to be associated")
         self.fields['instance_id'].label = label
 
-        # If AssociateIP is invoked from instance menu, instance_id parameter
-        # is passed in URL. In Neutron based Floating IP implementation
-        # an association target is not an instance but a port, so we need
-        # to get an association target based on a received instance_id
-        # and set the initial value of instance_id ChoiceField.
-        q_instance_id = self.request.GET.get('instance_id')
-        if q_instance_id:
-            target_id = api.network.floating_ip_target_get_by_instance(
-                self.request, q_instance_id)
-            self.initial['instance_id'] = target_id
-
     def populate_ip_id_choices(self, request, context):
         ips = []
         try:
@@ -77,10 +68,40 @@ class AssociateIPAction(workflows.Action):
 
         return options
 
+    def _selected_target(self, request):
+        selected = self.data.get('instance_id')
+        if selected:
+            return selected
+        # If AssociateIP is invoked from instance menu, instance_id parameter
+        # is passed in URL. In Neutron based Floating IP implementation
+        # an association target is not an instance but a port, so we need
+        # to get an association target based on a received instance_id
+        # and set the initial value of instance_id ChoiceField.
+        q_instance_id = request.GET.get('instance_id')
+        if q_instance_id:
+            target_id = api.network.floating_ip_target_get_by_instance(
+                request, q_instance_id)
+            self.initial['instance_id'] = target_id
+            return target_id
+        return None
+
     def populate_instance_id_choices(self, request, context):
         targets = []
         try:
-            targets = api.network.floating_ip_target_list(self.request)
+            # Only the first page of targets is listed; the rest are loaded
+            # from TARGETS_URL as the user scrolls or searches.
+            targets, has_more = api.network.floating_ip_target_list_page(
+                request, limit=utils.get_page_size(request))
+            if has_more:
+                attrs = self.fields['instance_id'].widget.attrs
+                attrs['data-targets-url'] = reverse(TARGETS_URL)
+                attrs['data-targets-marker'] = targets[-1].id
+            selected = self._selected_target(request)
+            if selected and selected not in [t.id for t in targets]:
+                target = api.network.floating_ip_target_get(request,
+                                                            selected)
+                if target:
+                    targets.append(target)
         except Exception:
             redirect = reverse('horizon:project:access_and_security:index')
             exceptions.handle(self.request,
@@ -83,11 +83,13 @@ class AccessAndSecurityTests(test.TestCase):
         targets = [api.nova.FloatingIpTarget(s) for s in servers]
 
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'floating_ip_target_list')
+        self.mox.StubOutWithMock(api.network,
+                                 'floating_ip_target_list_page')
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.floating_ips.list())
-        api.network.floating_ip_target_list(IsA(http.HttpRequest)) \
-                .AndReturn(targets)
+        api.network.floating_ip_target_list_page(
+            IsA(http.HttpRequest), limit=20) \
+                .AndReturn((targets, False))
         self.mox.ReplayAll()
 
         res = self.client.get(reverse("horizon:project:access_and_security:"
@@ -353,17 +353,42 @@ class DownloadObject(tables.LinkAction):
 
 
 class ObjectFilterAction(tables.FilterAction):
+    # Where a filtered listing stopped is passed in its own query parameter,
+    # apart from the marker of the unfiltered listing.
+    marker_param = "filter_marker"
+
     def _filtered_data(self, table, filter_string):
+        # Both data types are filtered from the same listing, so only ask
+        # Swift for it once per table.
+        if getattr(self, '_filtered', None) == (table, filter_string):
+            return self.filtered_data
         request = table.request
         container = self.table.kwargs['container_name']
         subfolder = self.table.kwargs['subfolder_path']
         prefix = wrap_delimiter(subfolder) if subfolder else ''
-        self.filtered_data = api.swift.swift_filter_objects(request,
-                                                            filter_string,
-                                                            container,
-                                                            prefix=prefix)
+        # A newly submitted filter starts from the top of the folder, the
+        # "More" link of a filtered listing resumes where it stopped.
+        if request.method == 'POST':
+            marker = None
+        else:
+            marker = request.GET.get(self.marker_param, None)
+        self.filter_string = filter_string
+        self.filtered_data, self.more, self.marker = \
+            api.swift.swift_filter_objects(request,
+                                           filter_string,
+                                           container,
+                                           prefix=prefix,
+                                           marker=marker)
+        self._filtered = (table, filter_string)
         return self.filtered_data
 
+    def has_more(self, table):
+        """Returns whether the filtered listing of ``table`` goes on past
+        the current page of matches.
+        """
+        self._filtered_data(table, table.get_filter_string())
+        return self.more
+
     def filter_subfolders_data(self, table, objects, filter_string):
         data = self._filtered_data(table, filter_string)
         return [datum for datum in data if
@@ -421,6 +446,45 @@ class ObjectsTable(tables.DataTable):
         url = super(ObjectsTable, self).get_absolute_url()
         return http.urlquote(url)
 
+    def get_filter_string(self):
+        # The "More" link of a filtered listing carries the filter string
+        # as a query parameter.
+        param_name = self._meta._filter_action.get_param_name()
+        return (self.request.POST.get(param_name) or
+                self.request.GET.get(param_name, ''))
+
+    @property
+    def filtered_data(self):
+        # The filter normally only applies to its own POST, but the pages
+        # after the first one of a filtered listing are requested by GET.
+        if (not hasattr(self, '_filtered_data') and
+                self.request.method == 'GET' and self.get_filter_string()):
+            action = self._meta._filter_action
+            self._filtered_data = action.data_type_filter(
+                self, self.data, self.get_filter_string())
+        return super(ObjectsTable, self).filtered_data
+
+    def has_more_filtered_data(self):
+        """Returns whether there are more matches for the filter string."""
+        return self._meta._filter_action.has_more(self)
+
+    def get_marker(self):
+        # Swift lists subfolders and objects in a single name order, so the
+        # next page starts after the last name of either.
+        names = [getattr(datum, 'subdir', None) or datum.name
+                 for datum in self.data]
+        if not names:
+            return ''
+        return http.urlquote_plus(max(names))
+
+    def get_pagination_string(self):
+        filter_string = self.get_filter_string()
+        if not filter_string:
+            return super(ObjectsTable, self).get_pagination_string()
+        action = self._meta._filter_action
+        return http.urlencode([(action.get_param_name(), filter_string),
+                               (action.marker_param, action.marker)])
+
     def get_full_url(self):
         """Returns the encoded absolute URL path with its query string.
 
@@ -22,14 +22,17 @@ import tempfile
 
 from django.core.files.uploadedfile import InMemoryUploadedFile  # noqa
 from django import http
+from django.test.utils import override_settings
 from django.utils import http as utils_http
 
 from mox import IsA  # noqa
+import swiftclient
 
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.containers import forms
 from openstack_dashboard.dashboards.project.containers import tables
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.test.test_data import exceptions as test_exceptions
 
 from horizon.utils.urlresolvers import reverse  # noqa
 
@@ -323,6 +326,80 @@ class SwiftTests(test.TestCase):
         handled = table.maybe_handle()
         self.assertEqual(handled['location'], index_url)
 
+    @test.create_stubs({api.swift: ('swift_filter_objects',)})
+    def test_filter_objects(self):
+        container = self.containers.first()
+        objects = self.objects.list() + self.folder.list()
+        args = (tables.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        # Subfolders and objects are both picked out of a single listing.
+        api.swift.swift_filter_objects(IsA(http.HttpRequest),
+                                       'test',
+                                       container.name,
+                                       prefix='',
+                                       marker=None) \
+            .AndReturn((objects, False, None))
+        self.mox.ReplayAll()
+
+        req = self.factory.post(index_url, {'objects__filter__q': 'test'})
+        kwargs = {"container_name": container.name, "subfolder_path": None}
+        table = tables.ObjectsTable(req, objects, **kwargs)
+        self.assertEqual(len(table.filtered_data), len(objects))
+
+    @test.create_stubs({api.swift: ('swift_filter_objects',)})
+    def test_filter_objects_paged(self):
+        container = self.containers.first()
+        objects = self.objects.list()
+        first_page, second_page = objects[:1], objects[1:]
+        args = (tables.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        # A new filter starts from the top of the folder, its "More" link
+        # resumes after the last name it scanned.
+        api.swift.swift_filter_objects(IsA(http.HttpRequest),
+                                       'test',
+                                       container.name,
+                                       prefix='',
+                                       marker=None) \
+            .AndReturn((first_page, True, 'scanned_up_to'))
+        api.swift.swift_filter_objects(IsA(http.HttpRequest),
+                                       'test',
+                                       container.name,
+                                       prefix='',
+                                       marker='scanned_up_to') \
+            .AndReturn((second_page, False, None))
+        self.mox.ReplayAll()
+
+        kwargs = {"container_name": container.name, "subfolder_path": None}
+        req = self.factory.post(index_url + '?marker=unfiltered',
+                                {'objects__filter__q': 'test'})
+        table = tables.ObjectsTable(req, objects, **kwargs)
+        self.assertEqual(table.filtered_data, first_page)
+        self.assertTrue(table.has_more_filtered_data())
+        pagination = table.get_pagination_string()
+        self.assertIn('objects__filter__q=test', pagination)
+        self.assertIn('filter_marker=scanned_up_to', pagination)
+
+        req = self.factory.get(index_url + '?' + pagination)
+        table = tables.ObjectsTable(req, objects, **kwargs)
+        self.assertEqual(table.filtered_data, second_page)
+        self.assertFalse(table.has_more_filtered_data())
+
+    def test_objects_marker(self):
+        container = self.containers.first()
+        objects = self.objects.list() + self.folder.list()
+        args = (tables.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        req = self.factory.get(index_url)
+        kwargs = {"container_name": container.name, "subfolder_path": None}
+
+        table = tables.ObjectsTable(req, objects, **kwargs)
+        names = [getattr(obj, 'subdir', None) or obj.name for obj in objects]
+        self.assertEqual(utils_http.urlquote_plus(max(names)),
+                         table.get_marker())
+
+        table = tables.ObjectsTable(req, [], **kwargs)
+        self.assertEqual('', table.get_marker())
+
     @test.create_stubs({api.swift: ('swift_get_object',)})
     def test_download(self):
         for container in self.containers.list():
@@ -330,17 +407,20 @@ class SwiftTests(test.TestCase):
                 self.mox.ResetAll()  # mandatory in a for loop
                 api.swift.swift_get_object(IsA(http.HttpRequest),
                                            container.name,
-                                           obj.name).AndReturn(obj)
+                                           obj.name,
+                                           resp_chunk_size=512 * 1024,
+                                           byte_range=None).AndReturn(obj)
                 self.mox.ReplayAll()
 
                 download_url = reverse(
                     'horizon:project:containers:object_download',
                     args=[container.name, obj.name])
                 res = self.client.get(download_url)
-                self.assertEqual(res.content, obj.data)
+                content = ''.join(res.streaming_content)
+                self.assertEqual(content, obj.data)
                 self.assertTrue(res.has_header('Content-Disposition'))
-                self.assertNotContains(res, INVALID_CONTAINER_NAME_1)
-                self.assertNotContains(res, INVALID_CONTAINER_NAME_2)
+                self.assertNotIn(INVALID_CONTAINER_NAME_1, content)
+                self.assertNotIn(INVALID_CONTAINER_NAME_2, content)
 
                 # Check that the returned Content-Disposition filename is well
                 # surrounded by double quotes and with commas removed
@@ -351,6 +431,91 @@ class SwiftTests(test.TestCase):
                     'attachment; filename=%s' % expected_name
                 )
 
+    def _get_partial_object(self, obj, data, content_range):
+        obj_info = {'name': obj.name,
+                    'bytes': len(data),
+                    'etag': 'object_hash',
+                    'content_range': content_range}
+        return api.swift.StorageObject(obj_info,
+                                       obj.container_name,
+                                       data=iter([data]))
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        partial = self._get_partial_object(obj, obj.data[2:5],
+                                           'bytes 2-4/%s' % len(obj.data))
+        api.swift.swift_get_object(IsA(http.HttpRequest),
+                                   container.name,
+                                   obj.name,
+                                   resp_chunk_size=512 * 1024,
+                                   byte_range='bytes=2-4').AndReturn(partial)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=2-4')
+        self.assertEqual(res.status_code, 206)
+        self.assertEqual(''.join(res.streaming_content), obj.data[2:5])
+        self.assertEqual(res['Content-Range'], 'bytes 2-4/%s' % len(obj.data))
+        self.assertEqual(res['Content-Length'], '3')
+        self.assertEqual(res['ETag'], '"object_hash"')
+        self.assertEqual(res['Accept-Ranges'], 'bytes')
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_multiple_ranges_ignored(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        api.swift.swift_get_object(IsA(http.HttpRequest),
+                                   container.name,
+                                   obj.name,
+                                   resp_chunk_size=512 * 1024,
+                                   byte_range=None).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=0-1,4-5')
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(''.join(res.streaming_content), obj.data)
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range_not_satisfiable(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        exc = test_exceptions.create_stubbed_exception(
+            swiftclient.client.ClientException)
+        exc.http_status = 416
+        api.swift.swift_get_object(IsA(http.HttpRequest),
+                                   container.name,
+                                   obj.name,
+                                   resp_chunk_size=512 * 1024,
+                                   byte_range='bytes=100-').AndRaise(exc)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=100-')
+        self.assertEqual(res.status_code, 416)
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    @override_settings(SWIFT_FILE_TRANSFER_CHUNK_SIZE=None)
+    def test_download_without_streaming(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        api.swift.swift_get_object(IsA(http.HttpRequest),
+                                   container.name,
+                                   obj.name,
+                                   resp_chunk_size=None,
+                                   byte_range=None).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url)
+        self.assertEqual(res.content, obj.data)
+
     @test.create_stubs({api.swift: ('swift_get_containers',)})
     def test_copy_index(self):
         ret = (self.containers.list(), False)
@@ -23,7 +23,9 @@ Views for managing Swift containers.
 """
 
 import os
+import re
 
+from django.conf import settings
 from django import http
 from django.utils.functional import cached_property  # noqa
 from django.utils.translation import ugettext_lazy as _
@@ -44,6 +46,9 @@ from openstack_dashboard.dashboards.project.containers \
 from openstack_dashboard.dashboards.project.containers import tables
 
 
+SINGLE_BYTE_RANGE_RE = re.compile(r'^bytes=(\d+-\d*|-\d+)$')
+
+
 class ContainerView(browsers.ResourceBrowserView):
     browser_class = project_browsers.ContainerBrowser
     template_name = "project/containers/index.html"
@@ -67,7 +72,7 @@ class ContainerView(browsers.ResourceBrowserView):
         The path is from the kwargs of the request.
         """
         objects = []
-        self._more = None
+        self._objects_more = None
         marker = self.request.GET.get('marker', None)
         container_name = self.kwargs['container_name']
         subfolder = self.kwargs['subfolder_path']
@@ -77,18 +82,26 @@ class ContainerView(browsers.ResourceBrowserView):
             if subfolder:
                 prefix = subfolder
             try:
-                objects, self._more = api.swift.swift_get_objects(
+                objects, self._objects_more = api.swift.swift_get_objects(
                     self.request,
                     container_name,
                     marker=marker,
                     prefix=prefix)
             except Exception:
-                self._more = None
+                self._objects_more = None
                 objects = []
                 msg = _('Unable to retrieve object list.')
                 exceptions.handle(self.request, msg)
         return objects
 
+    def has_more_data(self, table):
+        if table.name != tables.ObjectsTable._meta.name:
+            return False
+        if table.get_filter_string():
+            # The filter looks for its own page of matching objects.
+            return table.has_more_filtered_data()
+        return bool(self.objects and self._objects_more)
+
     def is_subdir(self, item):
         content_type = "application/pseudo-folder"
         return getattr(item, "content_type", None) == content_type
@@ -191,9 +204,23 @@ class UploadView(forms.ModalFormView):
 
 
 def object_download(request, container_name, object_path):
+    chunk_size = getattr(settings, 'SWIFT_FILE_TRANSFER_CHUNK_SIZE',
+                         512 * 1024)
+    # Only single byte ranges are passed on to Swift; anything else is
+    # answered with the whole object, as HTTP allows.
+    byte_range = request.META.get('HTTP_RANGE')
+    if byte_range and not SINGLE_BYTE_RANGE_RE.match(byte_range):
+        byte_range = None
     try:
-        obj = api.swift.swift_get_object(request, container_name, object_path)
-    except Exception:
+        obj = api.swift.swift_get_object(request,
+                                         container_name,
+                                         object_path,
+                                         resp_chunk_size=chunk_size,
+                                         byte_range=byte_range)
+    except Exception as e:
+        # The requested range lies outside of the object.
+        if byte_range and getattr(e, 'http_status', None) == 416:
+            return http.HttpResponse(status=416)
         redirect = reverse("horizon:project:containers:index")
         exceptions.handle(request,
                           _("Unable to retrieve object."),
@@ -204,11 +231,21 @@ def object_download(request, container_name, object_path):
     if not os.path.splitext(obj.name)[1] and obj.orig_name:
         name, ext = os.path.splitext(obj.orig_name)
         filename = "%s%s" % (filename, ext)
-    response = http.HttpResponse()
+    if chunk_size:
+        response = http.StreamingHttpResponse(obj.data)
+    else:
+        response = http.HttpResponse(obj.data)
     safe_name = filename.replace(",", "").encode('utf-8')
     response['Content-Disposition'] = 'attachment; filename="%s"' % safe_name
     response['Content-Type'] = 'application/octet-stream'
-    response.write(obj.data)
+    response['Accept-Ranges'] = 'bytes'
+    if getattr(obj, 'bytes', None) is not None:
+        response['Content-Length'] = obj.bytes
+    if getattr(obj, 'etag', None):
+        response['ETag'] = '"%s"' % obj.etag.strip('"')
+    if getattr(obj, 'content_range', None):
+        response.status_code = 206
+        response['Content-Range'] = obj.content_range
     return response
 
 
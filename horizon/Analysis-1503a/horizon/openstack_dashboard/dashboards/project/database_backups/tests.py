@@ -21,27 +21,56 @@ from mox import IsA  # noqa
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
+from troveclient import common
+
 INDEX_URL = reverse('horizon:project:database_backups:index')
 BACKUP_URL = reverse('horizon:project:database_backups:create')
 DETAILS_URL = reverse('horizon:project:database_backups:detail', args=['id'])
 
 
 class DatabasesBackupsTests(test.TestCase):
-    @test.create_stubs({api.trove: ('backup_list', 'instance_get')})
+    @test.create_stubs({api.trove: ('backup_list', 'instance_list')})
     def test_index(self):
         api.trove.backup_list(IsA(http.HttpRequest))\
             .AndReturn(self.database_backups.list())
+        # All of the instances are listed once, page by page.
+        databases = self.databases.list()
+        api.trove.instance_list(IsA(http.HttpRequest), marker=None)\
+            .AndReturn(common.Paginated(databases[:1],
+                                        next_marker=databases[0].id))
+        api.trove.instance_list(IsA(http.HttpRequest),
+                                marker=databases[0].id)\
+            .AndReturn(common.Paginated(databases[1:]))
 
-        api.trove.instance_get(IsA(http.HttpRequest),
-                               IsA(str))\
-            .MultipleTimes()\
-            .AndReturn(self.databases.first())
+        self.mox.ReplayAll()
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertTemplateUsed(res, 'project/database_backups/index.html')
+        for backup in res.context['table'].data:
+            self.assertEqual(backup.instance_id, backup.instance.id)
+
+    @test.create_stubs({api.trove: ('backup_list', 'instance_list',
+                                    'instance_get')})
+    def test_index_instance_not_listed(self):
+        backups = self.database_backups.list()
+        api.trove.backup_list(IsA(http.HttpRequest))\
+            .AndReturn(backups)
+        api.trove.instance_list(IsA(http.HttpRequest), marker=None)\
+            .AndReturn(common.Paginated(self.databases.list()[:1]))
+        # Instances missing from the list are fetched one by one.
+        api.trove.instance_get(IsA(http.HttpRequest), backups[1].instance_id)\
+            .AndRaise(self.exceptions.trove)
 
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
 
         self.assertTemplateUsed(res, 'project/database_backups/index.html')
+        self.assertNoMessages(res)
+        data = res.context['table'].data
+        self.assertEqual(self.databases.first().id, data[0].instance.id)
+        self.assertEqual('Not Found', data[1].instance)
 
     @test.create_stubs({api.trove: ('backup_list',)})
     def test_index_exception(self):
@@ -37,25 +37,23 @@ class IndexView(horizon_tables.DataTableView):
 
     def _get_extra_data(self, backup):
         """Apply extra info to the backup."""
-        instance_id = backup.instance_id
-        # TODO(rdopieralski) It's not clear where this attribute is supposed
-        # to come from. At first glance it looks like it will always be {}.
-        if not hasattr(self, '_instances'):
-            self._instances = {}
-        instance = self._instances.get(instance_id)
-        if instance is None:
-            try:
-                instance = api.trove.instance_get(self.request, instance_id)
-            except Exception:
-                instance = _('Not Found')
-        backup.instance = instance
+        backup.instance = self._instances.get(backup.instance_id,
+                                              _('Not Found'))
         return backup
 
+    def _get_instances(self, backups):
+        try:
+            return api.trove.instances_by_id(
+                self.request, [backup.instance_id for backup in backups])
+        except Exception:
+            return {}
+
     def get_data(self):
         # TODO(rmyers) Add pagination support after it is available
         # https://blueprints.launchpad.net/trove/+spec/paginate-backup-list
         try:
             backups = api.trove.backup_list(self.request)
+            self._instances = self._get_instances(backups)
             backups = map(self._get_extra_data, backups)
         except Exception:
             backups = []
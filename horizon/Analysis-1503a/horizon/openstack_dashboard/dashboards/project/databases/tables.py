@@ -119,8 +119,8 @@ class UpdateRow(tables.Row):
     def get_data(self, request, instance_id):
         instance = api.trove.instance_get(request, instance_id)
         try:
-            flavor_id = instance.flavor['id']
-            instance.full_flavor = api.trove.flavor_get(request, flavor_id)
+            flavors = api.trove.flavors_by_id(request)
+            instance.full_flavor = flavors[unicode(instance.flavor['id'])]
         except Exception:
             pass
         return instance
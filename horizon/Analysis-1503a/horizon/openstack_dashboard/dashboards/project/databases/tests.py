@@ -24,6 +24,7 @@ from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
 from troveclient import common
+from troveclient.v1 import flavors
 
 
 INDEX_URL = reverse('horizon:project:databases:index')
@@ -116,6 +117,28 @@ class DatabaseTests(test.TestCase):
         self.assertTemplateUsed(res, 'project/databases/index.html')
         self.assertMessageCount(res, error=1)
 
+    @test.create_stubs(
+        {api.trove: ('instance_get', 'flavor_list')})
+    def test_row_update(self):
+        database = self.databases.first()
+        flavor = flavors.Flavor(flavors.Flavors(None),
+                                {'id': database.flavor['id'],
+                                 'name': 'db.small', 'ram': 512})
+        api.trove.instance_get(IsA(http.HttpRequest), database.id)\
+            .AndReturn(database)
+        # The flavor comes from the flavor list rather than a flavor_get.
+        api.trove.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn([flavor])
+
+        self.mox.ReplayAll()
+        params = {'action': 'row_update',
+                  'table': 'databases',
+                  'obj_id': database.id}
+        res = self.client.get(INDEX_URL, params,
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertTemplateUsed(res, "horizon/common/_data_table_row.html")
+        self.assertContains(res, "db.small | 512MB RAM")
+
     @test.create_stubs({
         api.trove: ('flavor_list', 'backup_list',)})
     def test_launch_instance(self):
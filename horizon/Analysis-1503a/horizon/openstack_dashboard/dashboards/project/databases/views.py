@@ -20,7 +20,6 @@ Views for managing database instances.
 import logging
 
 from django.core.urlresolvers import reverse
-from django.utils.datastructures import SortedDict
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -56,12 +55,11 @@ class IndexView(horizon_tables.DataTableView):
     @memoized.memoized_method
     def get_flavors(self):
         try:
-            flavors = api.trove.flavor_list(self.request)
+            return api.trove.flavors_by_id(self.request)
         except Exception:
-            flavors = []
             msg = _('Unable to retrieve database size information.')
             exceptions.handle(self.request, msg)
-        return SortedDict((unicode(flavor.id), flavor) for flavor in flavors)
+            return {}
 
     def _extra_data(self, instance):
         flavor = self.get_flavors().get(instance.flavor["id"])
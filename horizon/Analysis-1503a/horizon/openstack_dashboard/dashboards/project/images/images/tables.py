@@ -215,7 +215,8 @@ class ImagesTable(tables.DataTable):
                            filters=(filters.title,),
                            verbose_name=_("Status"),
                            status=True,
-                           status_choices=STATUS_CHOICES)
+                           status_choices=STATUS_CHOICES,
+                           sort_key="status")
     public = tables.Column("is_public",
                            verbose_name=_("Public"),
                            empty_value=False,
@@ -224,7 +225,8 @@ class ImagesTable(tables.DataTable):
                               verbose_name=_("Protected"),
                               empty_value=False,
                               filters=(filters.yesno, filters.capfirst))
-    disk_format = tables.Column(get_format, verbose_name=_("Format"))
+    disk_format = tables.Column(get_format, verbose_name=_("Format"),
+                                sort_key="disk_format")
 
     class Meta:
         name = "images"
@@ -126,10 +126,12 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([public_images, False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([private_images, False])
 
         self.mox.ReplayAll()
@@ -151,10 +153,12 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([public_images, False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([private_images, False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': 'other-tenant',
@@ -195,6 +199,44 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
             len(private_images),
             len(images_cache['images_by_project']['other-tenant']))
 
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_list_image_shared_cache(self):
+        public_images = [image for image in self.images.list()
+                         if image.status == 'active' and image.is_public]
+        private_images = [image for image in self.images.list()
+                          if (image.status == 'active' and
+                              not image.is_public)]
+        api.glance.image_list_detailed(IsA(http.HttpRequest),
+                                       filters={'is_public': True,
+                                                'status': 'active'}) \
+                  .InAnyOrder() \
+                  .AndReturn([public_images, False])
+        api.glance.image_list_detailed(IsA(http.HttpRequest),
+                            filters={'property-owner_id': self.tenant.id,
+                                     'status': 'active'}) \
+                  .InAnyOrder() \
+                  .AndReturn([private_images, False])
+        api.glance.image_list_detailed(IsA(http.HttpRequest),
+                            filters={'property-owner_id': 'other-tenant',
+                                     'status': 'active'}) \
+                  .AndReturn([[], False])
+
+        self.mox.ReplayAll()
+
+        ret = utils.get_available_images(self.request, self.tenant.id)
+        expected_ids = [image.id for image in ret]
+
+        # Later requests share the image catalogue, for the public images
+        # and for the images of their own project.
+        ret = utils.get_available_images(self.request, self.tenant.id, {})
+        self.assertEqual(expected_ids, [image.id for image in ret])
+
+        ret = utils.get_available_images(self.request, 'other-tenant', {})
+        self.assertEqual(
+            [image.id for image in public_images
+             if image.container_format not in ('aki', 'ari')],
+            [image.id for image in ret])
+
     @test.create_stubs({api.glance: ('image_list_detailed',),
                         exceptions: ('handle',)})
     def test_list_image_error_public_image_list(self):
@@ -206,12 +248,14 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndRaise(self.exceptions.glance)
         exceptions.handle(IsA(http.HttpRequest),
                           "Unable to retrieve public images.")
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([private_images, False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
@@ -258,10 +302,12 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([public_images, False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndRaise(self.exceptions.glance)
         exceptions.handle(IsA(http.HttpRequest),
                           "Unable to retrieve images for the current project.")
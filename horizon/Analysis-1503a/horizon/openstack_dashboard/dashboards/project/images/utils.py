@@ -10,9 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import itertools
+
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import glance
 
@@ -22,56 +25,53 @@ def get_available_images(request, project_id=None, images_cache=None):
     project_id. If project_id is not specified, only public images
     are returned.
 
+    Both lists come from the image catalogue cache (see
+    :func:`~openstack_dashboard.api.glance.image_list_public` and
+    :func:`~openstack_dashboard.api.glance.image_list_owned`) and, when
+    neither is in ``images_cache`` yet, they are fetched concurrently.
+
     :param images_cache: An optional dict-like object in which to
      cache public and per-project id image metadata.
 
     """
     if images_cache is None:
         images_cache = {}
-    public_images = images_cache.get('public_images', [])
-    images_by_project = images_cache.get('images_by_project', {})
+    images_by_project = images_cache.setdefault('images_by_project', {})
+
+    # Preempt if we don't have a project_id yet.
+    if project_id is None:
+        images_by_project[project_id] = []
+
+    with concurrency.Executor() as executor:
+        if 'public_images' not in images_cache:
+            public = executor.submit(glance.image_list_public, request)
+        if project_id not in images_by_project:
+            owned = executor.submit(glance.image_list_owned, request,
+                                    project_id)
+
     if 'public_images' not in images_cache:
-        public = {"is_public": True,
-                  "status": "active"}
         try:
-            images, _more = glance.image_list_detailed(
-                request, filters=public)
-            [public_images.append(image) for image in images]
-            images_cache['public_images'] = public_images
+            images_cache['public_images'] = public.result()
         except Exception:
             exceptions.handle(request,
                               _("Unable to retrieve public images."))
-
-    # Preempt if we don't have a project_id yet.
-    if project_id is None:
-        images_by_project[project_id] = []
+    public_images = images_cache.get('public_images', [])
 
     if project_id not in images_by_project:
-        owner = {"property-owner_id": project_id,
-                 "status": "active"}
         try:
-            owned_images, _more = glance.image_list_detailed(
-                request, filters=owner)
-            images_by_project[project_id] = owned_images
+            images_by_project[project_id] = owned.result()
         except Exception:
-            owned_images = []
             exceptions.handle(request,
                               _("Unable to retrieve images for "
                                 "the current project."))
-    else:
-        owned_images = images_by_project[project_id]
-
-    if 'images_by_project' not in images_cache:
-        images_cache['images_by_project'] = images_by_project
-
-    images = owned_images + public_images
+    owned_images = images_by_project.get(project_id, [])
 
     # Remove duplicate images
-    image_ids = []
+    image_ids = set()
     final_images = []
-    for image in images:
+    for image in itertools.chain(owned_images, public_images):
         if image.id not in image_ids:
-            image_ids.append(image.id)
+            image_ids.add(image.id)
             final_images.append(image)
     return [image for image in final_images
             if image.container_format not in ('aki', 'ari')]
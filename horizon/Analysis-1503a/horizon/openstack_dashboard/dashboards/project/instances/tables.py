@@ -37,6 +37,7 @@ from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.access_and_security.floating_ips \
     import workflows
 from openstack_dashboard.dashboards.project.instances import tabs
+from openstack_dashboard.usage import quotas
 
 
 LOG = logging.getLogger(__name__)
@@ -92,6 +93,7 @@ class TerminateInstance(tables.BatchAction):
 
     def action(self, request, obj_id):
         api.nova.server_delete(request, obj_id)
+        quotas.invalidate_cached_usages(request)
 
 
 class RebootInstance(tables.BatchAction):
@@ -514,6 +516,7 @@ class SimpleAssociateIP(tables.Action):
                 request, instance_id).split('_')[0]
 
             fip = api.network.tenant_floating_ip_allocate(request)
+            quotas.tally_cached_usages(request, floating_ips=1)
             api.network.floating_ip_associate(request, fip.id, target_id)
             messages.success(request,
                              _("Successfully associated floating IP: %s")
@@ -594,6 +597,9 @@ def get_instance_error(instance):
 
 class UpdateRow(tables.Row):
     ajax = True
+    # Below this many rows a server_get and a flavor_get per row are
+    # cheaper than listing every instance and flavor of the project.
+    batch_list_threshold = 5
 
     def get_data(self, request, instance_id):
         instance = api.nova.server_get(request, instance_id)
@@ -604,6 +610,37 @@ class UpdateRow(tables.Row):
             messages.error(request, error)
         return instance
 
+    def get_data_batch(self, request, instance_ids):
+        if len(instance_ids) < self.batch_list_threshold:
+            return super(UpdateRow, self).get_data_batch(request,
+                                                         instance_ids)
+        # One list of the project's instances and one of the flavors
+        # replace a server_get and a flavor_get for every row.
+        servers, has_more = api.nova.server_list(request)
+        servers = dict((server.id, server) for server in servers)
+        flavors = dict((flavor.id, flavor)
+                       for flavor in api.nova.flavor_list(request))
+        # Nova caps the length of the list, so an instance missing from it
+        # may still exist. Only a 404 from its own lookup marks it deleted.
+        missing_ids = [instance_id for instance_id in instance_ids
+                       if instance_id not in servers]
+        data = super(UpdateRow, self).get_data_batch(request, missing_ids)
+        for instance_id in instance_ids:
+            instance = servers.get(instance_id)
+            if instance is None:
+                continue
+            flavor_id = instance.flavor["id"]
+            if flavor_id in flavors:
+                instance.full_flavor = flavors[flavor_id]
+            else:
+                instance.full_flavor = api.nova.flavor_get(request,
+                                                           flavor_id)
+            error = get_instance_error(instance)
+            if error:
+                messages.error(request, error)
+            data[instance_id] = instance
+        return data
+
 
 class StartInstance(tables.BatchAction):
     name = "start"
@@ -1007,6 +1007,18 @@ class InstanceTests(test.TestCase):
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    def _get_launch_workflow(self, url):
+        # Only the first step of the launch workflow is rendered with the
+        # page, the others are requested separately. Add them to the page
+        # so that every step can be checked.
+        res = self.client.get(url)
+        for step in res.context['workflow'].steps:
+            if step.action.choices_deferred:
+                step_res = self.client.get(step.get_deferred_url())
+                self.assertEqual(200, step_res.status_code)
+                res.content += step_res.content
+        return res
+
     def _instance_update_post(self, server_id, server_name, secgroups):
         default_role_field_name = 'default_' + \
             workflows.update_instance.INSTANCE_SEC_GROUP_SLUG + '_role'
@@ -1092,6 +1104,55 @@ class InstanceTests(test.TestCase):
         res = self._instance_update_post(server.id, server.name, [])
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    @test.create_stubs({api.nova: ('extension_supported',
+                                   'flavor_list',
+                                   'tenant_absolute_limits',
+                                   'availability_zone_list',),
+                        cinder: ('volume_snapshot_list',
+                                 'volume_list',),
+                        api.glance: ('image_list_detailed',)})
+    def test_launch_instance_get_defers_steps(self):
+        # Only the details step is populated when the workflow is opened;
+        # key pairs, security groups and networks are not listed yet.
+        api.nova.extension_supported('BlockDeviceMappingV2Boot',
+                                     IsA(http.HttpRequest)) \
+                .AndReturn(True)
+        cinder.volume_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.volumes.list())
+        cinder.volume_snapshot_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.volumes.list())
+        api.glance.image_list_detailed(IsA(http.HttpRequest),
+                                       filters={'is_public': True,
+                                                'status': 'active'}) \
+            .InAnyOrder() \
+            .AndReturn([self.images.list(), False])
+        api.glance.image_list_detailed(IsA(http.HttpRequest),
+                            filters={'property-owner_id': self.tenant.id,
+                                     'status': 'active'}) \
+                .InAnyOrder() \
+                .AndReturn([[], False])
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest))\
+                .AndReturn(self.limits['absolute'])
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.flavors.list())
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.flavors.list())
+        api.nova.availability_zone_list(IsA(http.HttpRequest)) \
+                .AndReturn(self.availability_zones.list())
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:instances:launch')
+        res = self.client.get(url)
+
+        workflow = res.context['workflow']
+        deferred = [step.slug for step in workflow.steps
+                    if step.action.choices_deferred]
+        self.assertEqual(['setaccesscontrolsaction', 'setnetworkaction'],
+                         deferred)
+        for slug in deferred:
+            self.assertContains(res, 'data-deferred-url="%s?deferred_step=%s"'
+                                % (url, slug))
+
     @test.create_stubs({api.nova: ('extension_supported',
                                    'flavor_list',
                                    'keypair_list',
@@ -1121,10 +1182,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                .InAnyOrder() \
                 .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1159,7 +1222,7 @@ class InstanceTests(test.TestCase):
         url = reverse('horizon:project:instances:launch')
         params = urlencode({"source_type": "image_id",
                             "source_id": image.id})
-        res = self.client.get("%s?%s" % (url, params))
+        res = self._get_launch_workflow("%s?%s" % (url, params))
 
         workflow = res.context['workflow']
         self.assertTemplateUsed(res, views.WorkflowView.template_name)
@@ -1307,10 +1370,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1424,10 +1489,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1544,11 +1611,13 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
 
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1654,10 +1723,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                .InAnyOrder() \
                 .AndReturn([[], False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                .InAnyOrder() \
                 .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1733,10 +1804,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1765,7 +1838,7 @@ class InstanceTests(test.TestCase):
         self.mox.ReplayAll()
 
         url = reverse('horizon:project:instances:launch')
-        res = self.client.get(url)
+        res = self._get_launch_workflow(url)
 
         self.assertTemplateUsed(res, views.WorkflowView.template_name)
 
@@ -1813,10 +1886,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -1930,10 +2005,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -2023,10 +2100,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -2145,10 +2224,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                  .InAnyOrder() \
                   .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -2324,10 +2405,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+                .InAnyOrder() \
                 .AndReturn([[], False])
         api.neutron.network_list(IsA(http.HttpRequest),
                                  tenant_id=self.tenant.id,
@@ -2359,7 +2442,7 @@ class InstanceTests(test.TestCase):
         self.mox.ReplayAll()
 
         url = reverse('horizon:project:instances:launch')
-        res = self.client.get(url)
+        res = self._get_launch_workflow(url)
         self.assertContains(
             res, "<option selected='selected' value='%(key)s'>"
                  "%(key)s</option>" % {'key': keypair.name},
@@ -2549,10 +2632,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
 
         self.mox.ReplayAll()
@@ -2600,10 +2685,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
         api.nova.server_rebuild(IsA(http.HttpRequest),
                                 server.id,
@@ -2628,10 +2715,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
         api.nova.server_rebuild(IsA(http.HttpRequest),
                                 server.id,
@@ -2658,10 +2747,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
 
         self.mox.ReplayAll()
@@ -2680,10 +2771,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
         api.nova.server_rebuild(IsA(http.HttpRequest),
                                 server.id,
@@ -2709,10 +2802,12 @@ class InstanceTests(test.TestCase):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                                        filters={'is_public': True,
                                                 'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([self.images.list(), False])
         api.glance.image_list_detailed(IsA(http.HttpRequest),
                             filters={'property-owner_id': self.tenant.id,
                                      'status': 'active'}) \
+            .InAnyOrder() \
             .AndReturn([[], False])
         api.nova.server_rebuild(IsA(http.HttpRequest),
                                 server.id,
@@ -2908,3 +3003,118 @@ class InstanceAjaxTests(test.TestCase):
         # a different availability zone.', u'']]
         self.assertEqual(messages[0][0], 'error')
         self.assertTrue(messages[0][1].startswith('Failed'))
+
+    @test.create_stubs({api.nova: ("server_list",
+                                   "server_get",
+                                   "flavor_list",
+                                   "extension_supported"),
+                        api.neutron: ("is_extension_supported",)})
+    def test_rows_update(self):
+        servers = self.servers.list()[:2]
+        deleted = ['deleted-%s' % i for i in
+                   range(tables.UpdateRow.batch_list_threshold)]
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        # A single list call covers every row, however many there are.
+        api.nova.server_list(IsA(http.HttpRequest))\
+            .AndReturn([servers, False])
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+        # Only a 404 of their own marks the rows missing from it deleted.
+        for obj_id in deleted:
+            api.nova.server_get(IsA(http.HttpRequest), obj_id)\
+                .AndRaise(self.exceptions.nova_not_found)
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'rows_update'),
+                  ('table', 'instances'),
+                  ('obj_id', servers[0].id),
+                  ('obj_id', servers[1].id)]
+        params.extend(('obj_id', obj_id) for obj_id in deleted)
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        rows = json.loads(res.content)['rows']
+        self.assertIn(servers[0].name, rows[servers[0].id])
+        self.assertIn(servers[1].name, rows[servers[1].id])
+        for obj_id in deleted:
+            self.assertIsNone(rows[obj_id])
+
+    @test.create_stubs({api.nova: ("server_list",
+                                   "server_get",
+                                   "flavor_list",
+                                   "flavor_get",
+                                   "extension_supported"),
+                        api.neutron: ("is_extension_supported",)})
+    def test_rows_update_instance_missing_from_list(self):
+        # Nova capped the list before the last instance.
+        listed = self.servers.list()
+        unlisted = listed.pop()
+        deleted = ['deleted-%s' % i for i in
+                   range(tables.UpdateRow.batch_list_threshold)]
+        flavor = self.flavors.first()
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_list(IsA(http.HttpRequest))\
+            .AndReturn([listed, False])
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+        api.nova.server_get(IsA(http.HttpRequest), unlisted.id)\
+            .AndReturn(unlisted)
+        api.nova.flavor_get(IsA(http.HttpRequest), unlisted.flavor['id'])\
+            .AndReturn(flavor)
+        for obj_id in deleted:
+            api.nova.server_get(IsA(http.HttpRequest), obj_id)\
+                .AndRaise(self.exceptions.nova_not_found)
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'rows_update'), ('table', 'instances')]
+        params.extend(('obj_id', server.id) for server in listed)
+        params.append(('obj_id', unlisted.id))
+        params.extend(('obj_id', obj_id) for obj_id in deleted)
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        rows = json.loads(res.content)['rows']
+        for server in listed:
+            self.assertIn(server.name, rows[server.id])
+        self.assertIn(unlisted.name, rows[unlisted.id])
+        for obj_id in deleted:
+            self.assertIsNone(rows[obj_id])
+
+    @test.create_stubs({api.nova: ("server_get",
+                                   "flavor_get",
+                                   "extension_supported"),
+                        api.neutron: ("is_extension_supported",)})
+    def test_rows_update_few_rows(self):
+        server = self.servers.first()
+        flavor = self.flavors.first()
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        # Too few rows to be worth listing every instance of the project.
+        api.nova.server_get(IsA(http.HttpRequest), server.id)\
+            .AndReturn(server)
+        api.nova.flavor_get(IsA(http.HttpRequest), server.flavor['id'])\
+            .AndReturn(flavor)
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'rows_update'),
+                  ('table', 'instances'),
+                  ('obj_id', server.id)]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        rows = json.loads(res.content)['rows']
+        self.assertIn(server.name, rows[server.id])
@@ -32,6 +32,7 @@ from horizon import exceptions
 from horizon import forms
 from horizon import tables
 from horizon import tabs
+from horizon.utils import concurrency
 from horizon.utils import memoized
 from horizon import workflows
 
@@ -69,8 +70,20 @@ class IndexView(tables.DataTableView):
                               _('Unable to retrieve instances.'))
 
         if instances:
+            # The address, flavor and image lookups are independent of each
+            # other, so issue them concurrently.
+            with concurrency.Executor() as executor:
+                addresses_call = executor.submit(
+                    api.network.servers_update_addresses,
+                    self.request, instances)
+                flavors_call = executor.submit(api.nova.flavor_list,
+                                               self.request)
+                # TODO(gabriel): Handle pagination.
+                images_call = executor.submit(api.glance.image_list_detailed,
+                                              self.request)
+
             try:
-                api.network.servers_update_addresses(self.request, instances)
+                addresses_call.result()
             except Exception:
                 exceptions.handle(
                     self.request,
@@ -79,14 +92,13 @@ class IndexView(tables.DataTableView):
 
             # Gather our flavors and images and correlate our instances to them
             try:
-                flavors = api.nova.flavor_list(self.request)
+                flavors = flavors_call.result()
             except Exception:
                 flavors = []
                 exceptions.handle(self.request, ignore=True)
 
             try:
-                # TODO(gabriel): Handle pagination.
-                images, more = api.glance.image_list_detailed(self.request)
+                images, more = images_call.result()
             except Exception:
                 images = []
                 exceptions.handle(self.request, ignore=True)
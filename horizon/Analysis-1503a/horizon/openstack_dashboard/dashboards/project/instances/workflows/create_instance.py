@@ -132,6 +132,10 @@ class SetInstanceDetailsAction(workflows.Action):
         name = _("Details")
         help_text_template = ("project/instances/"
                               "_launch_details_help.html")
+        # Instance snapshots are picked out of the images listed for
+        # image_id, so they are left to run afterwards.
+        independent_choices = ("flavor", "availability_zone", "image_id",
+                               "volume_id", "volume_snapshot_id")
 
     def __init__(self, request, context, *args, **kwargs):
         self._init_images_cache()
@@ -475,6 +479,7 @@ class SetAccessControlsAction(workflows.Action):
         name = _("Access & Security")
         help_text = _("Control access to your instance via key pairs, "
                       "security groups, and other mechanisms.")
+        independent_choices = ("keypair", "groups")
 
     def __init__(self, request, *args, **kwargs):
         super(SetAccessControlsAction, self).__init__(request, *args, **kwargs)
@@ -575,19 +580,11 @@ class SetNetworkAction(workflows.Action):
                                 help_text=_("Launch instance with "
                                             "this policy profile"))
 
-    def __init__(self, request, *args, **kwargs):
-        super(SetNetworkAction, self).__init__(request, *args, **kwargs)
-        network_list = self.fields["network"].choices
-        if len(network_list) == 1:
-            self.fields['network'].initial = [network_list[0][0]]
-        if api.neutron.is_port_profiles_supported():
-            self.fields['profile'].choices = (
-                self.get_policy_profile_choices(request))
-
     class Meta:
         name = _("Networking")
         permissions = ('openstack.services.network',)
         help_text = _("Select networks for your instance.")
+        independent_choices = ("network", "profile")
 
     def populate_network_choices(self, request, context):
         try:
@@ -600,8 +597,15 @@ class SetNetworkAction(workflows.Action):
             network_list = []
             exceptions.handle(request,
                               _('Unable to retrieve networks.'))
+        if len(network_list) == 1:
+            self.fields['network'].initial = [network_list[0][0]]
         return network_list
 
+    def populate_profile_choices(self, request, context):
+        if api.neutron.is_port_profiles_supported():
+            return self.get_policy_profile_choices(request)
+        return []
+
     def get_policy_profile_choices(self, request):
         profile_choices = [('', '')]
         for profile in self._get_profiles(request, 'policy'):
@@ -676,6 +680,8 @@ class LaunchInstance(workflows.Workflow):
                      SetNetwork,
                      PostCreationStep,
                      SetAdvanced)
+    # Only the step the workflow begins on is populated when it is opened.
+    defer_choices = True
 
     def format_status_message(self, message):
         name = self.context.get('name', 'unknown instance')
@@ -762,6 +768,8 @@ class LaunchInstance(workflows.Workflow):
                                    instance_count=int(context['count']),
                                    admin_pass=context['admin_pass'],
                                    disk_config=context['disk_config'])
+            quotas.tally_cached_instances(request, context['flavor'],
+                                          int(context['count']))
             return True
         except Exception:
             exceptions.handle(request)
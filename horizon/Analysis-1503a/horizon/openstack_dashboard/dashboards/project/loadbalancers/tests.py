@@ -473,7 +473,8 @@ class LoadBalancerTests(test.TestCase):
             {'fixed_ips': [{'ip_address': member.address,
                             'subnet_id':
                             'e8abc972-eb0c-41f1-9edd-4bc6e3bcd8c9'}],
-             'network_id': '82288d84-e0a5-42ac-95be-e6af08727e42'})
+             'network_id': '82288d84-e0a5-42ac-95be-e6af08727e42',
+             'device_id': server1.id})
 
         api.lbaas.pool_list(IsA(http.HttpRequest), tenant_id=self.tenant.id) \
             .AndReturn(self.pools.list())
@@ -489,12 +490,13 @@ class LoadBalancerTests(test.TestCase):
                 {'fixed_ips': [{'ip_address': '172.16.88.12',
                                 'subnet_id':
                                 '3f7c5d79-ee55-47b0-9213-8e669fb03009'}],
-                 'network_id': '72c3ab6c-c80f-4341-9dc5-210fa31ac6c2'})
+                 'network_id': '72c3ab6c-c80f-4341-9dc5-210fa31ac6c2',
+                 'device_id': server1.id})
             api.neutron.port_list(IsA(http.HttpRequest),
-                device_id=server1.id).AndReturn([port1, port2])
+                device_id=[server1.id]).AndReturn([port1, port2])
         else:
             api.neutron.port_list(IsA(http.HttpRequest),
-                device_id=server1.id).AndReturn([port1, ])
+                device_id=[server1.id]).AndReturn([port1, ])
 
         params = {'pool_id': member.pool_id,
                   'address': member.address,
@@ -522,6 +524,73 @@ class LoadBalancerTests(test.TestCase):
         self.assertNoFormErrors(res)
         self.assertRedirectsNoFollow(res, str(self.INDEX_URL))
 
+    @test.create_stubs({api.lbaas: ('pool_list', 'pool_get', 'member_create'),
+                        api.neutron: ('port_list',),
+                        api.nova: ('server_list',)})
+    def _test_add_members_post(self, failures):
+        member = self.members.first()
+        pool = self.pools.list()[1]
+        subnet_id = 'e8abc972-eb0c-41f1-9edd-4bc6e3bcd8c9'
+        servers = [self.AttributeDict({'id': 'server-%s' % i,
+                                       'name': 'vm%s' % i})
+                   for i in range(4)]
+        # The last server has no port, so it can't become a member.
+        ports = [self.AttributeDict(
+            {'fixed_ips': [{'ip_address': '10.0.0.%s' % i,
+                            'subnet_id': subnet_id}],
+             'network_id': '82288d84-e0a5-42ac-95be-e6af08727e42',
+             'device_id': server.id}) for i, server in enumerate(servers[:3])]
+        server_ids = [server.id for server in servers]
+
+        api.lbaas.pool_list(IsA(http.HttpRequest), tenant_id=self.tenant.id) \
+            .AndReturn(self.pools.list())
+        api.nova.server_list(IsA(http.HttpRequest)).AndReturn(
+            [servers, False])
+        api.lbaas.pool_get(
+            IsA(http.HttpRequest), pool.id).AndReturn(pool)
+        # All of the ports are looked up at once.
+        api.neutron.port_list(IsA(http.HttpRequest),
+                              device_id=server_ids).AndReturn(ports)
+        for i, port in enumerate(ports):
+            call = api.lbaas.member_create(
+                IsA(http.HttpRequest), pool_id=member.pool_id,
+                address=port.fixed_ips[0]['ip_address'],
+                protocol_port=member.protocol_port, weight=member.weight,
+                members=server_ids,
+                admin_state_up=member.admin_state_up).InAnyOrder()
+            if i in failures:
+                call.AndRaise(self.exceptions.neutron)
+            else:
+                call.AndReturn(member)
+        self.mox.ReplayAll()
+
+        form_data = {'pool_id': member.pool_id,
+                     'protocol_port': member.protocol_port,
+                     'weight': member.weight,
+                     'members': server_ids,
+                     'admin_state_up': member.admin_state_up}
+        return self.client.post(reverse(self.ADDMEMBER_PATH), form_data)
+
+    def test_add_members_post(self):
+        res = self._test_add_members_post(failures=())
+
+        self.assertNoFormErrors(res)
+        self.assertRedirectsNoFollow(res, str(self.INDEX_URL))
+        self.assertMessageCount(success=1)
+
+    def test_add_members_post_partial_failure(self):
+        res = self._test_add_members_post(failures=(1,))
+
+        self.assertNoFormErrors(res)
+        self.assertRedirectsNoFollow(res, str(self.INDEX_URL))
+        self.assertMessageCount(success=1, warning=1)
+
+    def test_add_members_post_failure(self):
+        res = self._test_add_members_post(failures=(0, 1, 2))
+
+        self.assertNoFormErrors(res)
+        self.assertMessageCount(error=1)
+
     @test.create_stubs({api.lbaas: ('pool_list',),
                         api.nova: ('server_list',)})
     def test_add_member_post_with_error(self):
@@ -20,6 +20,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon import forms
+from horizon import messages
 from horizon.utils import fields
 from horizon.utils import validators
 from horizon import workflows
@@ -391,6 +392,36 @@ class AddMember(workflows.Workflow):
     success_url = "horizon:project:loadbalancers:index"
     default_steps = (AddMemberStep,)
 
+    def _member_addresses(self, request, device_ids, subnet_id):
+        """Returns the address each instance should join the pool with.
+
+        The ports of all of the instances are fetched in a single query and
+        indexed by device and subnet. An instance with an address on the
+        pool subnet joins with it, otherwise with the first address of its
+        port on the first of its networks. Instances without any address
+        are left out.
+        """
+        ports = api.neutron.port_list(request, device_id=list(device_ids))
+        # Sort the ports by network. This is needed to avoid attachment of
+        # random ports in case of creation of several members attached to
+        # several networks.
+        addresses = {}
+        for port in sorted(ports, key=lambda port: port.network_id):
+            if not port.fixed_ips:
+                continue
+            addresses.setdefault((port.device_id, None),
+                                 port.fixed_ips[0]['ip_address'])
+            for ip in port.fixed_ips:
+                addresses.setdefault((port.device_id, ip['subnet_id']),
+                                     ip['ip_address'])
+        selected = {}
+        for device_id in device_ids:
+            address = (addresses.get((device_id, subnet_id)) or
+                       addresses.get((device_id, None)))
+            if address:
+                selected[device_id] = address
+        return selected
+
     def handle(self, request, context):
         try:
             pool = api.lbaas.pool_get(request, context['pool_id'])
@@ -399,37 +430,32 @@ class AddMember(workflows.Workflow):
             self.failure_message = _('Unable to retrieve '
                                      'the specified pool.')
             return False
-        for m in context['members']:
-            params = {'device_id': m}
-            try:
-                plist = api.neutron.port_list(request, **params)
-            except Exception:
-                return False
+        try:
+            addresses = self._member_addresses(request, context['members'],
+                                               subnet_id)
+        except Exception:
+            return False
 
-            # Sort port list for each member. This is needed to avoid
-            # attachment of random ports in case of creation of several
-            # members attached to several networks.
-            plist = sorted(plist, key=lambda port: port.network_id)
-            psubnet = [p for p in plist for ips in p.fixed_ips
-                       if ips['subnet_id'] == subnet_id]
-
-            # If possible, select a port on pool subnet.
-            if psubnet:
-                selected_port = psubnet[0]
-            elif plist:
-                selected_port = plist[0]
-            else:
-                selected_port = None
-
-            if selected_port:
-                context['address'] = \
-                    selected_port.fixed_ips[0]['ip_address']
-                try:
-                    api.lbaas.member_create(request, **context).id
-                except Exception as e:
-                    msg = self.failure_message
-                    LOG.info('%s: %s' % (msg, e))
-                    return False
+        device_ids = [m for m in context['members'] if m in addresses]
+        members = [dict(context, address=addresses[m]) for m in device_ids]
+        results = api.lbaas.member_create_bulk(request, members)
+
+        failed = []
+        for device_id, (member, error) in zip(device_ids, results):
+            if error is not None:
+                LOG.info('%s: %s' % (self.failure_message, error))
+                failed.append(device_id)
+        if not failed:
+            return True
+
+        step = self.get_step(AddMemberAction.slug)
+        names = dict(step.action.fields['members'].choices)
+        msg = _('Unable to add member(s): %s') % ", ".join(
+            names.get(device_id, device_id) for device_id in failed)
+        if len(failed) == len(device_ids):
+            self.failure_message = msg
+            return False
+        messages.warning(request, msg)
         return True
 
 
@@ -0,0 +1,157 @@
+# vim: tabstop=4 shiftwidth=4 softtabstop=4
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import copy
+import json
+
+from django.core.urlresolvers import reverse
+from django import http
+from mox import IsA  # noqa
+
+from openstack_dashboard import api
+from openstack_dashboard.test import helpers as test
+
+
+JSON_URL = reverse('horizon:project:network_topology:json')
+
+
+class NetworkTopologyTests(test.TestCase):
+    def _networks(self, **filters):
+        # network_list(expand_subnet=False) leaves the subnet ids in place.
+        networks = [api.neutron.Network(copy.deepcopy(n))
+                    for n in self.api_networks.list()]
+        return [n for n in networks
+                if all(n[k] == v for k, v in filters.items())]
+
+    def _routers(self):
+        # Neutron always reports a router status; the test data omits it.
+        return [api.neutron.Router(dict(r, status='ACTIVE'))
+                for r in self.api_routers.list()]
+
+    def _stub_topology(self):
+        # The three network lists are fetched concurrently.
+        tenant_id = self.tenant.id
+        api.nova.server_list(IsA(http.HttpRequest)) \
+            .AndReturn([self.servers.list(), False])
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            tenant_id=tenant_id, shared=False).InAnyOrder() \
+            .AndReturn(self._networks(tenant_id=tenant_id, shared=False))
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            shared=True).InAnyOrder() \
+            .AndReturn(self._networks(shared=True))
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            **{'router:external': True}).InAnyOrder() \
+            .AndReturn(self._networks(**{'router:external': True}))
+        api.neutron.subnet_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.subnets.list())
+        api.neutron.port_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.ports.list())
+        api.neutron.router_list(IsA(http.HttpRequest), tenant_id=tenant_id) \
+            .AndReturn(self._routers())
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list', 'subnet_list',
+                                      'port_list', 'router_list')})
+    def test_json_view(self):
+        self._stub_topology()
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL)
+
+        self.assertEqual(200, res.status_code)
+        self.assertTrue(res.has_header('ETag'))
+        data = json.loads(res.content)
+
+        self.assertEqual([s.id for s in self.servers.list()],
+                         [s['id'] for s in data['servers']])
+
+        networks = dict((n['id'], n) for n in data['networks'])
+        self.assertItemsEqual([n['id'] for n in self.api_networks.list()],
+                              networks.keys())
+        # External networks are drawn first.
+        self.assertTrue(data['networks'][0]['router:external'])
+        for api_net in self.api_networks.list():
+            cidrs = [s.cidr for s in self.subnets.list()
+                     if s.id in api_net['subnets']]
+            self.assertEqual(cidrs, [s['cidr'] for s in
+                                     networks[api_net['id']]['subnets']])
+
+        routers = self._routers()
+        self.assertEqual([r.id for r in routers],
+                         [r['id'] for r in data['routers']])
+        # Routers without a visible port on their gateway network get a
+        # placeholder port, routers with one do not.
+        attached = set((p.device_id, p.network_id) for p in self.ports.list())
+        expected = [r.id for r in routers
+                    if (r.id, r.external_gateway_info['network_id'])
+                    not in attached]
+        self.assertEqual(expected, [p['device_id'] for p in data['ports']
+                                    if p['id'].startswith('gateway')])
+        self.assertEqual(len(self.ports.list()) + len(expected),
+                         len(data['ports']))
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list', 'subnet_list',
+                                      'port_list', 'router_list')})
+    def test_json_view_not_modified(self):
+        self._stub_topology()
+        self._stub_topology()
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL)
+        etag = res['ETag']
+
+        res = self.client.get(JSON_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(304, res.status_code)
+        self.assertEqual(etag, res['ETag'])
+        self.assertEqual('', res.content)
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list', 'subnet_list',
+                                      'port_list', 'router_list')})
+    def test_json_view_neutron_error(self):
+        tenant_id = self.tenant.id
+        api.nova.server_list(IsA(http.HttpRequest)) \
+            .AndReturn([self.servers.list(), False])
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            tenant_id=tenant_id, shared=False).InAnyOrder() \
+            .AndRaise(self.exceptions.neutron)
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            shared=True).InAnyOrder() \
+            .AndReturn(self._networks(shared=True))
+        api.neutron.network_list(
+            IsA(http.HttpRequest), expand_subnet=False,
+            **{'router:external': True}).InAnyOrder() \
+            .AndReturn(self._networks(**{'router:external': True}))
+        api.neutron.subnet_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.subnets.list())
+        api.neutron.port_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.ports.list())
+        api.neutron.router_list(IsA(http.HttpRequest), tenant_id=tenant_id) \
+            .AndReturn(self._routers())
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL)
+
+        data = json.loads(res.content)
+        self.assertEqual(len(self.servers.list()), len(data['servers']))
+        self.assertEqual([], data['networks'])
+        self.assertEqual([], data['ports'])
+        self.assertEqual([], data['routers'])
@@ -0,0 +1,201 @@
+# vim: tabstop=4 shiftwidth=4 softtabstop=4
+
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+
+from django.conf import settings
+from django.core.urlresolvers import reverse
+
+from horizon.utils import concurrency
+
+from openstack_dashboard import api
+
+
+class TopologyBuilder(object):
+    """Assembles the network topology of the current project.
+
+    Every resource type is listed exactly once and all of the calls are
+    issued concurrently. The lists are then joined through dictionaries
+    keyed by id, so building the topology is linear in the number of
+    resources instead of comparing every port with every router.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.tenant_id = request.user.tenant_id
+
+    def _fetch(self):
+        request = self.request
+        with concurrency.Executor() as executor:
+            servers = executor.submit(api.nova.server_list, request)
+            # If we didn't specify tenant_id, all networks are shown to an
+            # admin user, and there is no way to get the owned, shared and
+            # external networks in one call. Subnets are listed only once
+            # for all three instead of once per network list.
+            own_networks = executor.submit(api.neutron.network_list,
+                                           request,
+                                           expand_subnet=False,
+                                           tenant_id=self.tenant_id,
+                                           shared=False)
+            shared_networks = executor.submit(api.neutron.network_list,
+                                              request,
+                                              expand_subnet=False,
+                                              shared=True)
+            public_networks = executor.submit(api.neutron.network_list,
+                                              request,
+                                              expand_subnet=False,
+                                              **{'router:external': True})
+            subnets = executor.submit(api.neutron.subnet_list, request)
+            ports = executor.submit(api.neutron.port_list, request)
+            routers = executor.submit(api.neutron.router_list, request,
+                                      tenant_id=self.tenant_id)
+
+        try:
+            self.servers = servers.result()[0]
+        except Exception:
+            self.servers = []
+
+        try:
+            self.networks = (own_networks.result() +
+                             shared_networks.result())
+            self.public_networks = public_networks.result()
+            self.subnets = subnets.result()
+            self.ports = ports.result()
+            self.routers = routers.result()
+        except Exception:
+            self.networks = []
+            self.public_networks = []
+            self.subnets = []
+            self.ports = []
+            self.routers = []
+
+    def _resource_url(self, view, resource):
+        if (resource.get('tenant_id') and
+                self.tenant_id != resource.get('tenant_id')):
+            return None
+        return reverse(view, None, [str(resource['id'])])
+
+    def _add_resource_url(self, view, resources):
+        for resource in resources:
+            url = self._resource_url(view, resource)
+            if url:
+                resource['url'] = url
+
+    def _build_servers(self):
+        console_type = getattr(settings, 'CONSOLE_TYPE', 'AUTO')
+        if console_type == 'SPICE':
+            console = 'spice'
+        else:
+            console = 'vnc'
+        servers = [{'name': server.name,
+                    'status': server.status,
+                    'console': console,
+                    'task': getattr(server, 'OS-EXT-STS:task_state'),
+                    'id': server.id} for server in self.servers]
+        self._add_resource_url('horizon:project:instances:detail', servers)
+        return servers
+
+    def _build_networks(self):
+        cidrs = dict((subnet.id, subnet.cidr) for subnet in self.subnets)
+
+        def subnets_of(network):
+            return [{'cidr': cidrs[subnet_id]}
+                    for subnet_id in network.subnets if subnet_id in cidrs]
+
+        networks = []
+        seen = set()
+        for network in self.networks:
+            if network.id in seen:
+                continue
+            seen.add(network.id)
+            networks.append({'name': network.name,
+                             'id': network.id,
+                             'subnets': subnets_of(network),
+                             'router:external': network['router:external']})
+        self._add_resource_url('horizon:project:networks:detail', networks)
+
+        # Add public networks to the networks list
+        for publicnet in self.public_networks:
+            if publicnet.id in seen:
+                continue
+            seen.add(publicnet.id)
+            networks.append({'name': publicnet.name,
+                             'id': publicnet.id,
+                             'subnets': subnets_of(publicnet),
+                             'router:external': publicnet['router:external']})
+        return sorted(networks,
+                      key=lambda x: x.get('router:external'),
+                      reverse=True)
+
+    def _build_ports(self):
+        ports = [{'id': port.id,
+                  'network_id': port.network_id,
+                  'device_id': port.device_id,
+                  'fixed_ips': port.fixed_ips,
+                  'device_owner': port.device_owner,
+                  'status': port.status}
+                 for port in self.ports]
+        self._add_resource_url('horizon:project:networks:ports:detail', ports)
+        return ports
+
+    def _build_routers(self, ports):
+        routers = [{'id': router.id,
+                    'name': router.name,
+                    'status': router.status,
+                    'external_gateway_info': router.external_gateway_info}
+                   for router in self.routers]
+
+        # user can't see port on external network. so we are
+        # adding fake port based on router information
+        attached = set((port['device_id'], port['network_id'])
+                       for port in ports)
+        for router in routers:
+            external_gateway_info = router.get('external_gateway_info')
+            if not external_gateway_info:
+                continue
+            external_network = external_gateway_info.get('network_id')
+            if not external_network:
+                continue
+            if (router['id'], external_network) in attached:
+                continue
+            ports.append({'id': 'gateway%s' % external_network,
+                          'network_id': external_network,
+                          'device_id': router['id'],
+                          'fixed_ips': []})
+
+        self._add_resource_url('horizon:project:routers:detail', routers)
+        return routers
+
+    def build(self):
+        """Returns the topology as a dictionary ready to be serialised."""
+        self._fetch()
+        ports = self._build_ports()
+        return {'servers': self._build_servers(),
+                'networks': self._build_networks(),
+                'routers': self._build_routers(ports),
+                'ports': ports}
+
+
+def topology_etag(tenant_id, data):
+    """Returns a fingerprint of a topology built by :class:`TopologyBuilder`.
+
+    Lists keep the order they were built in; only the keys of each resource
+    are sorted, so the fingerprint is stable between identical builds.
+    """
+    digest = hashlib.md5(repr(tenant_id))
+    for kind in sorted(data):
+        digest.update(kind)
+        for resource in data[kind]:
+            digest.update(repr(sorted(resource.items())))
+    return digest.hexdigest()
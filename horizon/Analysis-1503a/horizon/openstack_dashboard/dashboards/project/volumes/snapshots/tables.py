@@ -28,6 +28,7 @@ from openstack_dashboard.api import cinder
 
 from openstack_dashboard.dashboards.project.volumes \
     .volumes import tables as volume_tables
+from openstack_dashboard.usage import quotas
 
 
 class DeleteVolumeSnapshot(tables.DeleteAction):
@@ -46,6 +47,7 @@ class DeleteVolumeSnapshot(tables.DeleteAction):
 
     def delete(self, request, obj_id):
         api.cinder.volume_snapshot_delete(request, obj_id)
+        quotas.invalidate_cached_usages(request)
 
 
 class CreateVolumeFromSnapshot(tables.LinkAction):
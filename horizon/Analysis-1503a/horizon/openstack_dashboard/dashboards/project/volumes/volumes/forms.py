@@ -342,6 +342,8 @@ class CreateForm(forms.SelfHandlingForm):
                                           metadata=metadata,
                                           availability_zone=az,
                                           source_volid=volume_id)
+            quotas.tally_cached_usages(request, volumes=1,
+                                       gigabytes=data['size'])
             message = _('Creating volume "%s"') % data['name']
             messages.info(request, message)
             return volume
@@ -465,6 +467,7 @@ class CreateSnapshotForm(forms.SelfHandlingForm):
                                                      data['name'],
                                                      data['description'],
                                                      force=force)
+            quotas.tally_cached_usages(request, snapshots=1)
 
             messages.info(request, message)
             return snapshot
@@ -52,6 +52,7 @@ class DeleteVolume(tables.DeleteAction):
         name = self.table.get_object_display(obj)
         try:
             cinder.volume_delete(request, obj_id)
+            quotas.invalidate_cached_usages(request)
         except Exception:
             msg = _('Unable to delete volume "%s". One or more snapshots '
                     'depend on it.')
@@ -232,12 +233,14 @@ class VolumesTableBase(tables.DataTable):
                                 truncate=40)
     size = tables.Column(get_size,
                          verbose_name=_("Size"),
-                         attrs={'data-type': 'size'})
+                         attrs={'data-type': 'size'},
+                         sort_key="size")
     status = tables.Column("status",
                            filters=(title,),
                            verbose_name=_("Status"),
                            status=True,
-                           status_choices=STATUS_CHOICES)
+                           status_choices=STATUS_CHOICES,
+                           sort_key="status")
 
     def get_object_display(self, obj):
         return obj.name
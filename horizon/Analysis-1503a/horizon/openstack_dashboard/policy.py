@@ -19,10 +19,13 @@
 
 import logging
 import os.path
+import re
+import time
 
 from django.conf import settings
 
 from oslo.config import cfg
+import six
 
 from openstack_auth import utils as auth_utils
 
@@ -35,6 +38,168 @@ CONF = cfg.CONF
 _ENFORCER = None
 _BASE_PATH = getattr(settings, 'POLICY_FILES_PATH', '')
 
+_TARGET_KEY_RE = re.compile(r'%\(([^)]+)\)')
+
+
+def _always(result):
+    return lambda target, creds, roles: result
+
+
+class CompiledEnforcer(policy.Enforcer):
+    """An :class:`~openstack_dashboard.openstack.common.policy.Enforcer`
+    which turns its rules into plain closures.
+
+    Walking the Check tree of a rule means a method call per node, a stat
+    of the policy file and lower-casing the user's roles for every role
+    check. Here the policy file is checked for changes at most once every
+    ``POLICY_FILES_RELOAD_INTERVAL`` seconds, and whenever its rules are
+    (re)loaded every rule is compiled into a closure taking the target,
+    the credentials and the user's roles as a set of lower-cased names.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CompiledEnforcer, self).__init__(*args, **kwargs)
+        self._next_reload_check = 0
+        self._compiled_rules = None
+        self._compiled = {}
+        self._target_keys = {}
+
+    def load_rules(self, force_reload=False):
+        now = time.time()
+        if force_reload or not self.rules or now >= self._next_reload_check:
+            self._next_reload_check = now + getattr(
+                settings, 'POLICY_FILES_RELOAD_INTERVAL', 5)
+            super(CompiledEnforcer, self).load_rules(force_reload)
+        # Rules are replaced, not updated, whenever they are reloaded.
+        if self.rules is not self._compiled_rules:
+            self._compile()
+
+    def _compile(self):
+        rules = self.rules
+        self._compiled = {}
+        self._target_keys = {}
+        for name, rule in rules.items():
+            self._compiled[name] = self._compile_check(rule)
+        for name in rules:
+            self._target_keys[name] = self._collect_target_keys(rules[name],
+                                                                set())
+        self._compiled_rules = rules
+
+    def _lookup(self, name):
+        """Returns the compiled rule ``name``, falling back to the default
+        rule like :class:`~openstack_dashboard.openstack.common.policy.Rules`
+        does, or ``None``.
+        """
+        if name in self._compiled:
+            return self._compiled[name]
+        default = self.rules.default_rule
+        if isinstance(default, six.string_types):
+            return self._compiled.get(default)
+        return None
+
+    def _compile_check(self, check):
+        if isinstance(check, policy.TrueCheck):
+            return _always(True)
+        if isinstance(check, policy.FalseCheck):
+            return _always(False)
+        if isinstance(check, policy.NotCheck):
+            inner = self._compile_check(check.rule)
+            return lambda target, creds, roles: not inner(target, creds,
+                                                          roles)
+        if isinstance(check, policy.AndCheck):
+            checks = [self._compile_check(rule) for rule in check.rules]
+            return lambda target, creds, roles: all(
+                c(target, creds, roles) for c in checks)
+        if isinstance(check, policy.OrCheck):
+            checks = [self._compile_check(rule) for rule in check.rules]
+            return lambda target, creds, roles: any(
+                c(target, creds, roles) for c in checks)
+        if type(check) is policy.RuleCheck:
+            name = check.match
+
+            # Rules may refer to rules defined after them, so look the
+            # compiled rule up when it is evaluated.
+            def rule_check(target, creds, roles):
+                compiled = self._lookup(name)
+                try:
+                    return bool(compiled and compiled(target, creds, roles))
+                except KeyError:
+                    # A target key the rule needs is missing; fail closed.
+                    return False
+            return rule_check
+        if type(check) is policy.RoleCheck:
+            role = check.match.lower()
+            return lambda target, creds, roles: role in roles
+        if type(check) is policy.GenericCheck:
+            kind, match = check.kind, check.match
+            if not _TARGET_KEY_RE.search(match):
+                # A literal match, such as "is_admin:True".
+                def literal_check(target, creds, roles):
+                    return (kind in creds and
+                            match == six.text_type(creds[kind]))
+                return literal_check
+
+            def generic_check(target, creds, roles):
+                value = match % target
+                return (kind in creds and
+                        value == six.text_type(creds[kind]))
+            return generic_check
+        # HttpCheck and any check registered elsewhere keep their own
+        # implementation.
+        return lambda target, creds, roles: check(target, creds, self)
+
+    def _collect_target_keys(self, check, seen):
+        """Returns the target keys a rule depends on, or ``None`` if it may
+        depend on the whole target.
+        """
+        if isinstance(check, (policy.TrueCheck, policy.FalseCheck)):
+            return set()
+        if isinstance(check, policy.NotCheck):
+            return self._collect_target_keys(check.rule, seen)
+        if isinstance(check, (policy.AndCheck, policy.OrCheck)):
+            keys = set()
+            for rule in check.rules:
+                rule_keys = self._collect_target_keys(rule, seen)
+                if rule_keys is None:
+                    return None
+                keys |= rule_keys
+            return keys
+        if type(check) is policy.RuleCheck:
+            if check.match in seen:
+                return set()
+            seen.add(check.match)
+            try:
+                return self._collect_target_keys(self.rules[check.match],
+                                                 seen)
+            except KeyError:
+                return set()
+        if type(check) is policy.RoleCheck:
+            return set()
+        if type(check) is policy.GenericCheck:
+            return set(_TARGET_KEY_RE.findall(check.match))
+        return None
+
+    def check(self, rule, target, creds, roles):
+        """Evaluates ``rule`` like :meth:`enforce` without raising."""
+        self.load_rules()
+        compiled = self._lookup(rule)
+        if compiled is None:
+            # No rule and no default rule; fail closed.
+            return False
+        try:
+            return bool(compiled(target, creds, roles))
+        except KeyError:
+            return False
+
+    def target_keys(self, rule):
+        """Returns the target keys ``rule`` depends on (``None`` meaning
+        the whole target).
+        """
+        self.load_rules()
+        if rule not in self._target_keys:
+            rule = self.rules.default_rule
+        return self._target_keys.get(rule, set())
+
 
 def _get_enforcer():
     global _ENFORCER
@@ -42,7 +207,7 @@ def _get_enforcer():
         _ENFORCER = {}
         policy_files = getattr(settings, 'POLICY_FILES', {})
         for service in policy_files.keys():
-            enforcer = policy.Enforcer()
+            enforcer = CompiledEnforcer()
             enforcer.policy_path = os.path.join(_BASE_PATH,
                                                 policy_files[service])
             if os.path.isfile(enforcer.policy_path):
@@ -117,31 +282,54 @@ def check(actions, request, target=None):
         target['user_id'] = user.id
 
     credentials = _user_to_credentials(request, user)
+    roles = user._credentials_roles
 
     enforcer = _get_enforcer()
 
+    # Tables check the same few rules for every row, usually against the
+    # same project and user; remember the decisions for the request.
+    decisions = getattr(request, '_policy_decisions', None)
+    if decisions is None:
+        decisions = {}
+        try:
+            request._policy_decisions = decisions
+        except AttributeError:
+            pass
+
     for action in actions:
         scope, action = action[0], action[1]
         if scope in enforcer:
-            # if any check fails return failure
-            if not enforcer[scope].enforce(action, target, credentials):
-                # to match service implementations, if a rule is not found,
-                # use the default rule for that service policy
-                #
-                # waiting to make the check because the first call to
-                # enforce loads the rules
-                if action not in enforcer[scope].rules:
-                    if not enforcer[scope].enforce('default',
-                                                   target, credentials):
-                        return False
-                else:
-                    return False
+            # to match service implementations, if a rule is not found,
+            # use the default rule for that service policy
+            if not _check_rule(enforcer[scope], scope, action, target,
+                               credentials, roles, user, decisions):
+                # if any check fails return failure
+                return False
         # if no policy for scope, allow action, underlying API will
         # ultimately block the action if not permitted, treat as though
         # allowed
     return True
 
 
+def _check_rule(enforcer, scope, action, target, credentials, roles, user,
+                decisions):
+    keys = enforcer.target_keys(action)
+    if keys is None:
+        relevant = sorted(target.items())
+    else:
+        relevant = [(key, target.get(key)) for key in sorted(keys)]
+    try:
+        key = (scope, action, user._credentials_fingerprint,
+               tuple(relevant))
+        hash(key)
+    except TypeError:
+        # Unhashable target values; just evaluate the rule.
+        return enforcer.check(action, target, credentials, roles)
+    if key not in decisions:
+        decisions[key] = enforcer.check(action, target, credentials, roles)
+    return decisions[key]
+
+
 def _user_to_credentials(request, user):
     if not hasattr(user, "_credentials"):
         roles = [role['name'] for role in user.roles]
@@ -153,4 +341,8 @@ def _user_to_credentials(request, user):
                              'domain_id': user.user_domain_id,
                              'is_admin': user.is_superuser,
                              'roles': roles}
+        user._credentials_roles = frozenset(role.lower() for role in roles)
+        user._credentials_fingerprint = (
+            user.id, user.project_id, user.user_domain_id,
+            user.is_superuser, tuple(sorted(user._credentials_roles)))
     return user._credentials
@@ -20,6 +20,13 @@
 
 from __future__ import absolute_import
 
+import datetime
+import threading
+
+from django import http
+from django.test.utils import override_settings
+from django.utils import timezone
+
 from horizon import exceptions
 
 from openstack_dashboard.api import base as api_base
@@ -171,6 +178,126 @@ class ApiHelperTests(test.TestCase):
             url = api_base.url_for(self.request, 'image')
 
 
+class ClientCacheTests(test.APITestCase):
+    def setUp(self):
+        super(ClientCacheTests, self).setUp()
+        self.cache = api_base.ClientCache(max_size=2)
+        self.request.user.token.expires = \
+            timezone.now() + datetime.timedelta(hours=1)
+
+    def test_client_reused_for_same_token_and_endpoint(self):
+        first = self.cache.get(self.request, 'compute', 'http://a', object)
+        second = self.cache.get(self.request, 'compute', 'http://a', object)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_client_not_shared_across_keys(self):
+        compute = self.cache.get(self.request, 'compute', 'http://a', object)
+        other_url = self.cache.get(self.request, 'compute', 'http://b', object)
+        volume_v2 = self.cache.get(self.request, 'volume', 'http://a', object,
+                                   2)
+        self.assertIsNot(compute, other_url)
+        self.assertIsNot(compute, volume_v2)
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_client_not_shared_across_threads(self):
+        clients = []
+
+        def get_client():
+            clients.append(self.cache.get(self.request, 'compute',
+                                          'http://a', object))
+        get_client()
+        thread = threading.Thread(target=get_client)
+        thread.start()
+        thread.join()
+        self.assertIsNot(clients[0], clients[1])
+
+    def test_least_recently_used_client_evicted(self):
+        first = self.cache.get(self.request, 'compute', 'http://a', object)
+        self.cache.get(self.request, 'compute', 'http://b', object)
+        self.cache.get(self.request, 'compute', 'http://a', object)
+        self.cache.get(self.request, 'compute', 'http://c', object)
+        self.assertEqual(self.cache.stats()['size'], 2)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIs(first, self.cache.get(self.request, 'compute',
+                                            'http://a', object))
+
+    def test_expired_token_not_reused(self):
+        first = self.cache.get(self.request, 'compute', 'http://a', object)
+        self.request.user.token.expires = \
+            timezone.now() - datetime.timedelta(hours=1)
+        second = self.cache.get(self.request, 'compute', 'http://a', object)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_disabled_cache(self):
+        cache = api_base.ClientCache(max_size=0)
+        first = cache.get(self.request, 'compute', 'http://a', object)
+        second = cache.get(self.request, 'compute', 'http://a', object)
+        self.assertIsNot(first, second)
+        self.assertEqual(cache.stats()['size'], 0)
+
+
+class SharedMemoizedTests(test.APITestCase):
+    def setUp(self):
+        super(SharedMemoizedTests, self).setUp()
+        self.calls = []
+
+        @api_base.shared_memoized('compute', 60)
+        def cached_list(request, *args):
+            self.calls.append(args)
+            return list(args)
+        self.cached_list = cached_list
+
+    def _new_request(self):
+        request = http.HttpRequest()
+        request.user = self.request.user
+        return request
+
+    def test_cached_across_requests(self):
+        self.assertEqual(self.cached_list(self.request, 1), [1])
+        self.assertEqual(self.cached_list(self._new_request(), 1), [1])
+        self.assertEqual(self.calls, [(1,)])
+
+    def test_cache_key_includes_arguments(self):
+        self.cached_list(self.request, 1)
+        self.cached_list(self.request, 2)
+        self.assertEqual(self.calls, [(1,), (2,)])
+
+    def test_cache_key_includes_endpoint(self):
+        self.cached_list(self.request, 1)
+        self.request.user.services_region = "RegionTwo"
+        self.cached_list(self.request, 1)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalidate(self):
+        self.cached_list(self.request, 1)
+        self.cached_list(self.request, 2)
+        self.cached_list.invalidate(self.request)
+        self.cached_list(self.request, 1)
+        self.cached_list(self.request, 2)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_per_project_scope(self):
+        @api_base.shared_memoized('compute', 60, per_project=True)
+        def project_list(request):
+            self.calls.append(request.user.tenant_id)
+            return []
+
+        project_list(self.request)
+        project_list(self.request)
+        self.request.user.tenant_id = 'other'
+        project_list(self.request)
+        self.assertEqual(self.calls, [self.tenant.id, 'other'])
+
+    @override_settings(API_CACHE_TIMEOUTS={'base_tests.cached_list': 0})
+    def test_disabled_by_setting(self):
+        self.cached_list(self.request, 1)
+        self.cached_list(self.request, 1)
+        self.assertEqual(len(self.calls), 2)
+
+
 class QuotaSetTests(test.TestCase):
 
     def test_quotaset_add_with_plus(self):
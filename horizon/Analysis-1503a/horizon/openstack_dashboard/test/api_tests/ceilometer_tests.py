@@ -15,6 +15,7 @@
 # under the License.
 
 from django import http
+from django.test.utils import override_settings
 
 from mox import IsA  # noqa
 
@@ -314,3 +315,52 @@ class CeilometerApiTests(test.APITestCase):
         self.assertEqual(vars(first.fake_meter_2[0]), vars(statistic_obj))
 
         self.assertEqual(len(data), len(resources))
+
+    @override_settings(OPENSTACK_CEILOMETER_STATISTICS={'max_workers': 1,
+                                                        'meters_per_job': 1})
+    def test_resources_with_statistics_partial_failure(self):
+        resources = self.resources.list()
+        statistics = self.statistics.list()
+
+        ceilometerclient = self.stub_ceilometerclient()
+        ceilometerclient.resources = self.mox.CreateMockAnything()
+        ceilometerclient.resources.list(q=IsA(list)).AndReturn(resources[:1])
+
+        ceilometerclient.statistics = self.mox.CreateMockAnything()
+        ceilometerclient.statistics.list(meter_name="fake_meter_1",
+                                         period=None, q=IsA(list)).\
+            AndReturn(statistics)
+        ceilometerclient.statistics.list(meter_name="fake_meter_2",
+                                         period=None, q=IsA(list)).\
+            AndRaise(self.exceptions.ceilometer)
+
+        self.mox.ReplayAll()
+
+        ceilometer_usage = api.ceilometer.CeilometerUsage(http.HttpRequest)
+        data = ceilometer_usage.resources_with_statistics(
+            ["fake_query"], ["fake_meter_1", "fake_meter_2"],
+            stats_attr="max")
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].fake_meter_1, 9)
+        self.assertIsNone(data[0].fake_meter_2)
+
+    @override_settings(OPENSTACK_CEILOMETER_STATISTICS={'max_workers': 2})
+    def test_resources_with_statistics_all_failed(self):
+        resources = self.resources.list()
+
+        ceilometerclient = self.stub_ceilometerclient()
+        ceilometerclient.resources = self.mox.CreateMockAnything()
+        ceilometerclient.resources.list(q=IsA(list)).AndReturn(resources)
+
+        ceilometerclient.statistics = self.mox.CreateMockAnything()
+        ceilometerclient.statistics.list(meter_name="fake_meter_1",
+                                         period=None, q=IsA(list)).\
+            MultipleTimes().AndRaise(self.exceptions.ceilometer)
+
+        self.mox.ReplayAll()
+
+        ceilometer_usage = api.ceilometer.CeilometerUsage(http.HttpRequest)
+        self.assertRaises(self.exceptions.ceilometer.__class__,
+                          ceilometer_usage.resources_with_statistics,
+                          ["fake_query"], ["fake_meter_1"], stats_attr="max")
@@ -35,6 +35,34 @@ class CinderApiTests(test.APITestCase):
         # No assertions are necessary. Verification is handled by mox.
         api.cinder.volume_list(self.request, search_opts=search_opts)
 
+    def test_volume_list_sorted(self):
+        # Cinder v1 cannot sort, the volumes are sorted after listing.
+        volumes = self.cinder_volumes.list()
+        cinderclient = self.stub_cinderclient()
+        cinderclient.volumes = self.mox.CreateMockAnything()
+        cinderclient.volumes.list(search_opts=None).AndReturn(volumes)
+        self.mox.ReplayAll()
+
+        ret_val = api.cinder.volume_list(self.request, sort_key='size',
+                                         sort_dir='desc')
+        self.assertEqual(sorted([volume.size for volume in volumes],
+                                reverse=True),
+                         [volume.size for volume in ret_val])
+
+    def test_volume_list_sorted_v2(self):
+        api.cinder.VERSIONS._active = 2
+        self.addCleanup(setattr, api.cinder.VERSIONS, '_active', None)
+        volumes = self.cinder_volumes.list()
+        cinderclient = self.stub_cinderclient()
+        cinderclient.volumes = self.mox.CreateMockAnything()
+        cinderclient.volumes.list(search_opts=None, sort_key='size',
+                                  sort_dir='asc').AndReturn(volumes)
+        self.mox.ReplayAll()
+
+        ret_val = api.cinder.volume_list(self.request, sort_key='size')
+        self.assertEqual([volume.id for volume in volumes],
+                         [volume.id for volume in ret_val])
+
     def test_volume_snapshot_list(self):
         volume_snapshots = self.cinder_volume_snapshots.list()
         cinderclient = self.stub_cinderclient()
@@ -17,6 +17,8 @@
 # @author: KC Wang, Big Switch Networks
 #
 
+from mox import SameElementsAs  # noqa
+
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
@@ -57,7 +59,11 @@ class FwaasApiTests(test.APITestCase):
         api_policies = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewall_rules().AndReturn(api_rules)
-        neutronclient.list_firewall_policies().AndReturn(api_policies)
+        policy_ids = [r['firewall_policy_id']
+                      for r in api_rules['firewall_rules']
+                      if r['firewall_policy_id']]
+        neutronclient.list_firewall_policies(
+            id=SameElementsAs(policy_ids)).AndReturn(api_policies)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.rule_list(self.request)
@@ -159,7 +165,10 @@ class FwaasApiTests(test.APITestCase):
         rules_dict = {'firewall_rules': self.api_fw_rules.list()}
 
         neutronclient.list_firewall_policies().AndReturn(policies_dict)
-        neutronclient.list_firewall_rules().AndReturn(rules_dict)
+        rule_ids = [r for p in policies_dict['firewall_policies']
+                    for r in p['firewall_rules']]
+        neutronclient.list_firewall_rules(
+            id=SameElementsAs(rule_ids)).AndReturn(rules_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_list(self.request)
@@ -182,9 +191,9 @@ class FwaasApiTests(test.APITestCase):
 
         ret_dict = {'firewall_policy': policy_dict}
         neutronclient.show_firewall_policy(exp_policy.id).AndReturn(ret_dict)
-        filters = {'firewall_policy_id': exp_policy.id}
         ret_dict = {'firewall_rules': api_rules}
-        neutronclient.list_firewall_rules(**filters).AndReturn(ret_dict)
+        neutronclient.list_firewall_rules(
+            id=policy_dict['firewall_rules']).AndReturn(ret_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_get(self.request, exp_policy.id)
@@ -314,7 +323,10 @@ class FwaasApiTests(test.APITestCase):
         policies_dict = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewalls().AndReturn(firewalls_dict)
-        neutronclient.list_firewall_policies().AndReturn(policies_dict)
+        policy_ids = [f['firewall_policy_id']
+                      for f in firewalls_dict['firewalls']]
+        neutronclient.list_firewall_policies(
+            id=SameElementsAs(policy_ids)).AndReturn(policies_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.firewall_list(self.request)
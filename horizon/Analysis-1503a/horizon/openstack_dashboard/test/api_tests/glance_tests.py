@@ -105,6 +105,32 @@ class GlanceApiTests(test.APITestCase):
         self.assertEqual(len(list(images_iter)),
                          len(api_images) - len(expected_images) - 1)
 
+    @override_settings(API_RESULT_PAGE_SIZE=2)
+    def test_image_list_detailed_sorted_prev(self):
+        # Glance only pages forwards: the previous page is listed in the
+        # opposite order and reversed.
+        filters = {}
+        page_size = settings.API_RESULT_PAGE_SIZE
+        limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+        api_images = self.images.list()
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.list(limit=limit,
+                                 page_size=page_size + 1,
+                                 filters=filters,
+                                 marker=api_images[2].id,
+                                 sort_key='name',
+                                 sort_dir='asc') \
+            .AndReturn(iter([api_images[1], api_images[0]]))
+        self.mox.ReplayAll()
+
+        images, has_more = api.glance.image_list_detailed(
+            self.request, filters=filters, paginate=True, sort_key='name',
+            sort_dir='desc', prev_marker=api_images[2].id)
+        self.assertEqual([api_images[0], api_images[1]], images)
+        self.assertFalse(has_more)
+
     def test_get_image_empty_name(self):
         glanceclient = self.stub_glanceclient()
         glanceclient.images = self.mox.CreateMockAnything()
@@ -112,3 +138,53 @@ class GlanceApiTests(test.APITestCase):
         self.mox.ReplayAll()
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
+
+    def test_image_list_public_cached_until_image_deleted(self):
+        api_images = [image for image in self.images.list()
+                      if image.is_public]
+        filters = {'is_public': True, 'status': 'active'}
+        limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.list(page_size=limit,
+                                 limit=limit,
+                                 filters=filters).AndReturn(iter(api_images))
+        glanceclient.images.delete('image-id')
+        glanceclient.images.list(page_size=limit,
+                                 limit=limit,
+                                 filters=filters).AndReturn(iter(api_images))
+        self.mox.ReplayAll()
+
+        images = api.glance.image_list_public(self.request)
+        self.assertEqual([i.id for i in api_images], [i.id for i in images])
+        # Served from the cache.
+        images = api.glance.image_list_public(self.request)
+        self.assertEqual([i.id for i in api_images], [i.id for i in images])
+
+        api.glance.image_delete(self.request, 'image-id')
+        images = api.glance.image_list_public(self.request)
+        self.assertEqual([i.id for i in api_images], [i.id for i in images])
+
+    def test_image_list_public_cached_when_image_delete_fails(self):
+        api_images = [image for image in self.images.list()
+                      if image.is_public]
+        filters = {'is_public': True, 'status': 'active'}
+        limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.list(page_size=limit,
+                                 limit=limit,
+                                 filters=filters).AndReturn(iter(api_images))
+        glanceclient.images.delete('image-id') \
+            .AndRaise(self.exceptions.glance)
+        self.mox.ReplayAll()
+
+        images = api.glance.image_list_public(self.request)
+        self.assertRaises(self.exceptions.glance.__class__,
+                          api.glance.image_delete,
+                          self.request, 'image-id')
+        # The list did not change, so it is still served from the cache.
+        images = api.glance.image_list_public(self.request)
+        self.assertEqual([i.id for i in api_images], [i.id for i in images])
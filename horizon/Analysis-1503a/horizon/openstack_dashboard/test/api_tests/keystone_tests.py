@@ -21,6 +21,7 @@
 from __future__ import absolute_import
 
 from keystoneclient.v2_0 import client as keystone_client
+from keystoneclient.v3 import role_assignments
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
@@ -84,6 +85,57 @@ class RoleAPITests(test.APITestCase):
         # (it would show up in mox as an unexpected method call)
         role = api.keystone.get_default_role(self.request)
 
+    def test_get_project_users_roles(self):
+        keystoneclient = self.stub_keystoneclient()
+        tenant = self.tenants.first()
+        assignments = [
+            {'user': {'id': '1'}, 'role': {'id': self.roles[0].id},
+             'scope': {'project': {'id': tenant.id}}},
+            {'group': {'id': '1'}, 'role': {'id': self.roles[0].id},
+             'scope': {'project': {'id': tenant.id}}},
+            {'user': {'id': '2'}, 'role': {'id': self.roles[1].id},
+             'scope': {'project': {'id': tenant.id}}},
+            {'user': {'id': '1'}, 'role': {'id': self.roles[1].id},
+             'scope': {'project': {'id': tenant.id}}}]
+
+        keystoneclient.role_assignments = self.mox.CreateMockAnything()
+        keystoneclient.role_assignments.list(project=tenant.id) \
+            .AndReturn([role_assignments.RoleAssignment(
+                role_assignments.RoleAssignmentManager, info)
+                for info in assignments])
+        self.mox.ReplayAll()
+
+        users_roles = api.keystone.get_project_users_roles(self.request,
+                                                           tenant.id)
+        self.assertEqual(['1', '2'], users_roles.keys())
+        self.assertEqual([self.roles[0].id, self.roles[1].id],
+                         users_roles['1'])
+        self.assertEqual([self.roles[1].id], users_roles['2'])
+
+    def test_get_project_users_roles_v2(self):
+        keystoneclient = self.stub_keystoneclient()
+        tenant = self.tenants.first()
+        users = self.users.list()[:2]
+        self.addCleanup(setattr, api.keystone.VERSIONS, '_active',
+                        api.keystone.VERSIONS._active)
+        api.keystone.VERSIONS._active = 2.0
+
+        keystoneclient.users = self.mox.CreateMockAnything()
+        keystoneclient.users.list(tenant_id=tenant.id).AndReturn(users)
+        keystoneclient.roles = self.mox.CreateMockAnything()
+        keystoneclient.roles.roles_for_user(users[0].id, tenant.id) \
+            .InAnyOrder().AndReturn(self.roles)
+        keystoneclient.roles.roles_for_user(users[1].id, tenant.id) \
+            .InAnyOrder().AndReturn([self.roles[1]])
+        self.mox.ReplayAll()
+
+        users_roles = api.keystone.get_project_users_roles(self.request,
+                                                           tenant.id)
+        self.assertEqual([user.id for user in users], users_roles.keys())
+        self.assertEqual([role.id for role in self.roles],
+                         users_roles[users[0].id])
+        self.assertEqual([self.roles[1].id], users_roles[users[1].id])
+
 
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
@@ -15,6 +15,8 @@
 #    under the License.
 
 
+from mox import SameElementsAs  # noqa
+
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
@@ -172,8 +174,12 @@ class LbaasApiTests(test.APITestCase):
         vips = {'vips': self.api_vips.list()}
 
         neutronclient.list_pools().AndReturn(pools)
-        api.neutron.subnet_list(self.request).AndReturn(subnets)
-        neutronclient.list_vips().AndReturn(vips)
+        # Only the referenced subnets and VIPs are listed.
+        subnet_ids = [p['subnet_id'] for p in pools['pools']]
+        api.neutron.subnet_list(
+            self.request, id=SameElementsAs(subnet_ids)).AndReturn(subnets)
+        vip_ids = [p['vip_id'] for p in pools['pools'] if p['vip_id']]
+        neutronclient.list_vips(id=SameElementsAs(vip_ids)).AndReturn(vips)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.pool_list(self.request)
@@ -310,13 +316,39 @@ class LbaasApiTests(test.APITestCase):
         ret_val = api.lbaas.member_create(self.request, **form_data)
         self.assertIsInstance(ret_val, api.lbaas.Member)
 
+    @test.create_stubs({neutronclient: ('create_member',)})
+    def test_member_create_bulk(self):
+        members = [{'pool_id': 'abcdef-c3eb-4fee-9763-12de3338041e',
+                    'address': '10.0.1.%s' % i,
+                    'protocol_port': '80',
+                    'admin_state_up': True} for i in range(3)]
+
+        for i, form_data in enumerate(members):
+            call = neutronclient.create_member({'member': form_data}) \
+                .InAnyOrder()
+            if i == 1:
+                call.AndRaise(self.exceptions.neutron)
+            else:
+                call.AndReturn({'member': dict(form_data, id=str(i))})
+        self.mox.ReplayAll()
+
+        ret_val = api.lbaas.member_create_bulk(self.request, members)
+
+        self.assertEqual(3, len(ret_val))
+        self.assertEqual('0', ret_val[0][0].id)
+        self.assertIsNone(ret_val[0][1])
+        self.assertIsNone(ret_val[1][0])
+        self.assertEqual(self.exceptions.neutron, ret_val[1][1])
+        self.assertEqual('10.0.1.2', ret_val[2][0].address)
+
     @test.create_stubs({neutronclient: ('list_members', 'list_pools')})
     def test_member_list(self):
         members = {'members': self.api_members.list()}
         pools = {'pools': self.api_pools.list()}
 
         neutronclient.list_members().AndReturn(members)
-        neutronclient.list_pools().AndReturn(pools)
+        pool_ids = [m['pool_id'] for m in members['members']]
+        neutronclient.list_pools(id=SameElementsAs(pool_ids)).AndReturn(pools)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.member_list(self.request)
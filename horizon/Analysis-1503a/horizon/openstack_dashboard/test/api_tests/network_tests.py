@@ -205,6 +205,28 @@ class NetworkApiNovaFloatingIpTests(NetworkApiNovaTestBase):
             self.assertEqual(target.id, server.id)
             self.assertEqual(target.name, '%s (%s)' % (server.name, server.id))
 
+    def test_floating_ip_target_list_page(self):
+        servers = self.servers.list()
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        novaclient.servers.list().MultipleTimes().AndReturn(servers)
+        self.mox.ReplayAll()
+
+        floating_ips = api.network.NetworkClient(self.request).floating_ips
+        names = sorted('%s (%s)' % (s.name, s.id) for s in servers)
+        targets, has_more = floating_ips.list_targets_page(limit=1)
+        self.assertEqual(names[:1], [t.name for t in targets])
+        self.assertTrue(has_more)
+
+        targets, has_more = floating_ips.list_targets_page(
+            marker=targets[0].id)
+        self.assertEqual(names[1:], [t.name for t in targets])
+        self.assertFalse(has_more)
+
+        targets, has_more = floating_ips.list_targets_page(
+            search=servers[1].name.upper())
+        self.assertEqual([servers[1].id], [t.id for t in targets])
+
     def test_floating_ip_target_get_by_instance(self):
         self.mox.ReplayAll()
         instance_id = self.servers.first().id
@@ -533,6 +555,64 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
             self.assertEqual(ret.id, exp[0])
             self.assertEqual(ret.name, exp[1])
 
+    def test_floating_ip_target_list_refreshes_server_names(self):
+        ports = self.api_ports.list()
+        filters = {'tenant_id': self.request.user.tenant_id}
+        self.qclient.list_ports(**filters).AndReturn({'ports': ports})
+        self.qclient.list_ports(**filters).AndReturn({'ports': ports})
+        servers = self.servers.list()
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        search_opts = {'project_id': self.request.user.tenant_id}
+        # The instance names are cached, and listed again only once an
+        # unknown instance shows up.
+        novaclient.servers.list(True, search_opts).AndReturn(servers[1:])
+        novaclient.servers.list(True, search_opts).AndReturn(servers)
+        self.mox.ReplayAll()
+
+        floating_ips = api.network.NetworkClient(self.request).floating_ips
+        floating_ips.list_targets()
+        rets = floating_ips.list_targets()
+        self.assertEqual(sorted(self._get_target_name(p) for p in ports
+                                if p['device_owner'].startswith('compute:')),
+                         sorted(ret.name for ret in rets))
+
+    def test_floating_ip_target_list_page_search(self):
+        server = self.servers.first()
+        ports = [p for p in self.api_ports.list()
+                 if p['device_id'] == server.id]
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        search_opts = {'name': 'server', 'project_id': self.tenant.id}
+        novaclient.servers.list(True, search_opts).AndReturn([server])
+        self.qclient.list_ports(tenant_id=self.request.user.tenant_id,
+                                device_id=[server.id]) \
+            .AndReturn({'ports': ports})
+        self.mox.ReplayAll()
+
+        rets, has_more = api.network.floating_ip_target_list_page(
+            self.request, search='server')
+        self.assertEqual([self._get_target_id(p) for p in ports],
+                         [ret.id for ret in rets])
+        self.assertFalse(has_more)
+
+    def test_floating_ip_target_get(self):
+        port = [p for p in self.api_ports.list()
+                if p['device_owner'].startswith('compute:')][0]
+        self.qclient.list_ports(tenant_id=self.request.user.tenant_id,
+                                id=port['id']) \
+            .AndReturn({'ports': [port]})
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        search_opts = {'project_id': self.request.user.tenant_id}
+        novaclient.servers.list(True, search_opts) \
+            .AndReturn(self.servers.list())
+        self.mox.ReplayAll()
+
+        ret = api.network.floating_ip_target_get(self.request,
+                                                 self._get_target_id(port))
+        self.assertEqual(self._get_target_name(port), ret.name)
+
     def test_floating_ip_target_get_by_instance(self):
         ports = self.api_ports.list()
         candidates = [p for p in ports if p['device_id'] == '1']
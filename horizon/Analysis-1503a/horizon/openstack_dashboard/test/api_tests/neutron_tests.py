@@ -32,6 +32,19 @@ class NeutronApiTests(test.APITestCase):
         for n in ret_val:
             self.assertIsInstance(n, api.neutron.Network)
 
+    def test_network_list_without_subnet_expansion(self):
+        networks = {'networks': self.api_networks.list()}
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_networks(shared=True).AndReturn(networks)
+        self.mox.ReplayAll()
+
+        ret_val = api.neutron.network_list(self.request, expand_subnet=False,
+                                           shared=True)
+        for n, api_n in zip(ret_val, self.api_networks.list()):
+            self.assertIsInstance(n, api.neutron.Network)
+            self.assertEqual(api_n['subnets'], n.subnets)
+
     def test_network_get(self):
         network = {'network': self.api_networks.first()}
         subnet = {'subnet': self.api_subnets.first()}
@@ -91,6 +104,34 @@ class NeutronApiTests(test.APITestCase):
         for n in ret_val:
             self.assertIsInstance(n, api.neutron.Subnet)
 
+    def test_expand(self):
+        subnets = self.api_subnets.list()
+        first_ids = [subnets[0]['id'], None, subnets[0]['id']]
+        second_ids = [subnets[0]['id'], subnets[1]['id'], 'missing']
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_subnets(id=[subnets[0]['id']]) \
+            .AndReturn({'subnets': subnets[:1]})
+        # Subnets already looked up in this request aren't listed again.
+        neutronclient.list_subnets(id=[subnets[1]['id'], 'missing']) \
+            .AndReturn({'subnets': subnets[1:2]})
+        self.mox.ReplayAll()
+
+        ret_val = api.neutron.expand(self.request, 'subnet',
+                                     api.neutron.subnet_list, first_ids)
+        self.assertEqual([subnets[0]['id']], ret_val.keys())
+        self.assertIsInstance(ret_val[subnets[0]['id']], api.neutron.Subnet)
+
+        ret_val = api.neutron.expand(self.request, 'subnet',
+                                     api.neutron.subnet_list, second_ids)
+        self.assertEqual(subnets[1]['cidr'], ret_val[subnets[1]['id']].cidr)
+        self.assertIsNone(ret_val['missing'])
+
+        # Everything is known now, including the missing subnet.
+        ret_val = api.neutron.expand(self.request, 'subnet',
+                                     api.neutron.subnet_list, second_ids)
+        self.assertEqual(3, len(ret_val))
+
     def test_subnet_get(self):
         subnet = {'subnet': self.api_subnets.first()}
         subnet_id = self.api_subnets.first()['id']
@@ -26,6 +26,7 @@ from django import http
 from django.test.utils import override_settings
 
 from mox import IsA  # noqa
+from novaclient.v1_1 import flavors
 from novaclient.v1_1 import servers
 
 from openstack_dashboard import api
@@ -51,6 +52,42 @@ class ServerWrapperTests(test.TestCase):
 
 class ComputeApiTests(test.APITestCase):
 
+    def _new_request(self):
+        request = http.HttpRequest()
+        request.user = self.request.user
+        return request
+
+    def test_flavor_list_shared_across_requests(self):
+        novaclient = self.stub_novaclient()
+        novaclient.flavors = self.mox.CreateMockAnything()
+        novaclient.flavors.list(is_public=True).AndReturn(self.flavors.list())
+        self.mox.ReplayAll()
+
+        api.nova.flavor_list(self.request)
+        novaclient.flavors = flavors.FlavorManager(None)
+        ret_val = api.nova.flavor_list(self._new_request())
+
+        self.assertEqual([f.id for f in ret_val],
+                         [f.id for f in self.flavors.list()])
+        for flavor in ret_val:
+            self.assertIsInstance(flavor, flavors.Flavor)
+            self.assertIs(flavor.manager, novaclient.flavors)
+
+    def test_flavor_delete_invalidates_flavor_list(self):
+        flavor = self.flavors.first()
+        novaclient = self.stub_novaclient()
+        novaclient.flavors = self.mox.CreateMockAnything()
+        novaclient.flavors.list(is_public=True).AndReturn(self.flavors.list())
+        novaclient.flavors.delete(flavor.id)
+        novaclient.flavors.list(is_public=True) \
+            .AndReturn(self.flavors.list()[1:])
+        self.mox.ReplayAll()
+
+        api.nova.flavor_list(self.request)
+        api.nova.flavor_delete(self.request, flavor.id)
+        ret_val = api.nova.flavor_list(self._new_request())
+        self.assertEqual(len(ret_val), len(self.flavors.list()) - 1)
+
     def test_server_reboot(self):
         server = self.servers.first()
         HARDNESS = servers.REBOOT_HARD
@@ -177,6 +214,32 @@ class ComputeApiTests(test.APITestCase):
         self.assertEqual(page_size, len(ret_val))
         self.assertTrue(has_more)
 
+    @override_settings(API_RESULT_PAGE_SIZE=1)
+    def test_server_list_pagination_prev(self):
+        # Nova only pages forwards: the previous page is listed in the
+        # opposite order and reversed.
+        servers = self.servers.list()
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        novaclient.servers.list(True,
+                                {'all_tenants': True,
+                                 'marker': servers[2].id,
+                                 'sort_key': 'display_name',
+                                 'sort_dir': 'desc',
+                                 'limit': 2}) \
+            .AndReturn([servers[1], servers[0]])
+        self.mox.ReplayAll()
+
+        ret_val, has_more = api.nova.server_list(self.request,
+                                                 {'marker': None,
+                                                  'prev_marker': servers[2].id,
+                                                  'sort_key': 'display_name',
+                                                  'sort_dir': 'asc',
+                                                  'paginate': True},
+                                                 all_tenants=True)
+        self.assertEqual([servers[1].id], [server.id for server in ret_val])
+        self.assertTrue(has_more)
+
     def test_usage_get(self):
         novaclient = self.stub_novaclient()
         novaclient.usage = self.mox.CreateMockAnything()
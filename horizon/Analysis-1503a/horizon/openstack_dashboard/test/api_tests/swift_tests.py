@@ -20,6 +20,13 @@
 
 from __future__ import absolute_import
 
+import json
+import StringIO
+import urllib
+
+from django.test.utils import override_settings
+
+import mox
 from mox import IsA  # noqa
 
 from horizon import exceptions
@@ -125,6 +132,65 @@ class SwiftApiTests(test.APITestCase):
         self.assertEqual(len(objs), len(objects))
         self.assertFalse(more)
 
+    def test_swift_filter_objects(self):
+        container = self.containers.first()
+        items = [{'name': 'folder/test_one'},
+                 {'name': 'folder/my_Test_one.log'},
+                 {'name': 'folder/test_two'},
+                 {'name': 'folder/one_test'},
+                 {'subdir': 'folder/TEST_ONE_dir/'}]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name,
+                                prefix='folder/',
+                                marker=None,
+                                limit=1000,
+                                delimiter='/').AndReturn([{}, items])
+        self.mox.ReplayAll()
+
+        # Terms are found anywhere in the names, regardless of case.
+        objs, more, marker = api.swift.swift_filter_objects(self.request,
+                                                            'test*one',
+                                                            container.name,
+                                                            prefix='folder/')
+        self.assertEqual(['folder/test_one', 'folder/my_Test_one.log',
+                          'folder/TEST_ONE_dir'],
+                         [obj.name for obj in objs])
+        self.assertFalse(more)
+        self.assertIsNone(marker)
+
+    def test_swift_filter_objects_paged(self):
+        container = self.containers.first()
+        pages = [[{'name': 'a_1.txt'}, {'name': 'a_2.log'}],
+                 [{'name': 'b_3.TXT'}, {'name': 'c_4.txt'}],
+                 [{'name': 'ca_5.txt'}]]
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.get_container(container.name, prefix='', marker=None,
+                                limit=2, delimiter='/') \
+            .AndReturn([{}, pages[0]])
+        swift_api.get_container(container.name, prefix='',
+                                marker='a_2.log', limit=2, delimiter='/') \
+            .AndReturn([{}, pages[1]])
+        swift_api.get_container(container.name, prefix='',
+                                marker='c_4.txt', limit=2, delimiter='/') \
+            .AndReturn([{}, pages[2]])
+        self.mox.ReplayAll()
+
+        # All terms have to match; the search stops after a page of hits.
+        objs, more, marker = api.swift.swift_filter_objects(
+            self.request, '.txt _', container.name, limit=2)
+        self.assertEqual(['a_1.txt', 'b_3.TXT'], [obj.name for obj in objs])
+        self.assertTrue(more)
+        self.assertEqual('b_3.TXT', marker)
+
+        # ...and resumes from the marker it is given.
+        objs, more, marker = api.swift.swift_filter_objects(
+            self.request, '.txt _', container.name, marker='c_4.txt',
+            limit=2)
+        self.assertEqual(['ca_5.txt'], [obj.name for obj in objs])
+        self.assertFalse(more)
+
     def test_swift_get_object_with_data(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -140,6 +206,31 @@ class SwiftApiTests(test.APITestCase):
                                          object.name)
         self.assertEqual(obj.name, object.name)
 
+    def test_swift_get_object_chunked_range(self):
+        container = self.containers.first()
+        object = self.objects.first()
+        chunks = iter([object.data[:4], object.data[4:]])
+        headers = {'content-length': str(len(object.data)),
+                   'content-range': 'bytes 0-8/128',
+                   'etag': 'object_hash'}
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_object(container.name, object.name,
+                             resp_chunk_size=4,
+                             headers={'Range': 'bytes=0-8'}) \
+            .AndReturn([headers, chunks])
+
+        self.mox.ReplayAll()
+
+        obj = api.swift.swift_get_object(self.request,
+                                         container.name,
+                                         object.name,
+                                         resp_chunk_size=4,
+                                         byte_range='bytes=0-8')
+        self.assertEqual(obj.content_range, 'bytes 0-8/128')
+        self.assertEqual(obj.etag, 'object_hash')
+        self.assertIs(obj.data, chunks)
+
     def test_swift_get_object_without_data(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -171,6 +262,8 @@ class SwiftApiTests(test.APITestCase):
         headers = {'X-Object-Meta-Orig-Filename': fake_name}
 
         swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name) \
+            .AndRaise(self.exceptions.swift_not_found)
         swift_api.put_object(container.name,
                              obj.name,
                              IsA(FakeFile),
@@ -182,11 +275,129 @@ class SwiftApiTests(test.APITestCase):
                                       obj.name,
                                       FakeFile())
 
+    def _get_large_file(self, data):
+        class FakeFile(StringIO.StringIO):
+            name = 'fake_object.iso'
+            size = len(data)
+        return FakeFile(data)
+
+    def _segment(self, data):
+        return mox.Func(lambda segment: segment.read() == data)
+
+    @override_settings(SWIFT_LARGE_OBJECT_UPLOAD={'threshold': 4,
+                                                  'segment_size': 4})
+    def test_swift_upload_large_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        segment_container = container.name + '_segments'
+        segment_name = mox.Regex(r'^%s/[\d.]+/9/4/0000000\d$' % obj.name)
+
+        def check_manifest(headers):
+            headers = dict(headers)
+            manifest = urllib.unquote(headers.pop('X-Object-Manifest'))
+            manifest = manifest.decode('utf-8')
+            return (manifest.startswith('%s/%s/' % (segment_container,
+                                                    obj.name)) and
+                    headers == {'X-Object-Meta-Orig-Filename':
+                                'fake_object.iso'})
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.head_object(container.name, obj.name) \
+            .AndRaise(self.exceptions.swift_not_found)
+        swift_api.put_container(segment_container)
+        for data in ('Fake', ' Dat', 'a'):
+            swift_api.put_object(segment_container,
+                                 segment_name,
+                                 self._segment(data),
+                                 content_length=len(data)) \
+                .AndReturn('segment_hash')
+        swift_api.put_object(container.name,
+                             obj.name,
+                             '',
+                             headers=mox.Func(check_manifest)) \
+            .AndReturn('manifest_hash')
+        self.mox.ReplayAll()
+
+        large_obj = api.swift.swift_upload_object(
+            self.request, container.name, obj.name,
+            self._get_large_file('Fake Data'))
+        self.assertEqual(large_obj.bytes, 9)
+        self.assertEqual(large_obj.etag, 'manifest_hash')
+
+    @override_settings(SWIFT_LARGE_OBJECT_UPLOAD={'threshold': 4,
+                                                  'segment_size': 8,
+                                                  'manifest': 'static'})
+    def test_swift_upload_large_object_static_manifest(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        segment_container = container.name + '_segments'
+        segment_name = mox.Regex(r'^%s/[\d.]+/9/8/0000000\d$' % obj.name)
+
+        def check_manifest(manifest):
+            manifest = json.loads(manifest)
+            return ([(s['etag'], s['size_bytes']) for s in manifest] ==
+                    [('hash_0', 8), ('hash_1', 1)] and
+                    manifest[0]['path'].startswith('/%s/' % segment_container))
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.head_object(container.name, obj.name) \
+            .AndRaise(self.exceptions.swift_not_found)
+        swift_api.put_container(segment_container)
+        swift_api.put_object(segment_container, segment_name,
+                             self._segment('Fake Dat'),
+                             content_length=8).AndReturn('hash_0')
+        swift_api.put_object(segment_container, segment_name,
+                             self._segment('a'),
+                             content_length=1).AndReturn('hash_1')
+        swift_api.put_object(container.name,
+                             obj.name,
+                             mox.Func(check_manifest),
+                             headers={'X-Object-Meta-Orig-Filename':
+                                      'fake_object.iso'},
+                             query_string='multipart-manifest=put') \
+            .AndReturn('manifest_hash')
+        self.mox.ReplayAll()
+
+        large_obj = api.swift.swift_upload_object(
+            self.request, container.name, obj.name,
+            self._get_large_file('Fake Data'))
+        self.assertEqual(large_obj.etag, 'manifest_hash')
+
+    @override_settings(SWIFT_LARGE_OBJECT_UPLOAD={'threshold': 4,
+                                                  'segment_size': 4})
+    def test_swift_upload_large_object_error(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        segment_container = container.name + '_segments'
+        segment_name = mox.Regex(r'^%s/[\d.]+/9/4/0000000\d$' % obj.name)
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.head_object(container.name, obj.name) \
+            .AndRaise(self.exceptions.swift_not_found)
+        swift_api.put_container(segment_container)
+        swift_api.put_object(segment_container, segment_name,
+                             self._segment('Fake'),
+                             content_length=4).AndReturn('hash_0')
+        swift_api.put_object(segment_container, segment_name,
+                             self._segment(' Dat'),
+                             content_length=4) \
+            .AndRaise(self.exceptions.swift)
+        # The segment already uploaded is cleaned up again.
+        swift_api.delete_object(segment_container, segment_name)
+        self.mox.ReplayAll()
+
+        self.assertRaises(self.exceptions.swift.__class__,
+                          api.swift.swift_upload_object,
+                          self.request, container.name, obj.name,
+                          self._get_large_file('Fake Data'))
+
     def test_swift_upload_object_without_file(self):
         container = self.containers.first()
         obj = self.objects.first()
 
         swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name) \
+            .AndRaise(self.exceptions.swift_not_found)
         swift_api.put_object(container.name,
                              obj.name,
                              None,
@@ -199,6 +410,85 @@ class SwiftApiTests(test.APITestCase):
                                                  None)
         self.assertEqual(0, response['bytes'])
 
+    def test_swift_upload_object_replaces_large_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        segment_container = container.name + '_segments'
+        old_segments = ['%s/1/9/4/%08d' % (obj.name, i) for i in range(3)]
+        fake_file = self._get_large_file('Fake Data')
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name) \
+            .AndReturn({'x-object-manifest': '%s/%s/1/9/4/'
+                        % (segment_container, obj.name)})
+        swift_api.get_container(segment_container,
+                                prefix='%s/1/9/4/' % obj.name,
+                                full_listing=True) \
+            .AndReturn([{}, [{'name': name} for name in old_segments]])
+        swift_api.put_object(container.name,
+                             obj.name,
+                             fake_file,
+                             headers={'X-Object-Meta-Orig-Filename':
+                                      'fake_object.iso'}) \
+            .AndReturn('object_hash')
+        # The old segments go once the new object is in place.
+        for name in old_segments:
+            swift_api.delete_object(segment_container, name)
+        self.mox.ReplayAll()
+
+        new_obj = api.swift.swift_upload_object(self.request,
+                                                container.name,
+                                                obj.name,
+                                                fake_file)
+        self.assertEqual(new_obj.etag, 'object_hash')
+
+    def test_swift_delete_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name).AndReturn({})
+        swift_api.delete_object(container.name, obj.name)
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_object(self.request,
+                                                      container.name,
+                                                      obj.name))
+
+    def test_swift_delete_dynamic_large_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        segment_container = container.name + '_segments'
+        segments = ['%s/1/9/4/%08d' % (obj.name, i) for i in range(3)]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name) \
+            .AndReturn({'x-object-manifest': '%s/%s/1/9/4/'
+                        % (segment_container, obj.name)})
+        swift_api.get_container(segment_container,
+                                prefix='%s/1/9/4/' % obj.name,
+                                full_listing=True) \
+            .AndReturn([{}, [{'name': name} for name in segments]])
+        swift_api.delete_object(container.name, obj.name)
+        for name in segments:
+            swift_api.delete_object(segment_container, name)
+        self.mox.ReplayAll()
+
+        api.swift.swift_delete_object(self.request, container.name, obj.name)
+
+    def test_swift_delete_static_large_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_object(container.name, obj.name) \
+            .AndReturn({'x-static-large-object': 'True'})
+        swift_api.delete_object(container.name, obj.name,
+                                query_string='multipart-manifest=delete')
+        self.mox.ReplayAll()
+
+        api.swift.swift_delete_object(self.request, container.name, obj.name)
+
     def test_swift_object_exists(self):
         container = self.containers.first()
         obj = self.objects.first()
@@ -16,6 +16,8 @@
 #
 # @author: Tatiana Mazur
 
+from mox import SameElementsAs  # noqa
+
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
@@ -56,8 +58,12 @@ class VPNaasApiTests(test.APITestCase):
             'ipsec_site_connections': self.api_ipsecsiteconnections.list()}
 
         neutronclient.list_vpnservices().AndReturn(vpnservices_dict)
-        api.neutron.subnet_list(self.request).AndReturn(subnets)
-        api.neutron.router_list(self.request).AndReturn(routers)
+        subnet_ids = [s['subnet_id'] for s in vpnservices_dict['vpnservices']]
+        router_ids = [s['router_id'] for s in vpnservices_dict['vpnservices']]
+        api.neutron.subnet_list(
+            self.request, id=SameElementsAs(subnet_ids)).AndReturn(subnets)
+        api.neutron.router_list(
+            self.request, id=SameElementsAs(router_ids)).AndReturn(routers)
         neutronclient.list_ipsec_site_connections().AndReturn(
             ipsecsiteconnections_dict)
 
@@ -257,9 +263,16 @@ class VPNaasApiTests(test.APITestCase):
 
         neutronclient.list_ipsec_site_connections().AndReturn(
             ipsecsiteconnections_dict)
-        neutronclient.list_ikepolicies().AndReturn(ikepolicies_dict)
-        neutronclient.list_ipsecpolicies().AndReturn(ipsecpolicies_dict)
-        neutronclient.list_vpnservices().AndReturn(vpnservices_dict)
+        conns = ipsecsiteconnections_dict['ipsec_site_connections']
+        neutronclient.list_ikepolicies(
+            id=SameElementsAs([c['ikepolicy_id'] for c in conns])) \
+            .AndReturn(ikepolicies_dict)
+        neutronclient.list_ipsecpolicies(
+            id=SameElementsAs([c['ipsecpolicy_id'] for c in conns])) \
+            .AndReturn(ipsecpolicies_dict)
+        neutronclient.list_vpnservices(
+            id=SameElementsAs([c['vpnservice_id'] for c in conns])) \
+            .AndReturn(vpnservices_dict)
 
         self.mox.ReplayAll()
 
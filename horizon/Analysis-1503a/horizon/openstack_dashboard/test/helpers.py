@@ -122,6 +122,8 @@ class TestCase(horizon_helpers.TestCase):
     """
     def setUp(self):
         test_utils.load_test_data(self)
+        # Don't let API results cached across requests leak between tests.
+        api.base.shared_cache().clear()
         self.mox = mox.Mox()
         self.factory = RequestFactoryWithMessages()
         self.context = {'authorized_tenants': self.tenants.list()}
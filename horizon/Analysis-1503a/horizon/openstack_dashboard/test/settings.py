@@ -180,6 +180,22 @@ NOSE_ARGS = ['--nocapture',
              '--cover-inclusive',
              '--all-modules']
 
+# Tests stub out the client classes, so don't let clients leak between them.
+API_CLIENT_CACHE_SIZE = 0
+
+# Kept apart from the default cache so that tests can clear it without
+# throwing away django_compressor's cached output.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api',
+    },
+}
+API_CACHE_BACKEND = 'api'
+
 POLICY_FILES_PATH = os.path.join(ROOT_PATH, "conf")
 POLICY_FILES = {
     'identity': 'keystone_policy.json',
@@ -63,6 +63,10 @@ def data(TEST):
     nova_unauth = nova_exceptions.Unauthorized
     TEST.exceptions.nova_unauthorized = create_stubbed_exception(nova_unauth)
 
+    nova_not_found = nova_exceptions.NotFound
+    TEST.exceptions.nova_not_found = create_stubbed_exception(nova_not_found,
+                                                              404)
+
     glance_exception = glance_exceptions.ClientException
     TEST.exceptions.glance = create_stubbed_exception(glance_exception)
 
@@ -74,6 +78,10 @@ def data(TEST):
 
     swift_exception = swift_exceptions.ClientException
     TEST.exceptions.swift = create_stubbed_exception(swift_exception)
+    swift_not_found = create_stubbed_exception(swift_exception, 404)
+    # swiftclient keeps the status in an instance attribute.
+    swift_not_found.http_status = 404
+    TEST.exceptions.swift_not_found = swift_not_found
 
     cinder_exception = cinder_exceptions.BadRequest
     TEST.exceptions.cinder = create_stubbed_exception(cinder_exception)
@@ -14,6 +14,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django.test.utils import override_settings  # noqa
+
+from openstack_auth import utils as auth_utils
+
+from openstack_dashboard.openstack.common import fileutils
 from openstack_dashboard import policy
 from openstack_dashboard.test import helpers as test
 
@@ -65,6 +70,68 @@ class PolicyTestCase(test.TestCase):
                              request=self.request)
         self.assertTrue(value)
 
+    def test_compiled_rules_match_enforce(self):
+        policy.reset()
+        credentials = [
+            {'user_id': 'u1', 'project_id': 'p1', 'domain_id': 'd1',
+             'is_admin': False, 'roles': ['Member']},
+            {'user_id': 'u2', 'project_id': 'p2', 'domain_id': 'd1',
+             'is_admin': True, 'roles': ['Admin', '_member_']}]
+        targets = [
+            {'project_id': 'p1', 'user_id': 'u1', 'domain_id': 'd1',
+             'tenant_id': 'p1'},
+            {'project_id': 'p3', 'user_id': 'u3', 'domain_id': 'd2',
+             'tenant_id': 'p3'}]
+        for scope, enforcer in policy._get_enforcer().items():
+            enforcer.load_rules()
+            for rule in list(enforcer.rules) + ['i_dont_exist']:
+                for creds in credentials:
+                    roles = frozenset(r.lower() for r in creds['roles'])
+                    for target in targets:
+                        self.assertEqual(
+                            bool(enforcer.enforce(rule, target, creds)),
+                            enforcer.check(rule, target, creds, roles),
+                            "%s:%s" % (scope, rule))
+
+    def test_check_memoized_per_request(self):
+        policy.reset()
+        enforcer = policy._get_enforcer()['compute']
+        user = auth_utils.get_user(self.request)
+        credentials = policy._user_to_credentials(self.request, user)
+        self.mox.StubOutWithMock(policy.CompiledEnforcer, 'check')
+        # compute:start depends on the project only, so all three rows
+        # of the same project share a single evaluation.
+        policy.CompiledEnforcer.check(
+            'compute:start',
+            {'project_id': self.tenant.id, 'user_id': self.user.id},
+            credentials, user._credentials_roles).AndReturn(True)
+        policy.CompiledEnforcer.check(
+            'compute:start',
+            {'project_id': 'other', 'user_id': self.user.id},
+            credentials, user._credentials_roles).AndReturn(False)
+        self.mox.ReplayAll()
+
+        self.assertEqual(set(['project_id']),
+                         enforcer.target_keys('compute:start'))
+        for project_id in (None, self.tenant.id, None, 'other', 'other'):
+            value = policy.check((("compute", "compute:start"),),
+                                 request=self.request,
+                                 target={'project_id': project_id})
+            self.assertEqual(project_id != 'other', value)
+
+    @override_settings(POLICY_FILES_RELOAD_INTERVAL=60)
+    def test_policy_file_reload_throttled(self):
+        policy.reset()
+        enforcer = policy._get_enforcer()['compute']
+        enforcer.load_rules()
+        self.mox.StubOutWithMock(fileutils, 'read_cached_file')
+        self.mox.ReplayAll()
+
+        # Within the interval the policy file is not looked at again.
+        for i in range(3):
+            policy.check((("compute", "compute:start"),),
+                         request=self.request)
+
 
 class PolicyTestCaseAdmin(test.BaseAdminViewTests):
     def test_check_admin_required_true(self):
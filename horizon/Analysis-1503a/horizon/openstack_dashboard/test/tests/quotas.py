@@ -32,6 +32,11 @@ from openstack_dashboard.usage import quotas
 
 class QuotaTests(test.APITestCase):
 
+    def _new_request(self):
+        request = http.HttpRequest()
+        request.user = self.request.user
+        return request
+
     def get_usages(self, with_volume=True):
         usages = {'injected_file_content_bytes': {'quota': 1},
                   'metadata_items': {'quota': 1},
@@ -53,11 +58,13 @@ class QuotaTests(test.APITestCase):
 
     @test.create_stubs({api.nova: ('server_list',
                                    'flavor_list',
-                                   'tenant_quota_get',),
+                                   'tenant_quota_get',
+                                   'tenant_absolute_limits',),
                         api.network: ('tenant_floating_ip_list',),
                         api.base: ('is_service_enabled',),
                         cinder: ('volume_list', 'volume_snapshot_list',
-                                 'tenant_quota_get',)})
+                                 'tenant_quota_get',
+                                 'tenant_absolute_limits',)})
     def test_tenant_quota_usages(self):
         servers = [s for s in self.servers.list()
                    if s.tenant_id == self.request.user.tenant_id]
@@ -66,6 +73,8 @@ class QuotaTests(test.APITestCase):
                                   'volume').AndReturn(True)
         api.base.is_service_enabled(IsA(http.HttpRequest),
                                   'network').AndReturn(False)
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         api.nova.flavor_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.flavors.list())
         api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
@@ -74,6 +83,8 @@ class QuotaTests(test.APITestCase):
                 .AndReturn(self.floating_ips.list())
         api.nova.server_list(IsA(http.HttpRequest)) \
                 .AndReturn([servers, False])
+        cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         cinder.volume_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.volumes.list())
         cinder.volume_snapshot_list(IsA(http.HttpRequest)) \
@@ -91,7 +102,8 @@ class QuotaTests(test.APITestCase):
 
     @test.create_stubs({api.nova: ('server_list',
                                    'flavor_list',
-                                   'tenant_quota_get',),
+                                   'tenant_quota_get',
+                                   'tenant_absolute_limits',),
                         api.network: ('tenant_floating_ip_list',),
                         api.base: ('is_service_enabled',)})
     def test_tenant_quota_usages_without_volume(self):
@@ -102,6 +114,8 @@ class QuotaTests(test.APITestCase):
                                   'volume').AndReturn(False)
         api.base.is_service_enabled(IsA(http.HttpRequest),
                                   'network').AndReturn(False)
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         api.nova.flavor_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.flavors.list())
         api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
@@ -126,7 +140,8 @@ class QuotaTests(test.APITestCase):
 
     @test.create_stubs({api.nova: ('server_list',
                                    'flavor_list',
-                                   'tenant_quota_get',),
+                                   'tenant_quota_get',
+                                   'tenant_absolute_limits',),
                         api.network: ('tenant_floating_ip_list',),
                         api.base: ('is_service_enabled',)})
     def test_tenant_quota_usages_no_instances_running(self):
@@ -134,6 +149,8 @@ class QuotaTests(test.APITestCase):
                                   'volume').AndReturn(False)
         api.base.is_service_enabled(IsA(http.HttpRequest),
                                   'network').AndReturn(False)
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         api.nova.flavor_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.flavors.list())
         api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
@@ -158,11 +175,13 @@ class QuotaTests(test.APITestCase):
 
     @test.create_stubs({api.nova: ('server_list',
                                    'flavor_list',
-                                   'tenant_quota_get',),
+                                   'tenant_quota_get',
+                                   'tenant_absolute_limits',),
                         api.network: ('tenant_floating_ip_list',),
                         api.base: ('is_service_enabled',),
                         cinder: ('volume_list', 'volume_snapshot_list',
-                                 'tenant_quota_get',)})
+                                 'tenant_quota_get',
+                                 'tenant_absolute_limits',)})
     def test_tenant_quota_usages_unlimited_quota(self):
         inf_quota = self.quotas.first()
         inf_quota['ram'] = -1
@@ -173,6 +192,8 @@ class QuotaTests(test.APITestCase):
                                   'volume').AndReturn(True)
         api.base.is_service_enabled(IsA(http.HttpRequest),
                                   'network').AndReturn(False)
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         api.nova.flavor_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.flavors.list())
         api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
@@ -181,6 +202,8 @@ class QuotaTests(test.APITestCase):
                 .AndReturn(self.floating_ips.list())
         api.nova.server_list(IsA(http.HttpRequest)) \
                 .AndReturn([servers, False])
+        cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
+                .AndReturn({})
         cinder.volume_list(IsA(http.HttpRequest)) \
                 .AndReturn(self.volumes.list())
         cinder.volume_snapshot_list(IsA(http.HttpRequest)) \
@@ -198,3 +221,131 @@ class QuotaTests(test.APITestCase):
 
         # Compare internal structure of usages to expected.
         self.assertEqual(quota_usages.usages, expected_output)
+
+    def _stub_limits_usages(self):
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'volume').AndReturn(True)
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'network').AndReturn(False)
+        api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
+            .AndReturn(self.quotas.first())
+        cinder.tenant_quota_get(IsA(http.HttpRequest), '1') \
+            .AndReturn(self.cinder_quotas.first())
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.floating_ips.list())
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+            .AndReturn({'maxTotalCores': 10,
+                        'totalInstancesUsed': 2,
+                        'totalCoresUsed': 2,
+                        'totalRAMUsed': 1024})
+        cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
+            .AndReturn({'totalVolumesUsed': 3,
+                        'totalGigabytesUsed': 80,
+                        'totalSnapshotsUsed': 3})
+
+    @test.create_stubs({api.nova: ('tenant_quota_get',
+                                   'tenant_absolute_limits',),
+                        api.network: ('tenant_floating_ip_list',),
+                        api.base: ('is_service_enabled',),
+                        cinder: ('tenant_quota_get',
+                                 'tenant_absolute_limits',)})
+    def test_tenant_quota_usages_from_absolute_limits(self):
+        # No servers, flavors, volumes or snapshots are listed when the
+        # services report how much of each quota is used.
+        self._stub_limits_usages()
+        self.mox.ReplayAll()
+
+        quota_usages = quotas.tenant_quota_usages(self.request)
+
+        self.assertEqual(quota_usages.usages, self.get_usages())
+
+    @test.create_stubs({api.nova: ('flavor_list',
+                                   'flavor_get',
+                                   'server_list',
+                                   'tenant_quota_get',
+                                   'tenant_absolute_limits',),
+                        api.network: ('tenant_floating_ip_list',),
+                        api.base: ('is_service_enabled',)})
+    def test_tenant_quota_usages_missing_flavors(self):
+        flavor = self.flavors.first()
+        servers = [s for s in self.servers.list()
+                   if s.tenant_id == self.request.user.tenant_id]
+
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'volume').AndReturn(False)
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'network').AndReturn(False)
+        api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
+            .AndReturn(self.quotas.first())
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.floating_ips.list())
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
+            .AndRaise(self.exceptions.nova)
+        api.nova.flavor_list(IsA(http.HttpRequest)).AndReturn([])
+        api.nova.server_list(IsA(http.HttpRequest)) \
+            .AndReturn([servers, False])
+        # The servers share one (deleted) flavor, fetched a single time.
+        api.nova.flavor_get(IsA(http.HttpRequest), flavor.id) \
+            .AndReturn(flavor)
+        self.mox.ReplayAll()
+
+        quota_usages = quotas.tenant_quota_usages(self.request)
+
+        self.assertEqual(quota_usages.usages,
+                         self.get_usages(with_volume=False))
+
+    @test.create_stubs({api.nova: ('tenant_quota_get',
+                                   'tenant_absolute_limits',),
+                        api.network: ('tenant_floating_ip_list',),
+                        api.base: ('is_service_enabled',),
+                        cinder: ('tenant_quota_get',
+                                 'tenant_absolute_limits',)})
+    def test_tenant_quota_usages_cached(self):
+        self._stub_limits_usages()
+        self.mox.ReplayAll()
+
+        quotas.tenant_quota_usages(self.request)
+        quota_usages = quotas.tenant_quota_usages(self._new_request())
+
+        self.assertEqual(quota_usages.usages, self.get_usages())
+
+    @test.create_stubs({api.nova: ('tenant_quota_get',
+                                   'tenant_absolute_limits',),
+                        api.network: ('tenant_floating_ip_list',),
+                        api.base: ('is_service_enabled',),
+                        cinder: ('tenant_quota_get',
+                                 'tenant_absolute_limits',)})
+    def test_tally_cached_usages(self):
+        self._stub_limits_usages()
+        self.mox.ReplayAll()
+
+        quotas.tenant_quota_usages(self.request)
+        quotas.tally_cached_usages(self.request, volumes=-1, gigabytes=-30,
+                                   unknown=1)
+        quota_usages = quotas.tenant_quota_usages(self._new_request())
+
+        expected_output = self.get_usages()
+        expected_output.update({
+            'volumes': {'available': 0, 'used': 2, 'quota': 1},
+            'gigabytes': {'available': 950, 'used': 50, 'quota': 1000}})
+        self.assertEqual(quota_usages.usages, expected_output)
+
+    @test.create_stubs({api.nova: ('tenant_quota_get',
+                                   'tenant_absolute_limits',),
+                        api.network: ('tenant_floating_ip_list',),
+                        api.base: ('is_service_enabled',),
+                        cinder: ('tenant_quota_get',
+                                 'tenant_absolute_limits',)})
+    def test_invalidate_cached_usages(self):
+        self._stub_limits_usages()
+        self._stub_limits_usages()
+        self.mox.ReplayAll()
+
+        quotas.tenant_quota_usages(self.request)
+        quotas.invalidate_cached_usages(self.request)
+        quotas.tenant_quota_usages(self._new_request())
+
+    def test_tally_cached_usages_not_cached(self):
+        quotas.tally_cached_usages(self.request, volumes=1)
+        self.assertIsNone(api.base.shared_cache().get(
+            quotas._usages_cache_key(self.request)))
@@ -17,6 +17,9 @@
 
 from django import template
 from django.template import loader
+
+from horizon import loaders
+
 from openstack_dashboard.test import helpers as test
 
 
@@ -96,3 +99,9 @@ class TemplateRenderTest(test.TestCase):
             template.Context(context))
 
         self.assertTrue("OS_REGION_NAME=\"\"" in out)
+
+    def test_all_templates_compile(self):
+        compiled, failed = loaders.precompile_templates()
+        self.assertEqual({}, failed)
+        self.assertIn('router/nexus1000v/_update_network_profile.html',
+                      compiled)
@@ -11,12 +11,15 @@
 # under the License.
 
 from collections import defaultdict
+import hashlib
 import itertools
 import logging
 
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils import concurrency
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
@@ -59,6 +62,20 @@ NEUTRON_QUOTA_FIELDS = ("network",
 
 QUOTA_FIELDS = NOVA_QUOTA_FIELDS + CINDER_QUOTA_FIELDS + NEUTRON_QUOTA_FIELDS
 
+# The "Used" counters of the Nova and Cinder absolute limits which can stand
+# in for counting the project's resources, keyed by quota name.
+NOVA_USAGE_COUNTERS = {"instances": "totalInstancesUsed",
+                       "cores": "totalCoresUsed",
+                       "ram": "totalRAMUsed"}
+
+CINDER_USAGE_COUNTERS = {"volumes": "totalVolumesUsed",
+                         "gigabytes": "totalGigabytesUsed",
+                         "snapshots": "totalSnapshotsUsed"}
+
+# Default number of seconds a project's usages are cached for; see
+# API_CACHE_TIMEOUTS.
+QUOTA_USAGES_CACHE_TIMEOUT = 30
+
 
 class QuotaUsage(dict):
     """Tracks quota limit, used, and available for a given set of quotas."""
@@ -83,6 +100,17 @@ class QuotaUsage(dict):
     def get(self, key, default=None):
         return self.usages.get(key, default)
 
+    def to_dict(self):
+        """Returns the tracked usages as a plain, picklable dictionary."""
+        return dict(self.usages)
+
+    @classmethod
+    def from_dict(cls, usages):
+        """Rebuilds a QuotaUsage from the output of :meth:`to_dict`."""
+        quota_usage = cls()
+        quota_usage.usages.update(usages)
+        return quota_usage
+
     def add_quota(self, quota):
         """Adds an internal tracking reference for the given quota."""
         if quota.limit is None or quota.limit == -1:
@@ -190,57 +218,201 @@ def get_disabled_quotas(request):
     return disabled_quotas
 
 
-@memoized
-def tenant_quota_usages(request):
-    # Get our quotas and construct our usage object.
-    disabled_quotas = get_disabled_quotas(request)
+def _result_or_none(future):
+    try:
+        return future.result()
+    except Exception:
+        LOG.debug("Unable to retrieve absolute limits, usages will be "
+                  "counted instead.", exc_info=True)
+        return None
+
+
+def _counters(limits, counters):
+    """Returns the usage counters available in ``limits``, by quota name."""
+    if not limits:
+        return {}
+    return dict((name, limits[counter])
+                for name, counter in counters.items()
+                if counter in limits)
+
+
+def _count_compute_usages(request):
+    with concurrency.Executor() as executor:
+        flavors = executor.submit(nova.flavor_list, request)
+        instances = executor.submit(nova.server_list, request)
+    flavors = dict([(f.id, f) for f in flavors.result()])
+    instances, has_more = instances.result()
+
+    # Fetch deleted flavors if necessary, all at once.
+    missing_flavors = set(instance.flavor['id'] for instance in instances
+                          if instance.flavor['id'] not in flavors)
+    with concurrency.Executor() as executor:
+        futures = [(missing, executor.submit(nova.flavor_get, request,
+                                             missing))
+                   for missing in missing_flavors]
+    for missing, future in futures:
+        try:
+            flavors[missing] = future.result()
+        except Exception:
+            flavors[missing] = {}
+            exceptions.handle(request, ignore=True)
+
+    # Sum our usage based on the flavors of the instances.
+    cores = ram = 0
+    for flavor in [flavors[instance.flavor['id']] for instance in instances]:
+        cores += getattr(flavor, 'vcpus', None) or 0
+        ram += getattr(flavor, 'ram', None) or 0
+    return {'instances': len(instances), 'cores': cores, 'ram': ram}
+
+
+def _count_volume_usages(request, names):
+    counted = {}
+    with concurrency.Executor() as executor:
+        if 'volumes' in names or 'gigabytes' in names:
+            volumes = executor.submit(cinder.volume_list, request)
+        if 'snapshots' in names:
+            snapshots = executor.submit(cinder.volume_snapshot_list, request)
+    if 'volumes' in names or 'gigabytes' in names:
+        volumes = volumes.result()
+        counted['gigabytes'] = sum([int(v.size) for v in volumes])
+        counted['volumes'] = len(volumes)
+    if 'snapshots' in names:
+        counted['snapshots'] = len(snapshots.result())
+    return dict((name, counted[name]) for name in names)
+
+
+def _get_tenant_quota_usages(request, disabled_quotas):
+    with_volumes = 'volumes' not in disabled_quotas
+
+    # The quotas, the absolute limits and the floating IPs are independent
+    # of one another.
+    with concurrency.Executor() as executor:
+        quota_data = executor.submit(get_tenant_quota_data, request,
+                                     disabled_quotas=disabled_quotas)
+        floating_ips = executor.submit(network.tenant_floating_ip_list,
+                                       request)
+        nova_limits = executor.submit(nova.tenant_absolute_limits, request)
+        if with_volumes:
+            cinder_limits = executor.submit(cinder.tenant_absolute_limits,
+                                            request)
 
+    # Get our quotas and construct our usage object.
     usages = QuotaUsage()
-    for quota in get_tenant_quota_data(request,
-                                       disabled_quotas=disabled_quotas):
+    for quota in quota_data.result():
         usages.add_quota(quota)
 
-    # Get our usages.
+    # Get our usages, preferring the counters kept by the services over
+    # listing and counting the resources ourselves.
     try:
-        floating_ips = network.tenant_floating_ip_list(request)
+        floating_ips = floating_ips.result()
     except neutronclient.NeutronClientException:
         floating_ips = []
-    flavors = dict([(f.id, f) for f in nova.flavor_list(request)])
-    instances, has_more = nova.server_list(request)
-    # Fetch deleted flavors if necessary.
-    missing_flavors = [instance.flavor['id'] for instance in instances
-                       if instance.flavor['id'] not in flavors]
-    for missing in missing_flavors:
-        if missing not in flavors:
-            try:
-                flavors[missing] = nova.flavor_get(request, missing)
-            except Exception:
-                flavors[missing] = {}
-                exceptions.handle(request, ignore=True)
-
-    usages.tally('instances', len(instances))
     usages.tally('floating_ips', len(floating_ips))
 
-    if 'volumes' not in disabled_quotas:
-        volumes = cinder.volume_list(request)
-        snapshots = cinder.volume_snapshot_list(request)
-        usages.tally('gigabytes', sum([int(v.size) for v in volumes]))
-        usages.tally('volumes', len(volumes))
-        usages.tally('snapshots', len(snapshots))
+    compute = _counters(_result_or_none(nova_limits), NOVA_USAGE_COUNTERS)
+    if len(compute) < len(NOVA_USAGE_COUNTERS):
+        compute = _count_compute_usages(request)
+    for name, value in compute.items():
+        usages.tally(name, value)
+
+    if with_volumes:
+        volume = _counters(_result_or_none(cinder_limits),
+                           CINDER_USAGE_COUNTERS)
+        missing = [name for name in CINDER_USAGE_COUNTERS
+                   if name not in volume]
+        if missing:
+            volume.update(_count_volume_usages(request, missing))
+        for name, value in volume.items():
+            usages.tally(name, value)
 
-    # Sum our usage based on the flavors of the instances.
-    for flavor in [flavors[instance.flavor['id']] for instance in instances]:
-        usages.tally('cores', getattr(flavor, 'vcpus', None))
-        usages.tally('ram', getattr(flavor, 'ram', None))
+    return usages
+
+
+def _usages_cache_timeout():
+    timeouts = getattr(settings, 'API_CACHE_TIMEOUTS', {})
+    return timeouts.get('quotas.tenant_quota_usages',
+                        QUOTA_USAGES_CACHE_TIMEOUT)
 
-    # Initialise the tally if no instances have been launched yet
-    if len(instances) == 0:
-        usages.tally('cores', 0)
-        usages.tally('ram', 0)
 
+def _usages_cache_key(request, tenant_id=None):
+    try:
+        endpoint = base.url_for(request, 'compute')
+    except exceptions.ServiceCatalogException:
+        endpoint = None
+    tenant_id = tenant_id or request.user.tenant_id
+    return "horizon:quota_usages:%s" % hashlib.md5(
+        repr((endpoint, tenant_id))).hexdigest()
+
+
+@memoized
+def tenant_quota_usages(request):
+    """Returns the :class:`QuotaUsage` of the current project.
+
+    The usages are kept in the API cache (see ``API_CACHE_BACKEND``) for
+    a few seconds so that the modals and pages showing them do not all
+    recount the project's resources. Code creating resources through the
+    dashboard should call :func:`tally_cached_usages` and code deleting
+    them :func:`invalidate_cached_usages`.
+    """
+    timeout = _usages_cache_timeout()
+    if timeout:
+        cached = base.shared_cache().get(_usages_cache_key(request))
+        if cached is not None:
+            return QuotaUsage.from_dict(cached)
+
+    usages = _get_tenant_quota_usages(request, get_disabled_quotas(request))
+
+    if timeout:
+        base.shared_cache().set(_usages_cache_key(request),
+                                usages.to_dict(), timeout)
     return usages
 
 
+def tally_cached_usages(request, **deltas):
+    """Adds ``deltas`` to the cached usages of the current project.
+
+    For example ``tally_cached_usages(request, volumes=1, gigabytes=10)``
+    once a volume has been created. Nothing happens if the usages are not
+    currently cached.
+    """
+    timeout = _usages_cache_timeout()
+    if not timeout:
+        return
+    cache = base.shared_cache()
+    key = _usages_cache_key(request)
+    cached = cache.get(key)
+    if cached is None:
+        return
+    usages = QuotaUsage.from_dict(cached)
+    for name, value in deltas.items():
+        if 'quota' in usages.get(name, {}):
+            usages.tally(name, value)
+    cache.set(key, usages.to_dict(), timeout)
+
+
+def tally_cached_instances(request, flavor_id, count=1):
+    """Adds ``count`` instances of the given flavor to the cached usages."""
+    if not _usages_cache_timeout() or \
+            base.shared_cache().get(_usages_cache_key(request)) is None:
+        return
+    flavors = [f for f in nova.flavor_list(request) if f.id == flavor_id]
+    if not flavors:
+        # A private or deleted flavor; let the usages be counted again.
+        invalidate_cached_usages(request)
+        return
+    tally_cached_usages(request,
+                        instances=count,
+                        cores=flavors[0].vcpus * count,
+                        ram=flavors[0].ram * count)
+
+
+def invalidate_cached_usages(request, tenant_id=None):
+    """Drops the cached usages of ``tenant_id`` (the current project by
+    default), e.g. after a resource was deleted or its quotas changed.
+    """
+    base.shared_cache().delete(_usages_cache_key(request, tenant_id))
+
+
 def tenant_limit_usages(request):
     #TODO(licostan): This method shall be removed from Quota module.
     #ProjectUsage/BaseUsage maybe used instead on volume/image dashboards.